@@ -1,11 +1,16 @@
-from colorama import Fore, Style, init
+import os
+import sys
 
 
-# Initialize colorama
-init(autoreset=True)
+# ANSI sequences matching colorama's Fore/Style constants, inlined so the
+# banner text is built once at import without importing colorama
+_CYAN = '\x1b[36m'
+_GREEN = '\x1b[32m'
+_YELLOW = '\x1b[33m'
+_BRIGHT = '\x1b[1m'
+_RESET_ALL = '\x1b[0m'
 
-def print_banner():
-    banner = f"""{Fore.CYAN}{Style.BRIGHT}
+_BANNER = f"""{_CYAN}{_BRIGHT}
     ██████╗  █████╗  ██████╗██╗  ██╗██╗   ██╗██████╗                  
     ██╔══██╗██╔══██╗██╔════╝██║ ██╔╝██║   ██║██╔══██╗                 
     ██████╔╝███████║██║     █████╔╝ ██║   ██║██████╔╝                 
@@ -19,9 +24,9 @@ def print_banner():
             ██╔══██║██╔══██║██║╚██╗██║██║  ██║██║     ██╔══╝  ██╔══██╗
             ██║  ██║██║  ██║██║ ╚████║██████╔╝███████╗███████╗██║  ██║
             ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝╚═════╝ ╚══════╝╚══════╝╚═╝  ╚═╝
-    {Style.RESET_ALL}"""
-    
-    creator_info = f"""{Fore.GREEN}{Style.BRIGHT}
+    {_RESET_ALL}"""
+
+_CREATOR_INFO = f"""{_GREEN}{_BRIGHT}
     ┌────────────────────────────────────────────────────────────────┐
     │                  Created with ❤️ by SP1R4-R                     │
     │              Backup Handler - Your Data, Secured               │
@@ -32,17 +37,41 @@ def print_banner():
     │  along with scheduling capabilities and Telegram notifications.│
     │  Secure your data with ease using Backup Handler!              │
     └────────────────────────────────────────────────────────────────┘
-    {Style.RESET_ALL}"""
-    
-    social_links = f"""{Fore.YELLOW}{Style.BRIGHT}
+    {_RESET_ALL}"""
+
+_SOCIAL_LINKS = f"""{_YELLOW}{_BRIGHT}
     ┌───────────────────────────────────────────────────────────────┐
     │                        Social Links                           │
     ├───────────────────────────────────────────────────────────────┤
     │  GitHub: https://github.com/SP1R4                             │
     │  X (Twitter): https://twitter.com/_SP1R4                      │
     └───────────────────────────────────────────────────────────────┘
-    {Style.RESET_ALL}"""
-    
-    print(banner)
-    print(creator_info)
-    print(social_links)
+    {_RESET_ALL}"""
+
+_FULL_BANNER = f"{_BANNER}\n{_CREATOR_INFO}\n{_SOCIAL_LINKS}\n"
+_FULL_BANNER_BYTES = _FULL_BANNER.encode('utf-8')
+
+_colorama_ready = False
+
+
+def print_banner():
+    global _colorama_ready
+    # Only interactive terminals get the banner: under cron/systemd it would
+    # just add noise to captured logs. BACKUP_HANDLER_NO_BANNER=1 turns it off.
+    if os.environ.get('BACKUP_HANDLER_NO_BANNER') or not sys.stdout.isatty():
+        return
+    if sys.platform == 'win32' and not _colorama_ready:
+        # Only Windows consoles need colorama to translate the ANSI sequences;
+        # elsewhere it would just wrap stdout. Deferred so importing this module stays cheap.
+        from colorama import just_fix_windows_console
+        just_fix_windows_console()
+        _colorama_ready = True
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None or sys.stdout is not sys.__stdout__:
+        # Replaced stream (e.g. by a test harness): keep it in the text path
+        sys.stdout.write(_FULL_BANNER)
+        return
+    # Pre-encoded, so the whole banner goes out in one write
+    sys.stdout.flush()
+    buffer.write(_FULL_BANNER_BYTES)
+    buffer.flush()
@@ -1,63 +1,269 @@
+import io
 import os
+import atexit
 import json
 import time
+import hmac
+import itertools
+import weakref
 import telebot
+import requests
 import configparser
+from requests.adapters import HTTPAdapter
 from pathlib import Path as _Path
-from threading import Thread, Event
+from threading import Thread, Event, Lock, Timer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor, wait
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 CONFIG_FILE = str(_Path(__file__).parent.parent / 'config' / 'bot_config.ini')
 _RUNTIME_USERS_FILE = str(_Path(__file__).parent.parent / 'config' / '.bot_users.json')
 
+# Sends are network-bound, so a small pool overlaps the HTTPS round-trips.
+_SEND_WORKERS = 8
+
+# Telegram allows about 30 broadcast messages per second; going over earns 429s.
+# Broadcasts are sent in batches of this size, one batch per pacing window.
+_BROADCAST_BATCH = 30
+_BROADCAST_WINDOW = 1.05  # seconds
+
+# Read buffer for documents uploaded straight from disk.
+_UPLOAD_BUFFER = 1 << 20  # 1 MiB
+
+# Usernames are only used for log lines, so an hour-stale value is fine.
+_USERNAME_TTL = 3600  # seconds
+
+# Registrations arrive in bursts; coalesce them into one users-file write.
+_SAVE_DEBOUNCE = 2.0  # seconds
+
+# Webhook listen addresses reachable only from this host; any other address
+# requires webhook_secret, since Telegram's secret token is the only authentication.
+_LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+# Parsed bot configs keyed by (path, mtime_ns); an edited file gets a new key.
+_CONFIG_CACHE = {}
+
+
+def _load_config(path):
+    """
+    Returns the parsed config at path, re-parsing only when the file's mtime changes.
+    The returned parser is shared between instances and must not be modified.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file '{path}' not found.") from None
+    key = (path, mtime_ns)
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        config = configparser.ConfigParser()
+        config.read(path)
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[key] = config
+    return config
+
+
+# TeleBot clients keyed by api_token, so every TelegramBot using a token shares
+# one client and its pooled HTTPS connections.
+_BOT_INSTANCES = {}
+
+
+def _keep_alive_session():
+    """
+    Installs one requests session, pooled for the send workers, as telebot's session.
+    telebot otherwise opens a session per thread, so every send worker pays its own
+    TCP+TLS handshake to api.telegram.org. A session set by the caller is kept.
+    """
+    if telebot.apihelper.session is None:
+        session = requests.Session()
+        # Send workers plus the polling and webhook threads
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_SEND_WORKERS + 2)
+        session.mount('https://', adapter)
+        telebot.apihelper.session = session
+    # A TTL reset would hand back the same shared session, so skip the per-call age check
+    telebot.apihelper.SESSION_TIME_TO_LIVE = None
+
+
+def _get_telebot(api_token):
+    """
+    Returns the shared TeleBot client for api_token, creating it on first use.
+    """
+    bot = _BOT_INSTANCES.get(api_token)
+    if bot is None:
+        _keep_alive_session()
+        bot = _BOT_INSTANCES.setdefault(api_token, telebot.TeleBot(api_token))
+    return bot
+
+
+# Contents of the last file broadcast, keyed by (path, mtime_ns, size), so a
+# repeated broadcast of an unchanged file is not read from disk again.
+_FILE_CACHE = {}
+
+
+def _file_key(path):
+    """
+    Returns a (path, mtime_ns, size) key that changes whenever the file does.
+    """
+    st = os.stat(path)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _read_file(path, key):
+    """
+    Returns the bytes of the file at path, reusing the last read if key is unchanged.
+    """
+    data = _FILE_CACHE.get(key)
+    if data is None:
+        data = _Path(path).read_bytes()
+        _FILE_CACHE.clear()
+        _FILE_CACHE[key] = data
+    return data
+
+
+def _loads(raw):
+    """
+    Decodes JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj):
+    """
+    Encodes obj as compact JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _error_kind(e):
+    """
+    Returns a short label for a send error, for log messages.
+    """
+    if isinstance(e, telebot.apihelper.ApiTelegramException):
+        return 'Telegram API error'
+    if isinstance(e, telebot.apihelper.ApiException):
+        return 'API error'
+    return 'Unexpected error'
+
+
+# Bots whose pending user registrations are written out at exit. Held weakly,
+# so the single exit hook never keeps a discarded instance alive.
+_LIVE_BOTS = weakref.WeakSet()
+
+
+def _flush_live_bots():
+    """
+    Writes out unsaved user registrations of every live bot.
+    """
+    for bot in list(_LIVE_BOTS):
+        bot._flush_interacted_users()
+
+
+atexit.register(_flush_live_bots)
+
+
 class TelegramBot:
     def __init__(self, logger):
         """
         Initializes the TelegramBot instance with the given API token.
         Loads config once and reuses parsed values.
         """
-        config = configparser.ConfigParser()
-        if os.path.exists(CONFIG_FILE):
-            config.read(CONFIG_FILE)
-        else:
-            raise FileNotFoundError(f"Configuration file '{CONFIG_FILE}' not found.")
+        config = _load_config(CONFIG_FILE)
         self.api_token = config['TELEGRAM']['api_token']
         self._config_user_ids = config['USERS']['interacted_users']
-        self.bot = telebot.TeleBot(self.api_token)
-        self.interacted_users = []
-        self.polling_thread = None
+        self.mode = config['TELEGRAM'].get('mode', 'polling').strip().lower()
+        self.webhook_url = config['TELEGRAM'].get('webhook_url', '').strip()
+        self.webhook_listen = config['TELEGRAM'].get('webhook_listen', '0.0.0.0').strip()
+        self.webhook_port = config['TELEGRAM'].getint('webhook_port', 8443)
+        self.webhook_path = config['TELEGRAM'].get('webhook_path', '/telegram').strip() or '/telegram'
+        self.webhook_secret = config['TELEGRAM'].get('webhook_secret', '').strip() or None
+        if self.mode not in ('polling', 'webhook'):
+            raise ValueError(f"Invalid [TELEGRAM] mode '{self.mode}': must be 'polling' or 'webhook'")
+        if self.mode == 'webhook' and not self.webhook_url:
+            raise ValueError("[TELEGRAM] webhook_url is required when mode = webhook")
+        self.bot = _get_telebot(self.api_token)
+        self.interacted_users = set()
+        self._users_lock = Lock()
+        self._polling_future = None
+        self._webhook_server = None
+        self._username_cache = {}
+        self._username_lock = Lock()
+        self._file_ids = {}
+        self._save_lock = Lock()
+        self._save_timer = None
+        self._dirty = False
+        _LIVE_BOTS.add(self)
         self.stop_event = Event()
+        # One worker runs the polling loop, the other the window's stop watchdog
+        self._polling_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='tg-poll')
         self.logger = logger
+        self._executor = ThreadPoolExecutor(max_workers=_SEND_WORKERS, thread_name_prefix='tg-send')
         self.load_interacted_users()
         self.setup_handlers()
 
     def setup_handlers(self):
         """
         Sets up message handlers for the bot to respond to incoming messages.
+        The TeleBot client is shared per token, so the handler of an earlier
+        TelegramBot is replaced and updates reach this instance's user set.
+        Handlers registered on the client by other code are kept.
+        """
+        self._remove_handlers(lambda owner: isinstance(owner, TelegramBot))
+        self.bot.register_message_handler(self._handle_message, func=lambda message: True)
+
+    def _remove_handlers(self, is_owner):
+        """
+        Drops the message handlers whose bound instance satisfies is_owner.
+        """
+        self.bot.message_handlers[:] = [
+            handler for handler in self.bot.message_handlers
+            if not is_owner(getattr(handler['function'], '__self__', None))
+        ]
+
+    def _handle_message(self, message):
+        """
+        Registers the sender of any incoming message for notifications.
+        """
+        user_id = message.chat.id
+        self._cache_username(user_id, message.chat.username)
+        with self._users_lock:
+            is_new = user_id not in self.interacted_users
+            if is_new:
+                self.interacted_users.add(user_id)
+        if is_new:
+            self.save_interacted_users()
+            self.bot.send_message(user_id, "You're now registered for notifications!")
+
+    def _cache_username(self, user_id, username):
         """
-        @self.bot.message_handler(func=lambda message: True)
-        def handle_any_message(message):
-            user_id = message.chat.id
-            if user_id not in self.interacted_users:
-                self.interacted_users.append(user_id)
-                self.save_interacted_users()
-                self.bot.send_message(user_id, "You're now registered for notifications!")
+        Stores a username so later lookups skip the get_chat round-trip.
+        """
+        with self._username_lock:
+            self._username_cache[user_id] = (username or None, time.monotonic())
 
     def get_username(self, user_id):
         """
         Retrieves the username of a user given their user ID.
+        Results are cached for _USERNAME_TTL seconds; failed lookups are not cached.
         """
+        with self._username_lock:
+            cached = self._username_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[1] < _USERNAME_TTL:
+            return cached[0]
         try:
             chat = self.bot.get_chat(user_id)
+            self._cache_username(user_id, chat.username)
             return chat.username if chat.username else None
-        except telebot.apihelper.ApiTelegramException as e:
-            self.logger.error(f"Telegram API error occurred while retrieving username for user ID {user_id}: {e}")
-            return None
-        except telebot.apihelper.ApiException as e:
-            self.logger.error(f"API error occurred while retrieving username for user ID {user_id}: {e}")
-            return None
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred while retrieving username for user ID {user_id}: {e}")
+            self.logger.error(f"{_error_kind(e)} occurred while retrieving username for user ID {user_id}: {e}")
             return None
 
     def load_interacted_users(self):
@@ -68,72 +274,173 @@ class TelegramBot:
         # Try runtime file first
         if os.path.exists(_RUNTIME_USERS_FILE):
             try:
-                with open(_RUNTIME_USERS_FILE, 'r') as f:
-                    data = json.load(f)
-                self.interacted_users = data.get('user_ids', [])
+                data = _loads(_Path(_RUNTIME_USERS_FILE).read_bytes())
+                self.interacted_users = set(data.get('user_ids', []))
                 return
             except (json.JSONDecodeError, OSError) as e:
                 self.logger.warning(f"Failed to read runtime users file: {e}")
 
         # Fall back to config values
         if self._config_user_ids:
-            self.interacted_users = [int(uid) for uid in self._config_user_ids.split(',') if uid.strip()]
+            self.interacted_users = {int(uid) for uid in self._config_user_ids.split(',') if uid.strip()}
         else:
-            self.interacted_users = []
+            self.interacted_users = set()
 
     def save_interacted_users(self):
         """
-        Saves interacted users to a separate runtime JSON file.
+        Schedules a save of interacted users to the separate runtime JSON file.
+        Saves within _SAVE_DEBOUNCE seconds of each other are written once.
         Does not modify bot_config.ini.
         """
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = Timer(_SAVE_DEBOUNCE, self._flush_interacted_users)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def _flush_interacted_users(self):
+        """
+        Writes interacted users to the runtime JSON file if there are unsaved changes.
+        Writes to a temp file and renames it so a crash never leaves a truncated file.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            with self._users_lock:
+                user_ids = sorted(self.interacted_users)
+        tmp_path = f"{_RUNTIME_USERS_FILE}.tmp"
         try:
-            with open(_RUNTIME_USERS_FILE, 'w') as f:
-                json.dump({'user_ids': self.interacted_users}, f)
+            _Path(tmp_path).write_bytes(_dumps({'user_ids': user_ids}))
+            os.replace(tmp_path, _RUNTIME_USERS_FILE)
         except OSError as e:
             self.logger.error(f"Failed to save runtime users file: {e}")
 
+    def _recipients(self):
+        """
+        Returns a snapshot of the interacted users, safe to iterate while the
+        message handler registers new users.
+        """
+        with self._users_lock:
+            return tuple(self.interacted_users)
+
+    def _fan_out(self, send_one, *args, recipients=None):
+        """
+        Runs send_one(user_id, *args) for every interacted user (or the given
+        recipients) on the send pool.
+        Users are sent to in batches of _BROADCAST_BATCH, at most one batch per
+        _BROADCAST_WINDOW, to stay under Telegram's broadcast rate limit.
+        Returns the number of users the send failed for.
+        """
+        recipients = iter(self._recipients() if recipients is None else recipients)
+        failed = 0
+        next_batch_at = 0.0
+        while True:
+            batch = list(itertools.islice(recipients, _BROADCAST_BATCH))
+            if not batch:
+                return failed
+            delay = next_batch_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            next_batch_at = time.monotonic() + _BROADCAST_WINDOW
+            futures = [self._executor.submit(send_one, user_id, *args) for user_id in batch]
+            wait(futures)
+            failed += sum(1 for future in futures if not future.result())
+
+    def _broadcast_file(self, send_one, media, name, caption, get_file_id, cache_key=None):
+        """
+        Sends a file to all interacted users, uploading it only once.
+        media is the file's bytes or path, or an already known Telegram file_id. The
+        first successful upload yields a file_id that the remaining users are sent instead.
+        With a cache_key the file_id is remembered for later broadcasts of the same file.
+        """
+        recipients = self._recipients()
+        sent = 0
+        while not isinstance(media, str) and sent < len(recipients):
+            message = send_one(recipients[sent], media, name, caption)
+            sent += 1
+            file_id = get_file_id(message) if message else None
+            if file_id:
+                media = file_id
+                if cache_key is not None:
+                    self._file_ids[cache_key] = file_id
+        if sent < len(recipients):
+            self._fan_out(send_one, media, name, caption, recipients=recipients[sent:])
+
+    def _send_one(self, user_id, text):
+        """
+        Sends a text message to a single user. Returns True on success.
+        """
+        try:
+            self.bot.send_message(user_id, text)
+            self.logger.info(f"Notification sent to {self.get_username(user_id)}: {text}")
+            return True
+        except Exception as e:
+            self.logger.error(f"{_error_kind(e)} sending to user {user_id}: {e}")
+        return False
+
     def send_notification(self, text):
         """
         Sends a notification to all interacted users.
         Continues sending to remaining users even if one fails.
         """
-        if not self.interacted_users:
+        recipients = self._recipients()
+        if not recipients:
             return
-        failed_count = 0
-        for user_id in self.interacted_users:
-            try:
-                self.bot.send_message(user_id, text)
-                self.logger.info(f"Notification sent to {self.get_username(user_id)}: {text}")
-            except telebot.apihelper.ApiTelegramException as e:
-                self.logger.error(f"Telegram API error sending to user {user_id}: {e}")
-                failed_count += 1
-            except telebot.apihelper.ApiException as e:
-                self.logger.error(f"API error sending to user {user_id}: {e}")
-                failed_count += 1
-            except Exception as e:
-                self.logger.error(f"Failed to send notification to user {user_id}: {e}")
-                failed_count += 1
-        if failed_count == len(self.interacted_users):
+        failed_count = self._fan_out(self._send_one, text, recipients=recipients)
+        if failed_count == len(recipients):
             self.logger.error("Failed to send notification to all users. Try to interact with the bot first.")
             self.start_polling_for_limited_time(timeout=5)
 
+    def _send_image_one(self, user_id, media, name, caption):
+        """
+        Sends an image (bytes or a Telegram file_id) to a single user.
+        Returns the sent message, or None on failure.
+        """
+        try:
+            if isinstance(media, bytes):
+                media = io.BytesIO(media)
+                media.name = name
+            message = self.bot.send_photo(user_id, photo=media, caption=caption)
+            self.logger.info(f"Image sent to {self.get_username(user_id)}")
+            return message
+        except Exception as e:
+            self.logger.error(f"{_error_kind(e)} sending image to user {user_id}: {e}")
+        return None
+
     def send_image(self, file_path, caption=None):
         """
         Sends an image to all interacted users.
+        The file is uploaded once; other users get the resulting file_id.
         """
         if not self.interacted_users:
             return
-        for user_id in self.interacted_users:
-            try:
-                with open(file_path, 'rb') as f:
-                    self.bot.send_photo(user_id, photo=f, caption=caption)
-                self.logger.info(f"Image sent to {self.get_username(user_id)}")
-            except telebot.apihelper.ApiTelegramException as e:
-                self.logger.error(f"Telegram API error sending image to user {user_id}: {e}")
-            except telebot.apihelper.ApiException as e:
-                self.logger.error(f"API error sending image to user {user_id}: {e}")
-            except Exception as e:
-                self.logger.error(f"Failed to send image to user {user_id}: {e}")
+        try:
+            key = _file_key(file_path)
+            media = self._file_ids.get(('photo', key)) or _read_file(file_path, key)
+        except OSError as e:
+            self.logger.error(f"Failed to read image {file_path}: {e}")
+            return
+        self._broadcast_file(
+            self._send_image_one, media, os.path.basename(file_path), caption,
+            lambda message: message.photo[-1].file_id if message.photo else None, cache_key=('photo', key),
+        )
+
+    def _send_geolocation_one(self, user_id, latitude, longitude, live_period):
+        """
+        Sends a geolocation to a single user. Returns True on success.
+        """
+        try:
+            self.bot.send_location(user_id, latitude=latitude, longitude=longitude, live_period=live_period)
+            self.logger.info(f"Geolocation sent to user ID {user_id}: Latitude {latitude}, Longitude {longitude}")
+            return True
+        except Exception as e:
+            self.logger.error(f"{_error_kind(e)} sending geolocation to user {user_id}: {e}")
+        return False
 
     def send_geolocation(self, latitude, longitude, live_period=60):
         """
@@ -141,66 +448,96 @@ class TelegramBot:
         """
         if not self.interacted_users:
             return
-        for user_id in self.interacted_users:
-            try:
-                self.bot.send_location(user_id, latitude=latitude, longitude=longitude, live_period=live_period)
-                self.logger.info(f"Geolocation sent to user ID {user_id}: Latitude {latitude}, Longitude {longitude}")
-            except telebot.apihelper.ApiTelegramException as e:
-                self.logger.error(f"Telegram API error sending geolocation to user {user_id}: {e}")
-            except telebot.apihelper.ApiException as e:
-                self.logger.error(f"API error sending geolocation to user {user_id}: {e}")
-            except Exception as e:
-                self.logger.error(f"Failed to send geolocation to user {user_id}: {e}")
+        self._fan_out(self._send_geolocation_one, latitude, longitude, live_period)
+
+    def _send_document_one(self, user_id, media, name, caption):
+        """
+        Sends a document (bytes, a path or a Telegram file_id) to a single user.
+        A path is opened for this upload only, so the file is never held in memory here.
+        Returns the sent message, or None on failure.
+        """
+        try:
+            if isinstance(media, _Path):
+                with open(media, 'rb', buffering=_UPLOAD_BUFFER) as f:
+                    message = self.bot.send_document(user_id, document=f, caption=caption)
+            else:
+                if isinstance(media, bytes):
+                    media = io.BytesIO(media)
+                    if name:
+                        media.name = name
+                message = self.bot.send_document(user_id, document=media, caption=caption)
+            self.logger.info(f"Document sent to {self.get_username(user_id)}")
+            return message
+        except Exception as e:
+            self.logger.error(f"{_error_kind(e)} sending document to user {user_id}: {e}")
+        return None
 
     def send_document(self, file_path=None, caption=None, document=None):
         """
         Sends a document to all interacted users.
         Supports both file paths and file-like objects (e.g. BytesIO).
+        The content is uploaded once; other users get the resulting file_id.
         """
         if not self.interacted_users:
             return
-        for user_id in self.interacted_users:
+        key = None
+        if document is not None:
+            media = document.read()
+            if isinstance(media, str):
+                media = media.encode('utf-8')
+            name = getattr(document, 'name', None)
+            if hasattr(document, 'seek'):
+                document.seek(0)
+        elif file_path is not None:
             try:
-                if document is not None:
-                    self.bot.send_document(user_id, document=document, caption=caption)
-                    if hasattr(document, 'seek'):
-                        document.seek(0)
-                elif file_path is not None:
-                    with open(file_path, 'rb') as f:
-                        self.bot.send_document(user_id, document=f, caption=caption)
-                else:
-                    self.logger.error("send_document called with no file_path or document")
-                    return
-                self.logger.info(f"Document sent to {self.get_username(user_id)}")
-            except telebot.apihelper.ApiTelegramException as e:
-                self.logger.error(f"Telegram API error sending document to user {user_id}: {e}")
-            except telebot.apihelper.ApiException as e:
-                self.logger.error(f"API error sending document to user {user_id}: {e}")
-            except Exception as e:
-                self.logger.error(f"Failed to send document to user {user_id}: {e}")
+                key = _file_key(file_path)
+            except OSError as e:
+                self.logger.error(f"Failed to read document {file_path}: {e}")
+                return
+            media = self._file_ids.get(('document', key)) or _Path(file_path)
+            name = os.path.basename(file_path)
+        else:
+            self.logger.error("send_document called with no file_path or document")
+            return
+        self._broadcast_file(
+            self._send_document_one, media, name, caption,
+            lambda message: message.document.file_id if message.document else None,
+            cache_key=('document', key) if key else None,
+        )
 
     def start_polling_for_limited_time(self, timeout=30):
         """
         Starts polling the Telegram API for a limited amount of time.
-        Runs in a background thread so it doesn't block the caller.
+        Runs on the polling pool so it doesn't block the caller.
+        In webhook mode updates only arrive through the listener the scheduler
+        keeps up, so there is no window to open.
         """
+        if self.mode == 'webhook':
+            return
+        if self._polling_future is not None and not self._polling_future.done():
+            return
         self.stop_event.clear()
-        self.polling_thread = Thread(target=self._poll_and_stop, args=(timeout,), daemon=True)
-        self.polling_thread.start()
+        self._polling_future = self._polling_executor.submit(self.start_polling)
+        self._polling_executor.submit(self._poll_and_stop, timeout)
 
     def _poll_and_stop(self, timeout):
         """
-        Internal method: starts polling, waits for timeout, then stops.
+        Internal method: waits for the polling window to elapse, then stops polling.
+        Returns early if polling ends on its own before the timeout.
         """
-        polling_thread = Thread(target=self.start_polling, daemon=True)
-        polling_thread.start()
-        time.sleep(timeout)
-        self.stop_polling()
+        if not self.stop_event.wait(timeout):
+            self.stop_polling()
 
     def start_polling(self):
         """
         Starts the bot's polling process to receive messages.
+        In webhook mode this registers the webhook and starts the listener instead,
+        without blocking. Only the long-running scheduler calls it in that mode, so
+        one-shot runs never touch the registered webhook or its port.
         """
+        if self.mode == 'webhook':
+            self.start_webhook()
+            return
         try:
             self.logger.info("Starting bot polling...")
             self.bot.polling(non_stop=True)
@@ -213,7 +550,95 @@ class TelegramBot:
         """
         Stops the bot's polling process.
         """
-        if self.polling_thread and self.polling_thread.is_alive():
+        future = self._polling_future
+        if future is not None and not future.done():
             self.logger.info("Stopping bot polling...")
             self.bot.stop_polling()
-            self.polling_thread.join(timeout=10)
+            # Also wakes the watchdog if the window is being closed early
+            self.stop_event.set()
+            wait([future], timeout=10)
+
+    def start_webhook(self):
+        """
+        Registers the webhook with Telegram and serves updates on a background HTTP listener.
+        Each POST to webhook_path carries one Update, which is handed to the message handlers.
+        """
+        if self._webhook_server is not None:
+            return
+        bot = self
+        path = self.webhook_path
+        listen = self.webhook_listen
+        if not self.webhook_secret and listen not in _LOOPBACK_HOSTS:
+            # Without the secret token anyone who can reach the port could post updates
+            self.logger.warning(
+                f"[TELEGRAM] webhook_secret is not set; listening on 127.0.0.1 instead of {listen}. "
+                "Set webhook_secret to accept updates on other interfaces."
+            )
+            listen = '127.0.0.1'
+
+        class _UpdateHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path != path:
+                    self.send_error(404)
+                    return
+                token = self.headers.get('X-Telegram-Bot-Api-Secret-Token', '')
+                if bot.webhook_secret and not hmac.compare_digest(token, bot.webhook_secret):
+                    self.send_error(403)
+                    return
+                try:
+                    length = int(self.headers['Content-Length'])
+                except (TypeError, ValueError):
+                    length = -1
+                if length < 0:
+                    self.send_error(400, 'Missing or invalid Content-Length')
+                    return
+                try:
+                    update = telebot.types.Update.de_json(self.rfile.read(length).decode('utf-8'))
+                    bot.bot.process_new_updates([update])
+                except Exception as e:
+                    bot.logger.error(f"Failed to process webhook update: {e}")
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                bot.logger.debug(f"Webhook request: {format % args}")
+
+        try:
+            self.bot.remove_webhook()
+            self.bot.set_webhook(url=self.webhook_url.rstrip('/') + path, secret_token=self.webhook_secret)
+            self._webhook_server = ThreadingHTTPServer((listen, self.webhook_port), _UpdateHandler)
+        except Exception as e:
+            self.logger.error(f"Failed to start webhook listener: {e}")
+            self._webhook_server = None
+            return
+        Thread(target=self._webhook_server.serve_forever, daemon=True).start()
+        self.logger.info(f"Webhook listener started on {listen}:{self.webhook_port}{path}")
+
+    def stop_webhook(self):
+        """
+        Stops the webhook listener and unregisters the webhook from Telegram.
+        """
+        if self._webhook_server is None:
+            return
+        self.logger.info("Stopping webhook listener...")
+        self._webhook_server.shutdown()
+        self._webhook_server.server_close()
+        self._webhook_server = None
+        try:
+            self.bot.remove_webhook()
+        except Exception as e:
+            self.logger.error(f"Failed to remove webhook: {e}")
+
+    def shutdown(self):
+        """
+        Stops polling (or the webhook listener), releases both thread pools and
+        detaches this instance from the shared TeleBot client.
+        The bot cannot send after this.
+        """
+        self.stop_polling()
+        self.stop_webhook()
+        self._flush_interacted_users()
+        self._remove_handlers(lambda owner: owner is self)
+        _LIVE_BOTS.discard(self)
+        self._executor.shutdown(wait=True)
+        self._polling_executor.shutdown(wait=False)
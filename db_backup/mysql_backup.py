@@ -1,17 +1,60 @@
 import os
+import atexit
+import random
+import shlex
+import shutil
+import socket
 import subprocess
+import tempfile
 import paramiko
 import configparser
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from collections import deque
 from datetime import datetime
+from threading import RLock
 from paramiko.ssh_exception import SSHException, AuthenticationException
 import concurrent.futures
 import time
 
+# Read size for the dump pipeline and the remote stream
+_STREAM_CHUNK = 1 << 20  # 1 MiB
+
+# Uploads at least this large are split into ranges sent on parallel SFTP channels
+_PARALLEL_UPLOAD_MIN = 64 << 20  # 64 MiB
+_UPLOAD_WORKERS = 4
+
+# Upper bound on one backoff sleep between transfer retries
+_MAX_RETRY_DELAY = 300  # seconds
+
+# Data per SFTP WRITE request. paramiko sends 32 KiB by default; OpenSSH's sftp-server
+# accepts messages up to 256 KiB and advertises 255 KiB of data as its write limit
+_SFTP_WRITE_SIZE = 255 * 1024
+
+# Chunks the local spool write may lag behind the remote stream
+_SPOOL_DEPTH = 16
+
+# SSH channel window: paramiko's 2 MiB default makes the sender stall for a
+# WINDOW_ADJUST every 2 MiB, which caps throughput on any link with real latency
+_SSH_WINDOW_SIZE = 2147483647
+_SSH_MAX_PACKET_SIZE = 32768
+_SOCKET_BUFFER = 32 << 20  # the kernel clamps this to its configured maximum
+
+# Live SSH connections keyed by (host, port, user), reused across transfer retries
+# and repeated backups so each one does not pay a fresh key exchange and login
+_SSH_POOL = {}
+_SSH_POOL_LOCK = RLock()
+
+# Validated configs keyed by path, stored with the file's mtime so edits are re-read
+_CONFIG_CACHE = {}
+
 
 def setup_logger(log_file='mySQL_backup.log', log_level=logging.INFO):
     """
     Sets up a configurable logger.
+    Records are queued and written to the file by a background listener thread,
+    so logging never blocks the dump or transfer on disk I/O.
     
     Args:
         log_file (str): Path to the log file.
@@ -23,16 +66,21 @@ def setup_logger(log_file='mySQL_backup.log', log_level=logging.INFO):
     logger = logging.getLogger()
     logger.setLevel(log_level)
 
-    # File handler
+    # File handler, fed from the queue by the listener
     file_handler = logging.FileHandler(log_file)
     file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-    logger.addHandler(file_handler)
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # drains queued records before exit
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
 def validate_config(config_path, logger=None):
     """
     Validates the configuration settings from a given config file.
+    The result is cached until the file's modification time changes.
     
     Args:
         config_path (str): The path to the configuration file (db_config.ini).
@@ -42,8 +90,14 @@ def validate_config(config_path, logger=None):
         ValueError: If any required configuration setting is missing or if the config file doesn't exist.
     """
     # Check if the config file exists
-    if not os.path.exists(config_path):
-        raise ValueError(f"Configuration file does not exist: {config_path}")
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        raise ValueError(f"Configuration file does not exist: {config_path}") from None
+
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
 
     # Read configuration
     config = configparser.ConfigParser()
@@ -71,8 +125,40 @@ def validate_config(config_path, logger=None):
 
     logger.info("Configuration validated.")
 
+    _CONFIG_CACHE[config_path] = (mtime_ns, config)
     return config  # Return the config object for further use
 
+def _option_value(value):
+    """
+    Quotes a value for a MySQL option file.
+    """
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def _write_client_options(config):
+    """
+    Writes the MySQL credentials to a private (0600) option file for the client tools'
+    --defaults-extra-file, keeping the password out of the command line and out of
+    /proc/<pid>/environ. The caller must delete the file.
+
+    Returns:
+        str: The path to the option file.
+    """
+    fd, path = tempfile.mkstemp(prefix='my', suffix='.cnf')
+    with os.fdopen(fd, 'w') as f:
+        f.write(f"[client]\nuser={_option_value(config['mysql'].get('user'))}\n"
+                f"password={_option_value(config['mysql'].get('password'))}\n")
+    return path
+
+def _remove_client_options(path):
+    """
+    Deletes an option file written by _write_client_options, if one was written.
+    """
+    if path is not None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
 def backup_to_hard_drive(config, logger=None):
     """
     Backs up the MySQL database to a local hard drive.
@@ -84,9 +170,7 @@ def backup_to_hard_drive(config, logger=None):
     Returns:
         str or None: The path to the backup file if successful, or None if an error occurred.
     """
-    # MySQL Credentials
-    DB_USER = config['mysql'].get('user')
-    DB_PASSWORD = config['mysql'].get('password')
+    # MySQL Database (credentials are passed in an option file)
     DB_NAME = config['mysql'].get('database')
 
     # Local Backup Directory
@@ -96,19 +180,20 @@ def backup_to_hard_drive(config, logger=None):
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     backup_file = os.path.join(LOCAL_BACKUP_DIR, f"{DB_NAME}_backup_{timestamp}.sql")
 
-    # Command to dump the MySQL database (password passed via env var)
-    dump_cmd = [
-        "mysqldump",
-        "-u", DB_USER,
-        "--result-file", backup_file,
-        DB_NAME
-    ]
-    env = os.environ.copy()
-    env["MYSQL_PWD"] = DB_PASSWORD
-
+    options_file = None
     try:
+        options_file = _write_client_options(config)
+        # --defaults-extra-file must be the first option
+        dump_cmd = [
+            "mysqldump",
+            f"--defaults-extra-file={options_file}",
+            "--quick",
+            "--single-transaction",
+            "--result-file", backup_file,
+            DB_NAME
+        ]
         logger.info("Starting MySQL backup to hard drive...")
-        subprocess.run(dump_cmd, check=True, env=env)
+        subprocess.run(dump_cmd, check=True)
         logger.info(f"Database backup successful: {backup_file}")
         return backup_file
 
@@ -124,6 +209,387 @@ def backup_to_hard_drive(config, logger=None):
         logger.error(f"Unexpected error during MySQL backup: {e}")
         return None
 
+    finally:
+        _remove_client_options(options_file)
+
+def _dump_table(dump_cmd, table, path):
+    """
+    Dumps one table through gzip into path. Returns True on success.
+    """
+    with open(path, 'wb') as out:
+        dump = subprocess.Popen(dump_cmd + [table], stdout=subprocess.PIPE)
+        try:
+            gzip = subprocess.Popen(["gzip", "-1", "-c"], stdin=dump.stdout, stdout=out)
+        except OSError:
+            dump.kill()
+            dump.wait()
+            raise
+        finally:
+            dump.stdout.close()
+        return gzip.wait() == 0 and dump.wait() == 0
+
+def backup_to_hard_drive_parallel(config, logger=None, threads=4):
+    """
+    Backs up the MySQL database to a local directory with several dump workers.
+
+    Uses mydumper when it is installed, which keeps one consistent snapshot across
+    its threads. Otherwise each table is dumped by its own mysqldump | gzip pipeline,
+    `threads` at a time; each table is consistent on its own, but tables are not
+    snapshotted together, so prefer mydumper for databases written during backups.
+
+    Args:
+        config (configparser.ConfigParser): The parsed configuration object.
+        logger (logging.Logger, optional): A logger instance for logging messages.
+        threads (int): Number of tables dumped at once.
+
+    Returns:
+        str or None: The path to the backup directory if successful, or None if an error occurred.
+    """
+    # MySQL Database (credentials are passed in an option file)
+    DB_NAME = config['mysql'].get('database')
+
+    # Local Backup Directory
+    LOCAL_BACKUP_DIR = config['backup'].get('local_backup_dir')
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    backup_dir = os.path.join(LOCAL_BACKUP_DIR, f"{DB_NAME}_backup_{timestamp}")
+
+    options_file = None
+    try:
+        os.makedirs(backup_dir)
+        options_file = _write_client_options(config)
+        if shutil.which("mydumper"):
+            logger.info(f"Starting parallel MySQL backup with mydumper ({threads} threads)...")
+            subprocess.run(["mydumper", f"--defaults-file={options_file}", "-B", DB_NAME, "-o", backup_dir,
+                            "-t", str(threads), "-c"], check=True)
+        else:
+            result = subprocess.run(["mysql", f"--defaults-extra-file={options_file}", "-N", "-B",
+                                     "-e", "SHOW TABLES", DB_NAME], check=True, capture_output=True, text=True)
+            tables = [t for t in result.stdout.splitlines() if t]
+            logger.info(f"Starting parallel MySQL backup of {len(tables)} tables ({threads} at a time)...")
+
+            dump_cmd = ["mysqldump", f"--defaults-extra-file={options_file}", "--quick", "--single-transaction",
+                        DB_NAME]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+                futures = {
+                    executor.submit(_dump_table, dump_cmd, table,
+                                    os.path.join(backup_dir, f"{table}.sql.gz")): table
+                    for table in tables
+                }
+                failed = [futures[f] for f in concurrent.futures.as_completed(futures) if not f.result()]
+            if failed:
+                logger.error(f"mysqldump failed for tables: {', '.join(sorted(failed))}")
+                return None
+
+        logger.info(f"Database backup successful: {backup_dir}")
+        return backup_dir
+
+    except subprocess.CalledProcessError as e:
+        logger.error(f"{e.cmd[0]} command failed with exit code {e.returncode}. Output: {e.stderr}")
+        return None
+
+    except FileNotFoundError as e:
+        logger.error(f"MySQL client tools not found: {e}")
+        return None
+
+    except Exception as e:
+        logger.error(f"Unexpected error during parallel MySQL backup: {e}")
+        return None
+
+    finally:
+        _remove_client_options(options_file)
+
+def connect_ssh(config):
+    """
+    Opens an SSH connection to the configured remote server, tuned for bulk transfers.
+
+    The TCP socket gets large send/receive buffers and TCP_NODELAY, and the transport
+    advertises a large channel window so uploads are not throttled by window updates.
+    With `compress = true` in [ssh], zlib compression is negotiated for the connection.
+
+    Args:
+        config (configparser.ConfigParser): The parsed configuration object.
+
+    Returns:
+        paramiko.SSHClient: The connected client.
+
+    Raises:
+        AuthenticationException, SSHException, OSError: If the connection fails.
+    """
+    host = config['ssh'].get('host')
+    port = config['ssh'].getint('port')
+
+    sock = socket.create_connection((host, port))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER)
+
+    def transport_factory(sock, **kwargs):
+        return paramiko.Transport(sock, default_window_size=_SSH_WINDOW_SIZE,
+                                  default_max_packet_size=_SSH_MAX_PACKET_SIZE, **kwargs)
+
+    ssh = paramiko.SSHClient()
+    ssh.set_missing_host_key_policy(paramiko.WarningPolicy())
+    try:
+        ssh.connect(host, port=port, username=config['ssh'].get('user'),
+                    password=config['ssh'].get('password'), sock=sock, transport_factory=transport_factory,
+                    compress=config['ssh'].getboolean('compress', fallback=False))
+    except Exception:
+        sock.close()
+        raise
+    return ssh
+
+def get_ssh(config):
+    """
+    Returns a pooled SSH connection to the configured server, reconnecting if the
+    cached one is no longer active.
+
+    Args:
+        config (configparser.ConfigParser): The parsed configuration object.
+
+    Returns:
+        paramiko.SSHClient: A connected client. Callers must not close it.
+    """
+    key = (config['ssh'].get('host'), config['ssh'].getint('port'), config['ssh'].get('user'))
+    with _SSH_POOL_LOCK:
+        ssh = _SSH_POOL.get(key)
+        if ssh is not None:
+            transport = ssh.get_transport()
+            if transport is not None and transport.is_active():
+                return ssh
+            ssh.close()
+            del _SSH_POOL[key]
+        ssh = connect_ssh(config)
+        _SSH_POOL[key] = ssh
+        return ssh
+
+def discard_ssh(config):
+    """
+    Closes and forgets the pooled SSH connection for the configured server, if any.
+
+    Args:
+        config (configparser.ConfigParser): The parsed configuration object.
+    """
+    key = (config['ssh'].get('host'), config['ssh'].getint('port'), config['ssh'].get('user'))
+    with _SSH_POOL_LOCK:
+        ssh = _SSH_POOL.pop(key, None)
+    if ssh is not None:
+        ssh.close()
+
+@atexit.register
+def close_ssh_pool():
+    """
+    Closes every pooled SSH connection.
+    """
+    with _SSH_POOL_LOCK:
+        clients = list(_SSH_POOL.values())
+        _SSH_POOL.clear()
+    for ssh in clients:
+        ssh.close()
+
+def _remote_path(config, backup_file):
+    """
+    Returns the path a local backup file is stored at on the remote server.
+    """
+    return os.path.join(config['ssh'].get('remote_backup_dir'), os.path.basename(backup_file))
+
+def _run_remote(config, command):
+    """
+    Runs a shell command on the remote server over the pooled SSH connection.
+    Returns its exit status.
+    """
+    channel = get_ssh(config).get_transport().open_session()
+    try:
+        channel.exec_command(command)
+        return channel.recv_exit_status()
+    finally:
+        channel.close()
+
+def stream_backup_to_server(config, logger=None):
+    """
+    Dumps the MySQL database through gzip and streams it to the remote server as it is
+    produced, writing the same compressed bytes to the local backup directory.
+
+    The dump is read once and the local copy is never read back. If the remote side
+    fails, the local copy is still completed so it can be transferred afterwards.
+    The remote copy is streamed to a ``.part`` file and only renamed to its final
+    name once mysqldump, gzip and the remote write have all succeeded; on any
+    failure the ``.part`` file is deleted, so a partial dump never looks like a backup.
+
+    Args:
+        config (configparser.ConfigParser): The parsed configuration object.
+        logger (logging.Logger, optional): A logger instance for logging messages.
+
+    Returns:
+        tuple: (path to the local .sql.gz file or None on dump failure,
+                True if the remote copy was written successfully).
+    """
+    # MySQL Database (credentials are passed in an option file)
+    DB_NAME = config['mysql'].get('database')
+
+    # Local Backup Directory
+    LOCAL_BACKUP_DIR = config['backup'].get('local_backup_dir')
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    backup_file = os.path.join(LOCAL_BACKUP_DIR, f"{DB_NAME}_backup_{timestamp}.sql.gz")
+    remote_file_path = _remote_path(config, backup_file)
+    remote_part_path = f"{remote_file_path}.part"
+
+    channel = None
+    remote_started = remote_done = False
+    dump = gzip = None
+    options_file = None
+    try:
+        logger.info(f"Connecting to remote server {config['ssh'].get('host')}...")
+        channel = get_ssh(config).get_transport().open_session()
+        channel.exec_command(f"cat > {shlex.quote(remote_part_path)}")
+        remote_started = True
+    except Exception as e:
+        logger.warning(f"Remote stream unavailable, dumping locally only: {e}")
+        if channel is not None:
+            channel.close()
+        channel = None
+
+    try:
+        logger.info("Starting streamed MySQL backup...")
+        options_file = _write_client_options(config)
+        # --quick streams rows instead of buffering whole tables in mysqldump
+        dump_cmd = ["mysqldump", f"--defaults-extra-file={options_file}", "--quick", "--single-transaction",
+                    DB_NAME]
+        dump = subprocess.Popen(dump_cmd, stdout=subprocess.PIPE)
+        gzip = subprocess.Popen(["gzip", "-1", "-c"], stdin=dump.stdout, stdout=subprocess.PIPE)
+        dump.stdout.close()  # gzip owns the pipe now; mysqldump sees EPIPE if gzip dies
+
+        # The local spool is written behind on one worker (in order), so disk writes
+        # overlap the network sends instead of alternating with them
+        with open(backup_file, 'wb') as out, concurrent.futures.ThreadPoolExecutor(max_workers=1) as writer:
+            pending = deque()
+            for chunk in iter(lambda: gzip.stdout.read(_STREAM_CHUNK), b''):
+                pending.append(writer.submit(out.write, chunk))
+                if len(pending) >= _SPOOL_DEPTH:
+                    pending.popleft().result()
+                if channel is not None:
+                    try:
+                        channel.sendall(chunk)
+                    except (SSHException, OSError) as e:
+                        logger.warning(f"Remote stream failed, continuing local dump: {e}")
+                        channel.close()
+                        channel = None
+            for write in pending:
+                write.result()
+        gzip.stdout.close()
+
+        if dump.wait() != 0 or gzip.wait() != 0:
+            logger.error(f"Streamed backup failed (mysqldump exit {dump.returncode}, gzip exit {gzip.returncode})")
+            os.remove(backup_file)
+            return None, False
+        logger.info(f"Database backup successful: {backup_file}")
+
+        if channel is None:
+            return backup_file, False
+        channel.shutdown_write()
+        status = channel.recv_exit_status()
+        if status != 0:
+            logger.error(f"Remote write of {remote_part_path} failed with exit code {status}")
+            return backup_file, False
+        status = _run_remote(config, f"mv -f {shlex.quote(remote_part_path)} {shlex.quote(remote_file_path)}")
+        if status != 0:
+            logger.error(f"Renaming {remote_part_path} on the remote server failed with exit code {status}")
+            return backup_file, False
+        remote_done = True
+        logger.info(f"Backup streamed to remote server: {remote_file_path}")
+        return backup_file, True
+
+    except FileNotFoundError as e:
+        logger.error(f"mysqldump, gzip or the backup directory not found: {e}")
+        return None, False
+
+    except Exception as e:
+        logger.error(f"Unexpected error during streamed MySQL backup: {e}")
+        return None, False
+
+    finally:
+        for proc in (dump, gzip):
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+                proc.wait()
+        if channel is not None:
+            channel.close()
+        if remote_started and not remote_done:
+            # Never leave a partial dump behind on the server
+            try:
+                _run_remote(config, f"rm -f {shlex.quote(remote_part_path)}")
+            except Exception as e:
+                logger.warning(f"Could not remove {remote_part_path} from the remote server: {e}")
+        _remove_client_options(options_file)
+
+def _upload_range(sftp, local_path, remote_path, offset, length):
+    """
+    Uploads `length` bytes of a local file, starting at `offset`, into the same range
+    of an existing remote file, with pipelined 1 MiB writes.
+
+    Writes are not acknowledged one by one, so many WRITE requests are in flight at
+    once, and each chunk is read into one reused buffer without an extra copy.
+    """
+    buf = memoryview(bytearray(_STREAM_CHUNK))
+    with open(local_path, 'rb') as src, sftp.open(remote_path, 'r+b') as dst:
+        src.seek(offset)
+        dst.seek(offset)
+        dst.set_pipelined(True)
+        dst.MAX_REQUEST_SIZE = _SFTP_WRITE_SIZE  # this handle only, not paramiko-wide
+        while length:
+            n = src.readinto(buf[:min(length, _STREAM_CHUNK)])
+            if not n:
+                raise IOError(f"{local_path} shrank during upload")
+            dst.write(buf[:n])
+            length -= n
+
+def _upload_range_own_session(transport, local_path, remote_path, offset, length):
+    """
+    Runs _upload_range on a new SFTP session (its own channel) over the shared transport.
+    """
+    with paramiko.SFTPClient.from_transport(transport) as sftp:
+        _upload_range(sftp, local_path, remote_path, offset, length)
+
+def _upload_file(sftp, local_path, remote_path):
+    """
+    Uploads a file over SFTP.
+
+    Files of _PARALLEL_UPLOAD_MIN bytes or more are split into _UPLOAD_WORKERS ranges
+    uploaded at once, each on its own SFTP channel writing at its offset in the remote
+    file, so one channel's round-trips no longer bound the transfer rate.
+
+    Args:
+        sftp (paramiko.SFTPClient): An open SFTP session.
+        local_path (str): The file to upload.
+        remote_path (str): The destination path on the server.
+
+    Returns:
+        int: The number of bytes uploaded.
+
+    Raises:
+        IOError: If the remote file size does not match after the upload.
+    """
+    size = os.stat(local_path).st_size
+    sftp.open(remote_path, 'wb').close()  # create or truncate
+    if size < _PARALLEL_UPLOAD_MIN:
+        _upload_range(sftp, local_path, remote_path, 0, size)
+    else:
+        part = -(-size // _UPLOAD_WORKERS)
+        transport = sftp.get_channel().get_transport()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_UPLOAD_WORKERS) as executor:
+            futures = [
+                executor.submit(_upload_range_own_session, transport, local_path, remote_path,
+                                offset, min(part, size - offset))
+                for offset in range(0, size, part)
+            ]
+            for future in futures:
+                future.result()
+    remote_size = sftp.stat(remote_path).st_size
+    if remote_size != size:
+        raise IOError(f"size mismatch in upload: {remote_size} != {size}")
+    return size
+
 def transfer_backup_to_server(config, backup_file, logger=None):
     """
     Transfers the backup file to a remote server using SCP over SSH.
@@ -138,21 +604,13 @@ def transfer_backup_to_server(config, backup_file, logger=None):
     """
     # SSH Remote Server Configuration
     SSH_HOST = config['ssh'].get('host')
-    SSH_PORT = config['ssh'].getint('port')
-    SSH_USER = config['ssh'].get('user')
-    SSH_PASSWORD = config['ssh'].get('password')
-    REMOTE_BACKUP_DIR = config['ssh'].get('remote_backup_dir')
 
     try:
         logger.info(f"Connecting to remote server {SSH_HOST}...")
 
-        # Initialize SSH client
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.WarningPolicy())
-
         # Try connecting to the remote server
         try:
-            ssh.connect(SSH_HOST, port=SSH_PORT, username=SSH_USER, password=SSH_PASSWORD)
+            ssh = get_ssh(config)
         except AuthenticationException:
             logger.error("Authentication failed when connecting to the server.")
             return False
@@ -160,13 +618,12 @@ def transfer_backup_to_server(config, backup_file, logger=None):
             logger.error(f"SSH connection error: {e}")
             return False
 
-        # Use SFTP to transfer the file
+        # Use SFTP to transfer the file; the connection stays in the pool
         try:
-            sftp = ssh.open_sftp()
-            remote_file_path = os.path.join(REMOTE_BACKUP_DIR, os.path.basename(backup_file))
-            sftp.put(backup_file, remote_file_path)
+            with ssh.open_sftp() as sftp:
+                remote_file_path = _remote_path(config, backup_file)
+                _upload_file(sftp, backup_file, remote_file_path)
             logger.info(f"Backup transferred to remote server: {remote_file_path}")
-            sftp.close()
 
         except FileNotFoundError as e:
             logger.error(f"Backup file not found: {backup_file}. Error: {e}")
@@ -175,7 +632,6 @@ def transfer_backup_to_server(config, backup_file, logger=None):
             logger.error(f"SFTP transfer failed: {e}")
             return False
 
-        ssh.close()
         return True
 
     except Exception as e:
@@ -185,31 +641,62 @@ def transfer_backup_to_server(config, backup_file, logger=None):
 def retry_transfer(config, backup_file, logger=None, retries=3, delay=5):
     """
     Retries transferring the backup to the server on failure.
+    Waits back off exponentially with random jitter, so many hosts whose backups
+    failed together do not all reconnect to the SSH server at the same moment.
     
     Args:
         config (configparser.ConfigParser): The parsed configuration object.
         backup_file (str): The path to the backup file that will be transferred.
         logger (logging.Logger, optional): A logger instance for logging messages.
         retries (int): The number of retry attempts.
-        delay (int): The delay (in seconds) between retries.
+        delay (int): The base delay (in seconds) between retries, doubled per attempt.
 
     Returns:
         bool: True if the transfer was successful, False otherwise.
     """
-    # Check if the backup file exists
-    if not os.path.exists(backup_file):
-        logger.error(f"Backup file does not exist: {backup_file}")
-        return False
-
     for attempt in range(retries):
         if transfer_backup_to_server(config, backup_file, logger):
             return True
-        logger.warning(f"Retrying transfer... Attempt {attempt + 1}")
-        time.sleep(delay)
-    
+        # A missing file is already logged by the transfer and will not reappear
+        if not os.path.exists(backup_file):
+            return False
+        if attempt + 1 < retries:
+            sleep_s = min(delay * (1 << attempt) + random.uniform(0, delay), _MAX_RETRY_DELAY)
+            logger.warning(f"Retrying transfer in {sleep_s:.1f}s... Attempt {attempt + 2} of {retries}")
+            time.sleep(sleep_s)
+
     logger.error("Transfer failed after multiple attempts.")
+    discard_ssh(config)
     return False
 
+def notify_backup_uploaded(config, backup_file, logger=None):
+    """
+    Emails the optional [email] receivers where the backup was uploaded.
+    Only the remote path is sent; the dump itself is never attached.
+
+    Args:
+        config (configparser.ConfigParser): The parsed configuration object.
+        backup_file (str): The path to the local backup file.
+        logger (logging.Logger, optional): A logger instance for logging messages.
+    """
+    receivers = []
+    if 'email' in config:
+        receivers = [r.strip() for r in config['email'].get('receivers', '').split(',') if r.strip()]
+    if not receivers:
+        return
+
+    try:
+        from email_nots.email import send_email
+    except ImportError:
+        logger.error("email_nots is not importable; run from the project root to send email notifications.")
+        return
+
+    try:
+        send_email(receivers, "MySQL Backup Completed", f"Backup uploaded: {_remote_path(config, backup_file)}",
+                   logger=logger)
+    except (FileNotFoundError, KeyError, ValueError) as e:
+        logger.error(f"Failed to send backup notification: {e}")
+
 def backup_mysql(config_path, logger=None):
     """
     Main function to backup MySQL database locally and transfer it to a remote server.
@@ -227,18 +714,20 @@ def backup_mysql(config_path, logger=None):
         # Validate configuration before proceeding
         config = validate_config(config_path, logger)
 
-        # Step 1: Backup to hard drive
+        # Step 1: Dump to hard drive, streaming to the external server in the same pass
         logger.info("Starting MySQL backup process...")
-        backup_file = backup_to_hard_drive(config, logger)
-
-        if backup_file:
-            # Step 2: Transfer the backup to the external server using retries
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future_transfer = executor.submit(retry_transfer, config, backup_file, logger)
-                if future_transfer.result():
-                    logger.info("Backup and transfer process completed successfully.")
-                else:
-                    logger.error("Backup transfer process failed.")
+        backup_file, transferred = stream_backup_to_server(config, logger)
+
+        if backup_file and transferred:
+            logger.info("Backup and transfer process completed successfully.")
+            notify_backup_uploaded(config, backup_file, logger)
+        elif backup_file:
+            # Step 2: Stream failed; transfer the local copy using retries
+            if retry_transfer(config, backup_file, logger):
+                logger.info("Backup and transfer process completed successfully.")
+                notify_backup_uploaded(config, backup_file, logger)
+            else:
+                logger.error("Backup transfer process failed.")
         else:
             logger.error("Backup process failed. No file to transfer.")
 
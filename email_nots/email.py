@@ -1,11 +1,14 @@
 import os
 import time
+import atexit
+import base64
 import smtplib
+import threading
 import configparser
 from pathlib import Path
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+from email.mime.base import MIMEBase
 
 
 _EMAIL_CONFIG_PATH = Path(__file__).parent.parent / 'config' / 'email_config.ini'
@@ -15,6 +18,38 @@ _cached_email_config = None
 _cache_timestamp = 0.0
 _CACHE_TTL = 300  # seconds
 
+# Main MIME type by file extension
+_FILE_TYPE_MAP = {
+    'pdf': 'application',
+    'doc': 'application',
+    'docx': 'application',
+    'xls': 'application',
+    'xlsx': 'application',
+    'ppt': 'application',
+    'pptx': 'application',
+    'txt': 'text',
+    'jpg': 'image',
+    'jpeg': 'image',
+    'png': 'image',
+    'gif': 'image',
+    'zip': 'application',
+    'tar': 'application',
+    'gz': 'application'
+}
+_DEFAULT_MIME = 'application/octet-stream'
+
+# (maintype, subtype) per extension, resolved once so attaching is a single lookup
+_MIME_PARTS = {ext: (main_type, ext) for ext, main_type in _FILE_TYPE_MAP.items()}
+_DEFAULT_MIME_PARTS = tuple(_DEFAULT_MIME.split('/'))
+
+# Larger files are skipped rather than attached: providers reject big messages
+# and base64 adds a third on top, so send a link or path to large backups instead
+_MAX_ATTACH_BYTES = 10 * 1024 * 1024
+
+# Attachment read size: a multiple of 57 bytes, so every chunk encodes to whole
+# 76-character base64 lines and the encoded chunks can simply be concatenated
+_ATTACH_CHUNK = 57 * 1152  # ~64 KiB
+
 
 def _load_email_config():
     global _cached_email_config, _cache_timestamp
@@ -53,7 +88,7 @@ def _load_email_config():
     _cache_timestamp = time.time()
     return _cached_email_config
 
-def send_email(receiver_emails, subject, body, attachment_paths=None, logger=None):
+def send_email(receiver_emails, subject, body, attachment_paths=None, logger=None, attachments=None):
     """
     Send an email with optional attachments and log key events.
 
@@ -63,6 +98,7 @@ def send_email(receiver_emails, subject, body, attachment_paths=None, logger=Non
     - body (str): Body text of the email.
     - attachment_paths (list of str, optional): List of file paths to attach to the email.
     - logger (logging.Logger, optional): Logger object for logging (default: None).
+    - attachments (list of (str, bytes), optional): In-memory attachments as (filename, data) pairs.
     """
     try:
         sender_email, app_password, smtp_host, smtp_port = _load_email_config()
@@ -81,6 +117,8 @@ def send_email(receiver_emails, subject, body, attachment_paths=None, logger=Non
         # Attach files if any
         if attachment_paths:
             attach_files_to_email(message, attachment_paths, logger)
+        if attachments:
+            attach_data_to_email(message, attachments, logger)
 
         # Send the email with retry
         send_via_smtp(sender_email, app_password, receiver_emails, message, logger,
@@ -98,43 +136,41 @@ def send_email(receiver_emails, subject, body, attachment_paths=None, logger=Non
         else:
             print(error_message)
 
+def _base64_file(f):
+    """
+    Base64-encode an open binary file in chunks, so the raw bytes are never held whole.
+    The encoded chunks are joined at the end, so the peak is about two encoded
+    copies of the file; callers bound that by only attaching files up to
+    _MAX_ATTACH_BYTES.
+    """
+    chunks = []
+    for buf in iter(lambda: f.read(_ATTACH_CHUNK), b''):
+        chunks.append(base64.encodebytes(buf).decode('ascii'))
+    return ''.join(chunks)
+
 def attach_files_to_email(message, attachment_paths, logger=None):
     """
     Attach files to the email message with a fallback for unsupported file types.
     """
-    file_type_map = {
-        'pdf': 'application',
-        'doc': 'application',
-        'docx': 'application',
-        'xls': 'application',
-        'xlsx': 'application',
-        'ppt': 'application',
-        'pptx': 'application',
-        'txt': 'text',
-        'jpg': 'image',
-        'jpeg': 'image',
-        'png': 'image',
-        'gif': 'image',
-        'zip': 'application',
-        'tar': 'application',
-        'gz': 'application'
-    }
-
     for attachment_path in attachment_paths:
         try:
             file_extension = os.path.splitext(attachment_path)[1][1:].lower()
-            file_type = file_type_map.get(file_extension, 'application/octet-stream')  # Fallback MIME type
+            mime_parts = _MIME_PARTS.get(file_extension)
 
-            # Open and attach the file
+            # Open and attach the file, encoding it chunk by chunk
             with open(attachment_path, 'rb') as f:
-                attachment = MIMEApplication(f.read(), _subtype=file_extension)
-                attachment.add_header('Content-Disposition', 'attachment', filename=os.path.basename(attachment_path))
-                attachment.add_header('Content-Type', f'{file_type}/{file_extension}' if file_type in file_type_map else 'application/octet-stream')
-                message.attach(attachment)
+                size = os.fstat(f.fileno()).st_size
+                if size > _MAX_ATTACH_BYTES:
+                    if logger:
+                        logger.warning(f"Skipping attachment {attachment_path}: {size} bytes exceeds the "
+                                       f"{_MAX_ATTACH_BYTES} byte limit.")
+                    continue
+                payload = _base64_file(f)
+            message.attach(_mime_attachment(os.path.basename(attachment_path), payload, mime_parts))
 
             if logger:
                 logger.info(f"Attached file: {attachment_path}")
-                if file_type == 'application/octet-stream':
+                if mime_parts is None:
                     logger.warning(f"Unknown file type for {attachment_path}. Using default MIME type 'application/octet-stream'.")
 
         except Exception as e:
@@ -145,26 +181,106 @@ def attach_files_to_email(message, attachment_paths, logger=None):
                 print(error_message)
 
 
+def attach_data_to_email(message, attachments, logger=None):
+    """
+    Attach in-memory (filename, bytes) pairs to the email message, without touching disk.
+    """
+    for filename, data in attachments:
+        mime_parts = _MIME_PARTS.get(os.path.splitext(filename)[1][1:].lower())
+        message.attach(_mime_attachment(filename, base64.encodebytes(data).decode('ascii'), mime_parts))
+        if logger:
+            logger.info(f"Attached file: {filename}")
+
+
+def _mime_attachment(filename, payload, mime_parts):
+    """
+    Build a base64 MIME attachment part from an already-encoded payload.
+    """
+    attachment = MIMEBase(*(mime_parts or _DEFAULT_MIME_PARTS))  # Fallback MIME type
+    attachment.set_payload(payload)
+    attachment['Content-Transfer-Encoding'] = 'base64'
+    attachment.add_header('Content-Disposition', 'attachment', filename=filename)
+    return attachment
+
+
 _SMTP_MAX_RETRIES = 2
 _SMTP_RETRY_DELAY = 3  # seconds
 
+# One authenticated connection is kept open between sends, so further emails in a
+# run skip the TLS handshake and login. It is NOOP-checked before reuse and not
+# reused after sitting idle, since providers drop idle sessions after a few minutes.
+_SMTP_IDLE_TIMEOUT = 60  # seconds
+_smtp_lock = threading.Lock()
+_smtp_conn = None
+_smtp_key = None
+_smtp_last_used = 0.0
+
+
+def _smtp_connection(smtp_host, smtp_port, sender_email, app_password):
+    """
+    Return an authenticated SMTP connection, reusing the kept-alive one while it still answers.
+    Must be called with _smtp_lock held.
+    """
+    global _smtp_conn, _smtp_key
+    key = (smtp_host, smtp_port, sender_email, app_password)
+    if _smtp_conn is not None:
+        if _smtp_key == key and time.monotonic() - _smtp_last_used < _SMTP_IDLE_TIMEOUT:
+            try:
+                if _smtp_conn.noop()[0] == 250:
+                    return _smtp_conn
+            except (smtplib.SMTPException, OSError):
+                pass
+        close_smtp_connection()
+
+    server = smtplib.SMTP_SSL(smtp_host, smtp_port)
+    try:
+        server.login(sender_email, app_password)
+    except Exception:
+        server.close()
+        raise
+    _smtp_conn, _smtp_key = server, key
+    return server
+
+
+def close_smtp_connection():
+    """
+    Quit the kept-alive SMTP connection, if any. Runs automatically at exit.
+    """
+    global _smtp_conn
+    server, _smtp_conn = _smtp_conn, None
+    if server is not None:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+atexit.register(close_smtp_connection)
+
 
 def send_via_smtp(sender_email, app_password, receiver_emails, message, logger=None,
                   smtp_host='smtp.gmail.com', smtp_port=465):
     """
     Send the email via SMTP with retry on transient failures.
+    The connection is kept open afterwards for the next email.
     """
+    global _smtp_last_used
     last_error = None
     for attempt in range(1, _SMTP_MAX_RETRIES + 1):
         try:
-            with smtplib.SMTP_SSL(smtp_host, smtp_port) as server:
-                server.login(sender_email, app_password)
-                server.sendmail(sender_email, receiver_emails, message.as_string())
+            with _smtp_lock:
+                try:
+                    server = _smtp_connection(smtp_host, smtp_port, sender_email, app_password)
+                    server.send_message(message, from_addr=sender_email, to_addrs=receiver_emails)
+                except Exception:
+                    # Never reuse a connection left in an unknown state
+                    close_smtp_connection()
+                    raise
+                _smtp_last_used = time.monotonic()
 
             if logger:
                 logger.info(f"Email sent successfully to: {', '.join(receiver_emails)}")
             return
-
         except smtplib.SMTPException as e:
             last_error = e
             if attempt < _SMTP_MAX_RETRIES:
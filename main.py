@@ -15,49 +15,49 @@ handles both one-off CLI invocations and scheduled recurring runs.
 """
 
 import atexit
+import bisect
 import contextlib
+import fcntl
+import functools
+import hashlib
+import json
 import logging
 import os
 import signal
+import sqlite3
 import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 
-from colorama import init
-
+# ─── Internal Module Imports ────────────────────────────────────────────────
+# Modules that pull in heavy dependencies (telebot, paramiko, cryptography) are
+# imported inside the branches that use them, so --status, --show-setup and
+# --dry-run start without loading them.
 from banner.banner_show import print_banner
-from bot.BotHandler import TelegramBot
 from src.argparse_setup import setup_argparse, validate_args
-from src.config import extract_config_values
+from src.config import extract_config_values, parse_time_of_day
 from src.db_sync import perform_db_backup
 from src.dedup import deduplicate_backup_dirs
 from src.email_notify import send_smtp_email
-from src.encryption import encrypt_directory
+from src.fileindex import FileIndex
 from src.heartbeat import send_heartbeat
-
-# ─── Internal Module Imports ────────────────────────────────────────────────
 from src.logger import AppLogger
-from src.manifest import BackupManifest, load_latest_manifest
-from src.restore import restore_backup
+from src.manifest import BackupManifest, is_manifest_name, load_manifest_summary, replicate_manifest
 from src.retention import cleanup_old_backups
 from src.s3_sync import sync_to_s3
 from src.snapshot import create_snapshot, diff_snapshots, generate_restore_script
-from src.sync import (
-    perform_differential_backup,
-    perform_full_backup,
-    perform_incremental_backup,
-    sync_ssh_servers_concurrently,
-)
 from src.tailscale import tailscale_down, tailscale_up
 from src.utils import (
     get_last_backup_time,
     get_last_full_backup_time,
+    human_size,
     run_hook,
     update_last_backup_time,
     update_last_full_backup_time,
 )
-from src.verify import print_verify_report, verify_backup_integrity
 from src.webhook_notify import send_webhook
 
 # ─── Project Paths ──────────────────────────────────────────────────────────
@@ -65,70 +65,65 @@ _PROJECT_ROOT = Path(__file__).parent
 CONFIG_PATH = str(_PROJECT_ROOT / "config" / "config.ini")
 LOG_PATH = str(_PROJECT_ROOT / "Logs" / "application.log")
 LOCK_FILE = _PROJECT_ROOT / ".backup-handler.lock"
+FILE_INDEX_PATH = _PROJECT_ROOT / ".cache" / "fileindex.db"
+STATUS_CACHE_PATH = _PROJECT_ROOT / ".cache" / "status.json"
 
 
 # ─── Instance Locking ───────────────────────────────────────────────────────
 
 
-def _proc_looks_like_backup_handler(pid: int) -> bool:
-    """
-    Confirm that a PID corresponds to a backup-handler process.
-
-    PIDs are recycled by the OS. A stale lock file can point at an
-    unrelated process that happens to share the old PID. Cross-check
-    ``/proc/<pid>/comm`` and ``/proc/<pid>/cmdline`` before trusting it.
-    Returns True only when the process's identifiers reference python or
-    the backup-handler entry point.
-    """
-    comm = Path(f"/proc/{pid}/comm")
-    cmdline = Path(f"/proc/{pid}/cmdline")
-    try:
-        comm_value = comm.read_text().strip().lower() if comm.exists() else ""
-        cmdline_value = cmdline.read_text().replace("\x00", " ").lower() if cmdline.exists() else ""
-    except OSError:
-        return False
-    hints = ("python", "backup-handler", "main.py")
-    return any(h in comm_value or h in cmdline_value for h in hints)
+_LOCK_FD = None
 
 
 def _acquire_lock(logger):
     """
-    Acquire a PID lock file to prevent duplicate scheduled instances.
-
-    Checks if an existing lock file references a still-running backup-handler
-    process. Stale lock files (from crashed instances or recycled PIDs) are
-    automatically cleaned up. Registers ``_release_lock`` via ``atexit``.
+    Take an exclusive ``flock`` lock on the PID file to prevent duplicate
+    scheduled instances.
+
+    The lock is held on an open descriptor for the life of the process, so
+    the kernel drops it automatically when the process exits or is killed.
+    ``flock`` rather than ``lockf``: POSIX record locks are released when
+    *any* descriptor for the file is closed, e.g. by something merely
+    reading the PID.
+    There are no stale locks to detect and no PID-reuse races. The file
+    records the holder's PID for operators. Registers ``_release_lock`` via
+    ``atexit``.
     """
-    if LOCK_FILE.exists():
+    global _LOCK_FD
+    while True:
+        fd = os.open(str(LOCK_FILE), os.O_CREAT | os.O_RDWR, 0o644)
         try:
-            old_pid = int(LOCK_FILE.read_text().strip())
-            os.kill(old_pid, 0)
-        except (ValueError, ProcessLookupError, PermissionError):
-            logger.warning("Removing stale lock file (PID in file no longer running).")
-        else:
-            if _proc_looks_like_backup_handler(old_pid):
-                logger.error(
-                    f"Another backup-handler instance is already running (PID {old_pid}). "
-                    f"Remove {LOCK_FILE} if this is incorrect."
-                )
-                sys.exit(1)
-            logger.warning(
-                f"Lock file references PID {old_pid} but that process is not "
-                f"backup-handler (likely recycled). Reclaiming the lock."
-            )
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            holder = os.read(fd, 32).decode(errors="replace").strip() or "unknown"
+            os.close(fd)
+            logger.error(f"Another backup-handler instance is already running (PID {holder}).")
+            sys.exit(1)
+        # A previous holder may have unlinked the file between our open and
+        # lock; only a lock on the inode currently at LOCK_FILE counts
+        try:
+            if os.fstat(fd).st_ino == os.stat(LOCK_FILE).st_ino:
+                break
+        except FileNotFoundError:
+            pass
+        os.close(fd)
 
-    LOCK_FILE.write_text(str(os.getpid()))
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    _LOCK_FD = fd
     atexit.register(_release_lock)
 
 
 def _release_lock():
-    """Remove the PID lock file on exit."""
+    """Remove the PID lock file and release the lock on exit."""
+    global _LOCK_FD
+    if _LOCK_FD is None:
+        return
     with contextlib.suppress(OSError):
         LOCK_FILE.unlink(missing_ok=True)
-
-
-# Initialize colorama with autoreset to ensure color codes are reset after each print
-init(autoreset=True)
+    with contextlib.suppress(OSError):
+        os.close(_LOCK_FD)
+    _LOCK_FD = None
 
 
 # ─── Configuration Resolution ───────────────────────────────────────────────
@@ -141,24 +136,141 @@ def _resolve_config_path(args):
     Priority: ``--profile`` > ``--config`` > default ``config/config.ini``.
     Profiles resolve to ``config/config.<name>.ini``.
     """
-    if args.profile:
-        profile_path = str(_PROJECT_ROOT / "config" / f"config.{args.profile}.ini")
-        if not os.path.exists(profile_path):
+    return _resolve_config_path_cached(args.profile, args.config)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_config_path_cached(profile, config):
+    if profile:
+        profile_path = _PROJECT_ROOT / "config" / f"config.{profile}.ini"
+        if not profile_path.is_file():
             print(f"Error: Profile config not found: {profile_path}", file=sys.stderr)
             sys.exit(1)
-        return profile_path
-    if args.config and os.path.exists(args.config):
-        return args.config
+        return str(profile_path)
+    if config and Path(config).is_file():
+        return config
     return CONFIG_PATH
 
 
+def _load_config_values(logger, config_path):
+    """
+    Load config values without validation, falling back to an empty dict.
+
+    Used by commands that only read optional settings (status, verify,
+    restore, one-off backups), so each invocation parses the file once.
+    """
+    try:
+        return extract_config_values(logger, config_path, skip_validation=True)
+    except Exception:
+        return {}
+
+
+def _config_mtime(config_path):
+    """Return the config file's modification time in ns, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(config_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _config_digest(config_path):
+    """Return a BLAKE2b digest of the config file's contents, or None if it cannot be read."""
+    try:
+        return hashlib.blake2b(Path(config_path).read_bytes(), digest_size=16).digest()
+    except OSError:
+        return None
+
+
 # ─── Status Dashboard ───────────────────────────────────────────────────────
 
 
-def show_status(logger, config_path):
+_STATUS_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _write_status_cache(config_path, config_values):
+    """
+    Save the config fields the status dashboard uses, keyed by the config file's mtime.
+
+    Lets ``--status`` skip parsing config.ini until the file changes.
+    Failures are ignored; the dashboard simply parses the config instead.
+    """
+    mtime = _config_mtime(config_path)
+    if mtime is None:
+        return
+    data = {
+        "config_path": str(config_path),
+        "config_mtime_ns": mtime,
+        "schedule_times": config_values.get("schedule_times", []),
+        "backup_dirs": config_values.get("backup_dirs", []),
+    }
+    tmp_path = STATUS_CACHE_PATH.with_name(f"{STATUS_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        STATUS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, STATUS_CACHE_PATH)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
+
+def _read_status_cache(config_path):
+    """Return the cached status fields, or None if absent or stale for ``config_path``."""
+    try:
+        cached = json.loads(STATUS_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if cached.get("config_path") != str(config_path):
+        return None
+    if cached.get("config_mtime_ns") != _config_mtime(config_path):
+        return None
+    return cached
+
+
+def _scan_backup_dir(root):
+    """
+    Walk a backup directory once, returning ``(total_size, latest_manifest)``.
+
+    ``total_size`` is the size in bytes of all regular files under ``root``;
+    ``latest_manifest`` is the path of the newest top-level manifest, or None.
+    Walks iteratively with ``os.scandir`` so file types come from the
+    directory listing itself and only regular files are stat'ed. Symlinks
+    are not followed; unreadable entries and directories are skipped.
+    """
+    total = 0
+    latest_name = None
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                            # Manifest names embed a sortable timestamp
+                            if (
+                                current is root
+                                and is_manifest_name(entry.name)
+                                and (latest_name is None or entry.name > latest_name)
+                            ):
+                                latest_name = entry.name
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total, os.path.join(root, latest_name) if latest_name else None
+
+
+def show_status(logger, config_path, config_values=None):
     """
     Display a backup status dashboard including last backup timestamps,
     scheduled times, backup directory sizes, and latest manifest summary.
+
+    ``config_values`` may be passed in when the caller has already loaded
+    the configuration; otherwise the status cache is used while it matches
+    the config file's mtime, and ``config_path`` is parsed only when it does not.
     """
     print("\n=== Backup Status ===\n")
 
@@ -167,20 +279,21 @@ def show_status(logger, config_path):
     last_full = get_last_full_backup_time()
 
     if last_backup:
-        print(f"Last backup:      {datetime.fromtimestamp(last_backup).strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Last backup:      {time.strftime(_STATUS_TIME_FORMAT, time.localtime(last_backup))}")
     else:
         print("Last backup:      Never")
 
     if last_full:
-        print(f"Last full backup: {datetime.fromtimestamp(last_full).strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Last full backup: {time.strftime(_STATUS_TIME_FORMAT, time.localtime(last_full))}")
     else:
         print("Last full backup: Never")
 
-    # Load config for schedule and backup dirs
-    try:
-        config_values = extract_config_values(logger, config_path, skip_validation=True)
-    except Exception:
-        config_values = {}
+    # Load config for schedule and backup dirs, from the status cache when it is current
+    if config_values is None:
+        config_values = _read_status_cache(config_path)
+    if config_values is None:
+        config_values = _load_config_values(logger, config_path)
+        _write_status_cache(config_path, config_values)
 
     # Scheduled times
     schedule_times = config_values.get("schedule_times", [])
@@ -193,20 +306,16 @@ def show_status(logger, config_path):
     backup_dirs = config_values.get("backup_dirs", [])
     if backup_dirs:
         print("\nBackup directories:")
+        # Scan the trees concurrently; the walk is bound by stat() latency, not CPU.
+        # One pass per directory yields both its size and its newest manifest.
+        existing = [bdir for bdir in backup_dirs if os.path.exists(bdir)]
+        scans = {}
+        if existing:
+            with ThreadPoolExecutor(max_workers=min(8, len(existing))) as executor:
+                scans = dict(zip(existing, executor.map(_scan_backup_dir, existing), strict=True))
         for bdir in backup_dirs:
-            bpath = Path(bdir)
-            if bpath.exists():
-                total_size = sum(f.stat().st_size for f in bpath.rglob("*") if f.is_file())
-                # Human-readable size
-                if total_size >= 1073741824:
-                    size_str = f"{total_size / 1073741824:.2f} GB"
-                elif total_size >= 1048576:
-                    size_str = f"{total_size / 1048576:.2f} MB"
-                elif total_size >= 1024:
-                    size_str = f"{total_size / 1024:.2f} KB"
-                else:
-                    size_str = f"{total_size} B"
-                print(f"  {bdir}: {size_str}")
+            if bdir in scans:
+                print(f"  {bdir}: {human_size(scans[bdir][0])}")
             else:
                 print(f"  {bdir}: (not found)")
 
@@ -215,7 +324,8 @@ def show_status(logger, config_path):
         print("\nLatest manifest:")
         found_manifest = False
         for bdir in backup_dirs:
-            manifest = load_latest_manifest(bdir)
+            latest = scans.get(bdir, (0, None))[1]
+            manifest = load_manifest_summary(latest) if latest else None
             if manifest:
                 found_manifest = True
                 print(f"  Directory: {bdir}")
@@ -225,11 +335,7 @@ def show_status(logger, config_path):
                 print(f"    Copied:    {manifest.get('files_copied', 0)} files")
                 print(f"    Skipped:   {manifest.get('files_skipped', 0)} files")
                 print(f"    Failed:    {manifest.get('files_failed', 0)} files")
-                total_bytes = manifest.get("total_bytes", 0)
-                if total_bytes >= 1048576:
-                    print(f"    Size:      {total_bytes / 1048576:.2f} MB")
-                else:
-                    print(f"    Size:      {total_bytes / 1024:.2f} KB")
+                print(f"    Size:      {human_size(int(manifest.get('total_bytes', 0)))}")
                 break
         if not found_manifest:
             print("  No manifests found")
@@ -240,12 +346,18 @@ def show_status(logger, config_path):
 # ─── Main Entry Point ───────────────────────────────────────────────────────
 
 
+def _log_level():
+    """Return the level named by ``BACKUP_HANDLER_LOG_LEVEL`` (e.g. ``DEBUG``), defaulting to INFO."""
+    level = logging.getLevelName(os.environ.get("BACKUP_HANDLER_LOG_LEVEL", "INFO").strip().upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
 def main():
     """CLI entry point — parses arguments, routes to the appropriate operation."""
     print_banner()
 
     # Set up logging using AppLogger
-    logger = AppLogger(LOG_PATH, logging.DEBUG).logger
+    logger = AppLogger(LOG_PATH, _log_level()).logger
     args = setup_argparse()
 
     # Validate the parsed arguments
@@ -261,10 +373,7 @@ def main():
 
     # Handle --verify early exit
     if args.verify:
-        try:
-            verify_config = extract_config_values(logger, config_path, skip_validation=True)
-        except Exception:
-            verify_config = {}
+        verify_config = _load_config_values(logger, config_path)
         backup_dirs = args.backup_dirs or verify_config.get("backup_dirs", [])
         if not backup_dirs:
             logger.error(
@@ -273,6 +382,8 @@ def main():
             sys.exit(1)
         enc_passphrase = verify_config.get("encryption_passphrase")
         enc_key_file = verify_config.get("encryption_key_file")
+        from src.verify import print_verify_report, verify_backup_integrity
+
         results = verify_backup_integrity(
             logger, backup_dirs, encryption_passphrase=enc_passphrase, encryption_key_file=enc_key_file
         )
@@ -322,14 +433,13 @@ def main():
     # Handle --restore early exit
     if args.restore:
         # Load config to get encryption/SSH/S3 params for restore
-        try:
-            restore_config = extract_config_values(logger, config_path, skip_validation=True)
-        except Exception:
-            restore_config = {}
+        restore_config = _load_config_values(logger, config_path)
         enc_passphrase = restore_config.get("encryption_passphrase")
         enc_key_file = restore_config.get("encryption_key_file")
 
         logger.info(f"Restoring from {args.from_dir} to {args.to_dir}")
+        from src.restore import restore_backup
+
         success = restore_backup(
             logger,
             args.from_dir,
@@ -355,6 +465,8 @@ def main():
     # Initialize TelegramBot if --notifications flag is used
     telegram_bot = None
     if args.notifications:
+        from bot.BotHandler import TelegramBot
+
         try:
             telegram_bot = TelegramBot(logger)
         except FileNotFoundError:
@@ -375,6 +487,10 @@ def main():
                 file=sys.stderr,
             )
             sys.exit(1)
+        except ValueError as e:
+            logger.error(f"Invalid bot_config.ini: {e}")
+            print(f"Error: Invalid config/bot_config.ini: {e}", file=sys.stderr)
+            sys.exit(1)
 
     # Use the provided receiver emails if notifications are enabled
     receiver_emails = args.receiver if args.notifications else None
@@ -413,6 +529,8 @@ def main():
             exclude_patterns=exclude_patterns,
             retain=args.retain,
             config_path=config_path,
+            # --show-setup prints the config itself; skip the extra parse
+            config_values=None if args.show_setup else _load_config_values(logger, config_path),
             encrypt=args.encrypt,
             dedup=args.dedup,
             tailscale=args.tailscale,
@@ -424,15 +542,58 @@ def main():
 
 # ─── Scheduled Mode ─────────────────────────────────────────────────────────
 
+# Upper bound on a single scheduler wait. The wait runs on the monotonic clock,
+# so re-checking the wall clock periodically bounds how late a run can fire
+# after a suspend/resume or a system clock change.
+_MAX_SCHEDULER_WAIT = 300  # seconds
+
+
+def _next_fire(schedule_minutes, now):
+    """
+    Return the next datetime strictly after ``now`` falling on one of the
+    sorted minutes-of-day in ``schedule_minutes``, or None if there are none.
+
+    A binary search finds the first scheduled minute after the current one;
+    past the last, the schedule wraps to its first minute tomorrow.
+    """
+    if not schedule_minutes:
+        return None
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    i = bisect.bisect_right(schedule_minutes, now.hour * 60 + now.minute)
+    if i < len(schedule_minutes):
+        return midnight + timedelta(minutes=schedule_minutes[i])
+    return midnight + timedelta(days=1, minutes=schedule_minutes[0])
+
+
+def _parse_schedule_times(logger, times):
+    """
+    Parse ``HH:MM`` strings into a sorted, de-duplicated list of minutes past
+    midnight, logging and skipping bad ones.
+    """
+    minutes = set()
+    for t in times:
+        minute = parse_time_of_day(t)
+        if minute is None:
+            logger.error(f"Time format error for value: {t}")
+            continue
+        minutes.add(minute)
+    return sorted(minutes)
+
+
+def _format_schedule(schedule_minutes):
+    """Render minutes past midnight back as ``HH:MM, HH:MM`` for logging."""
+    return ", ".join(f"{m // 60:02d}:{m % 60:02d}" for m in schedule_minutes)
+
 
 def scheduled_operation(logger, config_file, telegram_bot=None, exclude_patterns=None, retain=None):
     """
     Run backups on a configurable schedule with graceful shutdown support.
 
-    Acquires a PID lock to prevent duplicate instances, then enters a polling
-    loop that checks the current time against configured schedule times every
-    30 seconds (matching the ±30s tolerance window). Handles SIGINT/SIGTERM
-    for clean shutdown.
+    Acquires a PID lock to prevent duplicate instances, then sleeps until the
+    next configured schedule time and runs the backup, instead of polling.
+    SIGINT/SIGTERM wake the wait immediately for a clean shutdown. The config
+    file is re-parsed before a run only when its modification time and its
+    content hash have both changed, so a ``touch`` or a no-op save is free.
 
     Parameters:
         logger: Logger instance.
@@ -443,119 +604,198 @@ def scheduled_operation(logger, config_file, telegram_bot=None, exclude_patterns
     """
     _acquire_lock(logger)
 
-    # Handle SIGINT/SIGTERM for clean shutdown
-    _shutdown_requested = False
+    # Handle SIGINT/SIGTERM for clean shutdown; setting the event wakes the wait
+    shutdown_event = threading.Event()
 
     def _handle_shutdown(signum, frame):
-        nonlocal _shutdown_requested
         sig_name = signal.Signals(signum).name
         logger.info(f"Received {sig_name}, shutting down scheduler gracefully...")
-        _shutdown_requested = True
+        shutdown_event.set()
 
     signal.signal(signal.SIGINT, _handle_shutdown)
     signal.signal(signal.SIGTERM, _handle_shutdown)
 
     try:
         # Loading the config file (with schedule validation)
+        config_mtime = _config_mtime(config_file)
+        config_digest = _config_digest(config_file)
         config_values = extract_config_values(logger, config_file, require_schedule=True)
 
-        # Access the schedule times and interval
-        times = config_values.get("schedule_times", [])
-        config_values.get("interval_minutes", 60)
         # Ensure all times are in the correct format
-        scheduled_times = []
-        for t in times:
-            try:
-                scheduled_times.append(datetime.strptime(t, "%H:%M").time())
-            except ValueError:
-                logger.error(f"Time format error for value: {t}")
-                continue
-
-        # Use CLI exclude patterns if provided, otherwise use config
-        if exclude_patterns is None:
-            exclude_patterns = config_values.get("exclude_patterns", [])
-
-        logger.info(f"Scheduled times: {scheduled_times}")
-        while not _shutdown_requested:
-            now = datetime.now()
-            current_time = now.time()
-            logger.info(f"Current time: {current_time}")
-
-            # Check for matching scheduled time within a ±30 second tolerance
-            matched = False
-            for scheduled_time in scheduled_times:
-                scheduled_dt = now.replace(
-                    hour=scheduled_time.hour, minute=scheduled_time.minute, second=0, microsecond=0
-                )
-                diff = abs((now - scheduled_dt).total_seconds())
-                if diff <= 30:
-                    matched = True
+        schedule_minutes = _parse_schedule_times(logger, config_values.get("schedule_times", []))
+
+        logger.info(f"Scheduled times: {_format_schedule(schedule_minutes)}")
+        if not schedule_minutes:
+            logger.error("No valid schedule times configured; scheduler not started.")
+            return
+
+        # In webhook mode the daemon serves updates for as long as it runs
+        if telegram_bot is not None and telegram_bot.mode == "webhook":
+            telegram_bot.start_polling()
+
+        while not shutdown_event.is_set():
+            next_run = _next_fire(schedule_minutes, datetime.now())
+            logger.info(f"Next scheduled backup at {next_run:%Y-%m-%d %H:%M}")
+
+            # Sleep until the scheduled time, re-checking the wall clock at least
+            # every _MAX_SCHEDULER_WAIT seconds
+            while not shutdown_event.is_set():
+                remaining = (next_run - datetime.now()).total_seconds()
+                if remaining <= 0:
                     break
-            if matched:
-                logger.info("Scheduled time matched. Performing backup operation...")
-                # Pre-flight: verify backup directories are accessible
-                sched_backup_dirs = config_values.get("backup_dirs", [])
-                if sched_backup_dirs:
-                    inaccessible = _check_backup_dirs_accessible(logger, sched_backup_dirs)
-                    if inaccessible:
-                        msg = (
-                            f"Scheduled backup aborted: destination(s) inaccessible: "
-                            f"{', '.join(inaccessible)}. Check that the disk is mounted."
-                        )
-                        logger.error(msg)
-                        if telegram_bot:
-                            try:
-                                telegram_bot.send_notification(msg)
-                            except Exception as e:
-                                logger.error(f"Failed to send Telegram notification: {e}")
-                        time.sleep(30)
-                        continue
-                # Build operation_modes from config flags
-                operation_modes = []
-                if config_values.get("local_mode"):
-                    operation_modes.append("local")
-                if config_values.get("ssh_mode"):
-                    operation_modes.append("ssh")
-                if config_values.get("s3_mode"):
-                    operation_modes.append("s3")
-                if config_values.get("db_mode"):
-                    operation_modes.append("db")
-                rc = backup_operation(
-                    logger,
-                    source_dir=config_values["source_dir"],
-                    backup_dirs=config_values["backup_dirs"],
-                    ssh_servers=config_values.get("ssh_servers"),
-                    operation_modes=operation_modes,
-                    backup_mode=config_values["mode"],
-                    compress=config_values["compress_type"],
-                    receiver=config_values["receiver_emails"],
-                    notifications=bool(telegram_bot),
-                    telegram_bot=telegram_bot,
-                    ssh_username=config_values.get("ssh_username"),
-                    ssh_password=config_values.get("ssh_password"),
-                    exclude_patterns=exclude_patterns,
-                    retain=retain,
-                    config_path=None,
-                    config_values=config_values,
-                )
-                if rc:
-                    logger.error(f"Scheduled run returned exit code {rc}; scheduler continues.")
-            else:
-                logger.info("No scheduled time matched.")
-            # Wait for 30 seconds before checking again (matches tolerance window)
-            time.sleep(30)
+                shutdown_event.wait(min(remaining, _MAX_SCHEDULER_WAIT))
+            if shutdown_event.is_set():
+                break
+
+            # Pick up config edits made since the last load, without a restart
+            mtime = _config_mtime(config_file)
+            digest = _config_digest(config_file) if mtime != config_mtime else config_digest
+            if digest != config_digest:
+                try:
+                    new_values = extract_config_values(logger, config_file, require_schedule=True)
+                except (Exception, SystemExit) as e:
+                    # load_config/validate_config exit on bad input; keep the daemon alive
+                    logger.error(f"Config reload failed ({e}); keeping the previous configuration.")
+                else:
+                    config_values = new_values
+                    new_times = _parse_schedule_times(logger, config_values.get("schedule_times", []))
+                    schedule_minutes = new_times or schedule_minutes
+                    logger.info("Configuration changed on disk; reloaded.")
+                    config_digest = digest
+            config_mtime = mtime
+
+            logger.info("Scheduled time reached. Performing backup operation...")
+            # Pre-flight: verify backup directories are accessible
+            sched_backup_dirs = config_values.get("backup_dirs", [])
+            if sched_backup_dirs:
+                inaccessible = _check_backup_dirs_accessible(logger, sched_backup_dirs)
+                if inaccessible:
+                    msg = (
+                        f"Scheduled backup aborted: destination(s) inaccessible: "
+                        f"{', '.join(inaccessible)}. Check that the disk is mounted."
+                    )
+                    logger.error(msg)
+                    if telegram_bot:
+                        try:
+                            telegram_bot.send_notification(msg)
+                        except Exception as e:
+                            logger.error(f"Failed to send Telegram notification: {e}")
+                    continue
+            # Build operation_modes from config flags
+            operation_modes = []
+            if config_values.get("local_mode"):
+                operation_modes.append("local")
+            if config_values.get("ssh_mode"):
+                operation_modes.append("ssh")
+            if config_values.get("s3_mode"):
+                operation_modes.append("s3")
+            if config_values.get("db_mode"):
+                operation_modes.append("db")
+            rc = backup_operation(
+                logger,
+                source_dir=config_values["source_dir"],
+                backup_dirs=config_values["backup_dirs"],
+                ssh_servers=config_values.get("ssh_servers"),
+                operation_modes=operation_modes,
+                backup_mode=config_values["mode"],
+                compress=config_values["compress_type"],
+                receiver=config_values["receiver_emails"],
+                notifications=bool(telegram_bot),
+                telegram_bot=telegram_bot,
+                ssh_username=config_values.get("ssh_username"),
+                ssh_password=config_values.get("ssh_password"),
+                exclude_patterns=exclude_patterns,
+                retain=retain,
+                config_path=config_file,
+                config_values=config_values,
+            )
+            if rc:
+                logger.error(f"Scheduled run returned exit code {rc}; scheduler continues.")
 
         logger.info("Scheduler stopped cleanly.")
 
     except Exception as e:
         logger.error(f"Error in scheduled_operation: {e}")
         sys.exit(1)
+    finally:
+        if telegram_bot is not None:
+            telegram_bot.stop_webhook()
 
 
 # ─── Notification Helpers ───────────────────────────────────────────────────
 
 
-def _notify(logger, telegram_bot, notifications, message, config_values=None):
+class _NotificationBatch:
+    """
+    Collects the notifications of one backup run so they go out as one message per channel.
+
+    Each Telegram, webhook or SMTP send is a network round trip of its own,
+    which on small, frequent runs can take longer than the backup itself.
+    Modes run on worker threads, so appends are locked.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._messages = []
+        self._target = None
+
+    def add(self, logger, telegram_bot, notifications, message, config_values):
+        with self._lock:
+            self._messages.append(message)
+            self._target = (logger, telegram_bot, notifications, config_values)
+
+    def flush(self):
+        """Send all pending messages as one bulleted message and clear the batch."""
+        with self._lock:
+            messages, target = self._messages, self._target
+            self._messages = []
+        if not messages:
+            return
+        logger, telegram_bot, notifications, config_values = target
+        text = messages[0] if len(messages) == 1 else "\n".join(f"• {m}" for m in messages)
+        _dispatch_notification(logger, telegram_bot, notifications, text, config_values)
+
+
+# Batch of the backup_operation run in progress, if any
+_active_notification_batch = None
+
+
+def _batched_notifications(func):
+    """Decorator: batch every ``_notify`` made during ``func`` and send the batch when it returns."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _active_notification_batch
+        if _active_notification_batch is not None:
+            return func(*args, **kwargs)
+        batch = _active_notification_batch = _NotificationBatch()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _active_notification_batch = None
+            batch.flush()
+
+    return wrapper
+
+
+def _notify(logger, telegram_bot, notifications, message, config_values=None, urgent=False):
+    """
+    Send a notification, or queue it while a batched ``backup_operation`` is running.
+
+    Queued messages go out together when the run ends. ``urgent`` messages
+    (failures, aborts) flush the queue and are sent immediately, so
+    problems are reported promptly and in order.
+    """
+    batch = _active_notification_batch
+    if batch is None or urgent:
+        if batch is not None:
+            batch.flush()
+        _dispatch_notification(logger, telegram_bot, notifications, message, config_values)
+    else:
+        batch.add(logger, telegram_bot, notifications, message, config_values)
+
+
+def _dispatch_notification(logger, telegram_bot, notifications, message, config_values=None):
     """
     Dispatch notifications via all configured channels (Telegram and SMTP).
 
@@ -631,6 +871,7 @@ def _run_backup(logger, telegram_bot, notifications, mode_name, backup_fn, confi
             notifications,
             f"{mode_name.capitalize()} backup failed.",
             config_values=config_values,
+            urgent=True,
         )
         return False
 
@@ -673,6 +914,27 @@ def _check_backup_dirs_accessible(logger, backup_dirs):
 # ─── Core Backup Pipeline ───────────────────────────────────────────────────
 
 
+@contextlib.contextmanager
+def _open_file_index(logger):
+    """
+    Open the persistent file index for an incremental/differential run.
+
+    Yields None (and the run simply copies by timestamp) if the index cannot
+    be opened, since it is only an optimization.
+    """
+    try:
+        file_index = FileIndex(FILE_INDEX_PATH)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"File index unavailable, not skipping already-copied files: {e}")
+        yield None
+        return
+    try:
+        yield file_index
+    finally:
+        file_index.close()
+
+
+@_batched_notifications
 def backup_operation(
     logger,
     source_dir=None,
@@ -726,14 +988,8 @@ def backup_operation(
         return 0
 
     # Load config values if not provided (for hooks, retention, parallel, bandwidth, S3)
-    if config_values is None and config_path:
-        try:
-            config_values = extract_config_values(logger, config_path, skip_validation=True)
-        except Exception:
-            config_values = {}
-
     if config_values is None:
-        config_values = {}
+        config_values = _load_config_values(logger, config_path) if config_path else {}
 
     # Use config exclude patterns if CLI didn't provide them
     if exclude_patterns is None:
@@ -748,9 +1004,21 @@ def backup_operation(
                 f"Check that the disk is mounted."
             )
             logger.error(msg)
-            _notify(logger, telegram_bot, notifications, msg, config_values=config_values)
+            _notify(logger, telegram_bot, notifications, msg, config_values=config_values, urgent=True)
             return 2
 
+    # Pre-flight: compression only applies to full local backups. Checked before
+    # any mode starts, since local, SSH and S3 run side by side.
+    if (
+        compress
+        and backup_mode in ("incremental", "differential")
+        and "local" in (operation_modes or [])
+        and backup_dirs
+        and not dry_run
+    ):
+        logger.error(f"Invalid option for {backup_mode} backup: --compress requires a full backup.")
+        return 2
+
     # Hooks
     pre_hook = config_values.get("pre_backup_hook")
     post_hook = config_values.get("post_backup_hook")
@@ -759,8 +1027,9 @@ def backup_operation(
     max_age_days = config_values.get("max_age_days", 0)
     max_count = retain if retain is not None else config_values.get("max_count", 0)
 
-    # Parallel copies
+    # Parallel copies and copy verification
     parallel_copies = config_values.get("parallel_copies", 1)
+    verify_copies = config_values.get("verify_copies", True)
 
     # Bandwidth limit
     bandwidth_limit = config_values.get("bandwidth_limit", 0)
@@ -781,6 +1050,7 @@ def backup_operation(
             notifications,
             "Backup aborted: pre-backup hook failed.",
             config_values=config_values,
+            urgent=True,
         )
         return 2
 
@@ -794,7 +1064,8 @@ def backup_operation(
     # Execute selected backup modes
     if operation_modes is None:
         operation_modes = []
-    if "local" in operation_modes:
+
+    def _local_mode():
         if not backup_dirs:
             logger.warning("Local mode selected but no backup directories specified. Skipping local backup.")
         elif dry_run:
@@ -809,52 +1080,60 @@ def backup_operation(
             if exclude_patterns:
                 print(f"  Excluding:   {', '.join(exclude_patterns)}")
         elif backup_mode == "incremental":
-            if compress:
-                logger.error("Invalid option for incremental backup.")
-                sys.exit(1)
+            from src.sync import perform_incremental_backup
+
             last_backup_time = get_last_backup_time()
-            if not _run_backup(
-                logger,
-                telegram_bot,
-                notifications,
-                "incremental",
-                lambda: perform_incremental_backup(
+            with _open_file_index(logger) as file_index:
+                if not _run_backup(
                     logger,
-                    source_dir,
-                    backup_dirs,
-                    last_backup_time,
-                    bot=telegram_bot,
-                    receiver_emails=receiver,
-                    exclude_patterns=exclude_patterns,
-                    manifest=manifest,
-                ),
-                config_values=config_values,
-            ):
-                mode_failures.append("local-incremental")
+                    telegram_bot,
+                    notifications,
+                    "incremental",
+                    lambda: perform_incremental_backup(
+                        logger,
+                        source_dir,
+                        backup_dirs,
+                        last_backup_time,
+                        bot=telegram_bot,
+                        receiver_emails=receiver,
+                        exclude_patterns=exclude_patterns,
+                        manifest=manifest,
+                        file_index=file_index,
+                        verify=verify_copies,
+                        parallel_copies=parallel_copies,
+                    ),
+                    config_values=config_values,
+                ):
+                    mode_failures.append("local-incremental")
         elif backup_mode == "differential":
-            if compress:
-                logger.error("Invalid option for differential backup.")
-                sys.exit(1)
+            from src.sync import perform_differential_backup
+
             last_full_backup_time = get_last_full_backup_time()
-            if not _run_backup(
-                logger,
-                telegram_bot,
-                notifications,
-                "differential",
-                lambda: perform_differential_backup(
+            with _open_file_index(logger) as file_index:
+                if not _run_backup(
                     logger,
-                    source_dir,
-                    backup_dirs,
-                    last_full_backup_time,
-                    bot=telegram_bot,
-                    receiver_emails=receiver,
-                    exclude_patterns=exclude_patterns,
-                    manifest=manifest,
-                ),
-                config_values=config_values,
-            ):
-                mode_failures.append("local-differential")
+                    telegram_bot,
+                    notifications,
+                    "differential",
+                    lambda: perform_differential_backup(
+                        logger,
+                        source_dir,
+                        backup_dirs,
+                        last_full_backup_time,
+                        bot=telegram_bot,
+                        receiver_emails=receiver,
+                        exclude_patterns=exclude_patterns,
+                        manifest=manifest,
+                        file_index=file_index,
+                        verify=verify_copies,
+                        parallel_copies=parallel_copies,
+                    ),
+                    config_values=config_values,
+                ):
+                    mode_failures.append("local-differential")
         else:
+            from src.sync import perform_full_backup
+
             _notify(
                 logger, telegram_bot, notifications, "Starting full backup...", config_values=config_values
             )
@@ -873,6 +1152,7 @@ def backup_operation(
                     exclude_patterns=exclude_patterns,
                     manifest=manifest,
                     parallel_copies=parallel_copies,
+                    verify=verify_copies,
                 ),
                 config_values=config_values,
             ):
@@ -887,9 +1167,9 @@ def backup_operation(
     ts_tags = config_values.get("tailscale_advertise_tags")
     ts_accept_routes = config_values.get("tailscale_accept_routes", False)
     ts_disconnect_after = config_values.get("tailscale_disconnect_after", False)
-    _ts_brought_up = False
 
-    if operation_modes and ("ssh" in operation_modes):
+    def _ssh_mode():
+        _ts_brought_up = False
         if not ssh_servers:
             logger.warning("SSH mode selected but no SSH servers specified. Skipping SSH backup.")
         elif dry_run:
@@ -900,6 +1180,8 @@ def backup_operation(
                     f"[DRY RUN] Would connect via Tailscale VPN (auth_key: {'set' if ts_auth_key else 'not set'})"
                 )
         else:
+            from src.sync import sync_ssh_servers_concurrently
+
             # Bring up Tailscale before SSH if enabled
             if ts_enabled:
                 if not ts_auth_key:
@@ -913,6 +1195,7 @@ def backup_operation(
                         notifications,
                         "SSH backup aborted: Tailscale auth key missing.",
                         config_values=config_values,
+                        urgent=True,
                     )
                     mode_failures.append("ssh")
                 else:
@@ -931,6 +1214,7 @@ def backup_operation(
                             notifications,
                             "SSH backup aborted: Tailscale connection failed.",
                             config_values=config_values,
+                            urgent=True,
                         )
                         mode_failures.append("ssh")
 
@@ -965,7 +1249,12 @@ def backup_operation(
                 except Exception as e:
                     logger.error(f"SSH backup failed: {e}")
                     _notify(
-                        logger, telegram_bot, notifications, "SSH backup failed.", config_values=config_values
+                        logger,
+                        telegram_bot,
+                        notifications,
+                        "SSH backup failed.",
+                        config_values=config_values,
+                        urgent=True,
                     )
                     mode_failures.append("ssh")
                 finally:
@@ -973,7 +1262,7 @@ def backup_operation(
                     if ts_enabled and _ts_brought_up and ts_disconnect_after:
                         tailscale_down(logger=logger)
 
-    if operation_modes and ("s3" in operation_modes):
+    def _s3_mode():
         if not s3_bucket:
             logger.warning("S3 mode selected but no bucket configured. Skipping S3 backup.")
         elif dry_run:
@@ -1003,9 +1292,32 @@ def backup_operation(
                 )
             except Exception as e:
                 logger.error(f"S3 backup failed: {e}")
-                _notify(logger, telegram_bot, notifications, "S3 backup failed.", config_values=config_values)
+                _notify(
+                    logger,
+                    telegram_bot,
+                    notifications,
+                    "S3 backup failed.",
+                    config_values=config_values,
+                    urgent=True,
+                )
                 mode_failures.append("s3")
 
+    # Local, SSH and S3 write to disjoint destinations and block on different
+    # resources (disk, SSH, HTTPS), so run them side by side. Dry runs stay
+    # sequential so the printed plan is not interleaved.
+    mode_tasks = [
+        task
+        for name, task in (("local", _local_mode), ("ssh", _ssh_mode), ("s3", _s3_mode))
+        if name in operation_modes
+    ]
+    if dry_run or len(mode_tasks) < 2:
+        for task in mode_tasks:
+            task()
+    else:
+        with ThreadPoolExecutor(max_workers=len(mode_tasks)) as executor:
+            for future in [executor.submit(task) for task in mode_tasks]:
+                future.result()
+
     if operation_modes and ("db" in operation_modes):
         db_database = config_values.get("db_database")
         if not db_database:
@@ -1040,6 +1352,7 @@ def backup_operation(
                         notifications,
                         "Database backup failed.",
                         config_values=config_values,
+                        urgent=True,
                     )
                     mode_failures.append("db")
             except Exception as e:
@@ -1050,6 +1363,7 @@ def backup_operation(
                     notifications,
                     "Database backup failed.",
                     config_values=config_values,
+                    urgent=True,
                 )
                 mode_failures.append("db")
 
@@ -1064,16 +1378,22 @@ def backup_operation(
             print("[DRY RUN] Would deduplicate identical files using hardlinks")
         logger.info("[DRY RUN] Complete. No files were modified.")
         print("\n[DRY RUN] Complete. No files were modified.")
+        manifest.close()
         return 0
 
-    # Save manifest to each backup directory
+    # Save the manifest once, then hardlink (or copy) it into the other backup directories
     if backup_dirs:
+        saved_manifest = None
         for bdir in backup_dirs:
             try:
-                manifest_path = manifest.save(bdir)
+                if saved_manifest is None:
+                    manifest_path = saved_manifest = manifest.save(bdir)
+                else:
+                    manifest_path = replicate_manifest(saved_manifest, bdir)
                 logger.info(f"Backup manifest saved to {manifest_path}")
             except Exception as e:
                 logger.error(f"Failed to save manifest to {bdir}: {e}")
+    manifest.close()
 
     # Warn about compression + encryption interaction
     if compress and compress != "none":
@@ -1096,6 +1416,8 @@ def backup_operation(
         if not enc_passphrase and not enc_key_file:
             logger.error("Encryption enabled but no passphrase or key_file configured in [ENCRYPTION].")
         else:
+            from src.encryption import encrypt_directory
+
             for bdir in backup_dirs:
                 try:
                     count = encrypt_directory(
@@ -1128,6 +1450,10 @@ def backup_operation(
     if not mode_failures:
         update_last_backup_time()
 
+    # Refresh the status dashboard's cached view of the config
+    if config_path and config_values:
+        _write_status_cache(config_path, config_values)
+
     # Run retention cleanup
     if backup_dirs and (max_age_days > 0 or max_count > 0):
         cleanup_old_backups(logger, backup_dirs, max_age_days=max_age_days, max_count=max_count)
@@ -1145,6 +1471,7 @@ def backup_operation(
             notifications,
             f"Backup run finished with failures in: {failed_str}",
             config_values=config_values,
+            urgent=True,
         )
         return 3
 
@@ -75,8 +75,11 @@ def setup_argparse():
     parser.add_argument(
         "--compress",
         type=str,
-        choices=["zip", "zip_pw"],
-        help="Compress the source directory. Choices: 'zip' (normal zip), 'zip_pw' (password-protected zip)",
+        choices=["zip", "zip_pw", "zstd", "pigz"],
+        help=(
+            "Compress the source directory. Choices: 'zip' (normal zip), 'zip_pw' (password-protected zip), "
+            "'zstd' / 'pigz' (tarball compressed on all cores with zstd or pigz)"
+        ),
     )
 
     # Scheduling options
@@ -249,10 +252,10 @@ def validate_args(args, logger):
 
     # Validate email addresses if --receiver is provided
     if args.receiver:
-        for email in args.receiver:
-            if not is_valid_email(email):
-                logger.error(f"Invalid email address: {email}")
-                sys.exit(1)
+        invalid = [email for email in args.receiver if not is_valid_email(email)]
+        if invalid:
+            logger.error(f"Invalid email address(es): {', '.join(invalid)}")
+            sys.exit(1)
 
     # --verify is mutually exclusive with --scheduled and --backup-mode
     if args.verify and (args.scheduled or args.backup_mode or args.restore):
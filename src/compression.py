@@ -1,6 +1,12 @@
+import contextlib
 import io
+import multiprocessing
 import os
 import shutil
+import subprocess
+import tarfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 import keyring
@@ -8,6 +14,16 @@ import pyminizip
 
 from email_nots.email import send_email
 
+# DEFLATE level for ZIP archives: zlib's default, the usual speed/ratio sweet spot
+_ZIP_LEVEL = 6
+
+# Parallel compressors for tar archives: (executable, arguments, archive suffix).
+# Both compress on every core; the tar stream is piped into them.
+_TAR_COMPRESSORS = {
+    "zstd": ("zstd", ["-T0", "-q", "-c"], ".tar.zst"),
+    "pigz": ("pigz", ["-c"], ".tar.gz"),
+}
+
 
 def save_file_passwd(logger, timestamp, passwd):
     try:
@@ -18,11 +34,23 @@ def save_file_passwd(logger, timestamp, passwd):
 
 
 def compress_directory(
-    logger, src_dirs=None, output_dirs=None, password=None, bot_handler=None, receiver_emails=None
+    logger,
+    src_dirs=None,
+    output_dirs=None,
+    password=None,
+    bot_handler=None,
+    receiver_emails=None,
+    workers=1,
 ):
     """
     Compress multiple source directories into ZIP files with optional password protection.
     The output ZIP files will be saved in the corresponding output directories.
+    Each source is compressed once; the archive is then hardlinked (or copied)
+    into the remaining output directories under the same name and password.
+
+    DEFLATE is single-threaded and CPU-bound, so with ``workers`` > 1 and
+    several sources the archives are built in parallel worker processes.
+    All archives of one call share a timestamp (and so one stored password).
 
     Parameters:
     - logger (logging.Logger): The logger instance to use for logging messages.
@@ -31,45 +59,198 @@ def compress_directory(
     - password (str, optional): If provided, the ZIP files will be encrypted with this password.
     - bot_handler (TelegramBot, optional): The instance of the TelegramBot to send the document.
     - receiver_emails (list of str, optional): List of email addresses to receive the password via email.
+    - workers (int, optional): Maximum number of sources compressed at once (default 1).
     """
     if src_dirs is None or output_dirs is None:
         logger.error("Source and output directories must be provided.")
         return
+    if not output_dirs:
+        return
+
+    # Compress each source once into the first output directory, then replicate the archive
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    jobs = []
+    for index, src_dir in enumerate(src_dirs):
+        suffix = f"_{index + 1}" if index else ""
+        jobs.append((src_dir, os.path.join(output_dirs[0], f"backup_{timestamp}{suffix}.zip")))
+
+    workers = min(workers, len(jobs))
+    if workers > 1:
+        # Spawned, not forked: the caller may be one of several backup-mode threads
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [pool.submit(_write_zip, src_dir, output_zip, password) for src_dir, output_zip in jobs]
+            errors = [future.exception() for future in futures]
+    else:
+        errors = [_exception_of(_write_zip, src_dir, output_zip, password) for src_dir, output_zip in jobs]
+
+    compressed = False
+    for (src_dir, output_zip), error in zip(jobs, errors, strict=True):
+        if error is not None:
+            logger.error(f"Failed to compress directory '{src_dir}' to '{output_zip}': {error}")
+            continue
+        protection = "with" if password else "without"
+        logger.info(f"Compressed directory '{src_dir}' to '{output_zip}' {protection} password protection")
+        try:
+            _replicate_archive(logger, output_zip, output_dirs[1:])
+        except OSError as e:
+            logger.error(f"Failed to replicate '{output_zip}': {e}")
+        compressed = True
+
+    if compressed and password:
+        save_file_passwd(logger, timestamp, password)
+
+        # Send password via bot if enabled (pass password directly)
+        if bot_handler:
+            _send_password_via_bot(logger, bot_handler, timestamp, password)
+
+        # Send password via email if enabled (pass password directly)
+        if receiver_emails:
+            _send_password_via_email(logger, receiver_emails, timestamp, password)
+
+
+def _exception_of(func, *args):
+    """Call ``func(*args)`` and return the exception it raised, or None."""
+    try:
+        func(*args)
+    except Exception as e:
+        return e
+    return None
+
+
+def _iter_tree(root):
+    """
+    Yield ``(path, is_dir)`` for everything below ``root``, depth-first, as it is scanned.
+
+    Only regular files (or symlinks to them) and real directories are yielded,
+    as with ``shutil.make_archive``: dangling symlinks, FIFOs, sockets and
+    devices are skipped, and symlinked directories are neither listed nor followed.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield entry.path, True
+                yield from _iter_tree(entry.path)
+            elif entry.is_file():
+                yield entry.path, False
+
+
+def _write_zip(src_dir, output_zip, password=None):
+    """
+    Write ``src_dir`` to ``output_zip`` with paths relative to it, from a single scan.
+
+    Files are added whole from disk at DEFLATE level 6: through ``pyminizip``
+    (ZipCrypto) when a password is given, otherwise through ``zipfile``,
+    which, like ``shutil.make_archive``, also records directory entries.
+    Password-protected archives keep each file's directory in its name
+    (``sub/file.txt``) rather than storing every file flat under its
+    basename. The ``zipfile`` path streams entries while the tree is still
+    being scanned.
+    """
+    if not os.path.isdir(src_dir):
+        raise FileNotFoundError(f"Source directory not found: {src_dir}")
+
+    if password:
+        # pyminizip takes the whole file list at once; the prefix is each file's directory in the archive
+        files = [path for path, is_dir in _iter_tree(src_dir) if not is_dir]
+        prefixes = [os.path.dirname(os.path.relpath(f, src_dir)) for f in files]
+        pyminizip.compress_multiple(files, prefixes, output_zip, password, _ZIP_LEVEL)
+        return
 
-    for src_dir in src_dirs:
-        files = []
-        for root, _dirs, file_list in os.walk(src_dir):
-            for file in file_list:
-                files.append(os.path.join(root, file))
+    with zipfile.ZipFile(output_zip, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=_ZIP_LEVEL) as zf:
+        for path, _ in _iter_tree(src_dir):
+            zf.write(path, os.path.relpath(path, src_dir))
 
-        for output_dir in output_dirs:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_zip = os.path.join(output_dir, f"backup_{timestamp}.zip")
 
-            try:
-                if password:
-                    pyminizip.compress_multiple(files, [], output_zip, password, 5)
-                    logger.info(
-                        f"Compressed directory '{src_dir}' to '{output_zip}' with password protection"
-                    )
+def _replicate_archive(logger, archive_path, output_dirs):
+    """
+    Place a finished archive in further output directories without compressing again.
 
-                    save_file_passwd(logger, timestamp, password)
-                else:
-                    shutil.make_archive(output_zip[:-4], "zip", src_dir)
-                    logger.info(
-                        f"Compressed directory '{src_dir}' to '{output_zip}' without password protection"
-                    )
+    Hardlinks when the directories share a filesystem and copies otherwise.
+    Later steps (encryption, retention) replace or unlink archives rather
+    than rewriting them in place, so linked copies stay independent.
+    """
+    name = os.path.basename(archive_path)
+    for output_dir in output_dirs:
+        target = os.path.join(output_dir, name)
+        try:
+            os.link(archive_path, target)
+        except OSError:
+            # Cross-device, unsupported, or already present: fall back to a copy
+            shutil.copyfile(archive_path, target)
+        logger.info(f"Replicated '{archive_path}' to '{target}'")
 
-                # Send password via bot if enabled (pass password directly)
-                if bot_handler and password:
-                    _send_password_via_bot(logger, bot_handler, timestamp, password)
 
-                # Send password via email if enabled (pass password directly)
-                if receiver_emails and password:
-                    _send_password_via_email(logger, receiver_emails, timestamp, password)
+def _add_tree(tar, src_dir):
+    """Add the contents of ``src_dir`` to ``tar`` with paths relative to it, like the ZIP archives."""
+    for name in sorted(os.listdir(src_dir)):
+        tar.add(os.path.join(src_dir, name), arcname=name)
 
-            except Exception as e:
-                logger.error(f"Failed to compress directory '{src_dir}' to '{output_zip}': {e}")
+
+def compress_directory_tar(logger, src_dirs=None, output_dirs=None, codec="zstd"):
+    """
+    Archive multiple source directories as tarballs compressed on all CPU cores.
+    The archives will be saved in the corresponding output directories.
+
+    The tar stream is piped straight into ``zstd -T0`` (``.tar.zst``) or
+    ``pigz`` (``.tar.gz``), so archiving and compression run as one streamed
+    pass with no intermediate tar file. Each source is compressed once and the
+    archive is then hardlinked (or copied) into the remaining output
+    directories. All archives of one call share a timestamp, as with the ZIP
+    archives. If the compressor is not installed, falls back to
+    single-threaded gzip (``.tar.gz``) with a warning.
+
+    Parameters:
+    - logger (logging.Logger): The logger instance to use for logging messages.
+    - src_dirs (list of str): The list of paths to the source directories to be compressed.
+    - output_dirs (list of str): The list of output directories where the archives will be saved.
+    - codec (str): 'zstd' or 'pigz'.
+    """
+    if src_dirs is None or output_dirs is None:
+        logger.error("Source and output directories must be provided.")
+        return
+    if not output_dirs:
+        return
+
+    executable, args, suffix = _TAR_COMPRESSORS[codec]
+    command = shutil.which(executable)
+    if command is None:
+        logger.warning(f"'{executable}' not found on PATH; falling back to single-threaded gzip.")
+        suffix = ".tar.gz"
+
+    # One timestamp per call; further sources get a counter so their archives never collide
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    for index, src_dir in enumerate(src_dirs):
+        counter = f"_{index + 1}" if index else ""
+        output_path = os.path.join(output_dirs[0], f"backup_{timestamp}{counter}{suffix}")
+
+        try:
+            if command is None:
+                with tarfile.open(output_path, "w:gz") as tar:
+                    _add_tree(tar, src_dir)
+            else:
+                with open(output_path, "wb") as out:
+                    proc = subprocess.Popen([command, *args], stdin=subprocess.PIPE, stdout=out)
+                    try:
+                        with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                            _add_tree(tar, src_dir)
+                    finally:
+                        proc.stdin.close()
+                        returncode = proc.wait()
+                if returncode:
+                    raise RuntimeError(f"{executable} exited with status {returncode}")
+            logger.info(f"Compressed directory '{src_dir}' to '{output_path}'")
+        except Exception as e:
+            logger.error(f"Failed to compress directory '{src_dir}' to '{output_path}': {e}")
+            # Never leave a truncated archive behind looking like a good backup
+            with contextlib.suppress(OSError):
+                os.unlink(output_path)
+            continue
+
+        try:
+            _replicate_archive(logger, output_path, output_dirs[1:])
+        except OSError as e:
+            logger.error(f"Failed to replicate '{output_path}': {e}")
 
 
 def _send_password_via_bot(logger, bot_handler, timestamp, password):
@@ -96,7 +277,7 @@ def _send_password_via_bot(logger, bot_handler, timestamp, password):
 
 def _send_password_via_email(logger, receiver_emails, timestamp, password):
     """
-    Sends the password to the user via email using an in-memory buffer written to a temp file.
+    Sends the password to the user via email as an in-memory attachment.
 
     Args:
         logger: Logger instance.
@@ -105,21 +286,12 @@ def _send_password_via_email(logger, receiver_emails, timestamp, password):
         password (str): The password to send.
     """
     try:
-        import tempfile
-
-        content = f"{timestamp}: {password}\n"
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as tmp:
-            tmp.write(content)
-            tmp_path = tmp.name
-
-        try:
-            subject = "Backup Password"
-            body = "Please find the attached file containing your backup password."
-            send_email(receiver_emails, subject, body, attachment_paths=[tmp_path], logger=logger)
-            logger.info("Sent backup password to users via email.")
-        finally:
-            os.unlink(tmp_path)
-
+        content = f"{timestamp}: {password}\n".encode()
+        subject = "Backup Password"
+        body = "Please find the attached file containing your backup password."
+        send_email(
+            receiver_emails, subject, body, logger=logger, attachments=[("backup_password.txt", content)]
+        )
+        logger.info("Sent backup password to users via email.")
     except Exception as e:
         logger.error(f"Failed to send password via email: {e}")
@@ -24,6 +24,8 @@ CURRENT_SCHEMA_VERSION = "3"
 
 # ─── Environment Variable Resolution ────────────────────────────────────────
 
+_ENV_RE = re.compile(r"\$\{([^}]+)\}")
+
 
 def resolve_env_vars(value):
     """
@@ -48,7 +50,7 @@ def resolve_env_vars(value):
             )
         return env_value
 
-    return re.sub(r"\$\{([^}]+)\}", _replace, value)
+    return _ENV_RE.sub(_replace, value)
 
 
 def _check_schema_version(config, logger):
@@ -85,7 +87,8 @@ def _resolve_all_env_vars(config, logger):
             if "${" in raw_value:
                 try:
                     resolved = resolve_env_vars(raw_value)
-                    config.set(section, key, resolved)
+                    if resolved != raw_value:
+                        config.set(section, key, resolved)
                     logger.debug(f"Resolved env var in [{section}].{key}")
                 except ValueError as e:
                     logger.error(str(e))
@@ -176,6 +179,7 @@ def extract_config_values(
 
         # Parallel copies
         parallel_copies = config.getint("DEFAULT", "parallel_copies", fallback=1)
+        verify_copies = config.getboolean("DEFAULT", "verify_copies", fallback=True)
 
         # SSH bandwidth limit
         bandwidth_limit = config.getint("SSH", "bandwidth_limit", fallback=0)
@@ -267,6 +271,7 @@ def extract_config_values(
             "max_age_days": max_age_days,
             "max_count": max_count,
             "parallel_copies": max(1, parallel_copies),
+            "verify_copies": verify_copies,
             "bandwidth_limit": max(0, bandwidth_limit),
             "s3_bucket": s3_bucket,
             "s3_prefix": s3_prefix,
@@ -328,7 +333,8 @@ def extract_config_values(
             print(
                 f"  Exclude Patterns : {', '.join(config_vars['exclude_patterns']) if config_vars['exclude_patterns'] else 'None'}"
             )
-            print(f"  Parallel Copies  : {config_vars['parallel_copies']}\n")
+            print(f"  Parallel Copies  : {config_vars['parallel_copies']}")
+            print(f"  Verify Copies    : {config_vars['verify_copies']}\n")
 
             print("BACKUPS:")
             print(f"  Backup Directories: {', '.join(config_vars['backup_dirs'])}\n")
@@ -466,7 +472,7 @@ def validate_config(logger, config, require_schedule=False):
 
     # Validate compress_type if set
     compress_type = normalize_none(config.get("DEFAULT", "compress_type", fallback=None))
-    valid_compress = ("none", "zip", "zip_pw")
+    valid_compress = ("none", "zip", "zip_pw", "zstd", "pigz")
     if compress_type and compress_type not in valid_compress:
         errors.append(
             f"Config error: 'compress_type' in [DEFAULT] must be one of {valid_compress}, got '{compress_type}'"
@@ -589,6 +595,28 @@ def validate_config(logger, config, require_schedule=False):
 # ─── Utility Functions ──────────────────────────────────────────────────────
 
 
+def parse_time_of_day(time_string):
+    """
+    Parse an HH:MM 24-hour time into minutes past midnight.
+
+    Accepts the same input as ``strptime(..., "%H:%M")`` (one- or two-digit
+    fields) but splits the string by hand, which is much cheaper than
+    building a format parser per call.
+
+    Returns:
+        int or None: Minutes past midnight, or None if the string is not a valid time.
+    """
+    hours, sep, minutes = time_string.partition(":")
+    if not (sep and 0 < len(hours) <= 2 and 0 < len(minutes) <= 2):
+        return None
+    if not (hours.isascii() and hours.isdigit() and minutes.isascii() and minutes.isdigit()):
+        return None
+    hour, minute = int(hours), int(minutes)
+    if hour > 23 or minute > 59:
+        return None
+    return hour * 60 + minute
+
+
 def is_valid_time_format(time_string):
     """
     Check if a time string is in HH:MM 24-hour format.
@@ -596,13 +624,7 @@ def is_valid_time_format(time_string):
     Returns:
         bool: True if valid, False otherwise.
     """
-    from datetime import datetime
-
-    try:
-        datetime.strptime(time_string, "%H:%M")
-        return True
-    except ValueError:
-        return False
+    return parse_time_of_day(time_string) is not None
 
 
 def load_config(logger, config_path):
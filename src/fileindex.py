@@ -0,0 +1,104 @@
+"""
+fileindex.py - Persistent Backup File Index
+
+Remembers, per backup destination file, the source size, modification time
+(ns), inode and SHA-256 checksum recorded when it was last copied successfully.
+Incremental and differential backups consult it to skip files that an
+earlier run already copied but that still fall inside the backup window —
+for example after a partially failed run, which deliberately does not
+advance the last-backup timestamp.
+
+An entry is only a hit while size, mtime and inode all match, so any change
+to the source, or its replacement by another file, invalidates it. When only
+the metadata changed (e.g. after ``touch``), the recorded checksum still lets
+the backup be refreshed without copying the data again. Stored in SQLite (WAL
+mode) with updates batched into transactions.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+_BATCH_SIZE = 1000
+
+# Bumped whenever the table layout changes; an index with an older version is
+# simply rebuilt, since every entry can be recomputed by copying again
+_SCHEMA_VERSION = 2
+
+
+class FileIndex:
+    """
+    ``(path, size, mtime_ns, ino) -> checksum`` cache backed by SQLite.
+
+    Usage:
+        with FileIndex('/path/to/fileindex.db') as index:
+            if index.lookup(dst, st.st_size, st.st_mtime_ns, st.st_ino) is None:
+                ...copy...
+                index.update(dst, st.st_size, st.st_mtime_ns, checksum, st.st_ino)
+
+    Safe to share between threads; pending updates are committed every
+    ``_BATCH_SIZE`` rows and on ``close()``.
+    """
+
+    def __init__(self, db_path: os.PathLike | str) -> None:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS files")
+            self._conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, ino INTEGER NOT NULL, checksum TEXT NOT NULL)"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def lookup(self, path: os.PathLike | str, size: int, mtime_ns: int, ino: int = 0) -> str | None:
+        """Return the recorded checksum for ``path`` if its size, mtime and inode still match, else None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT checksum FROM files WHERE path = ? AND size = ? AND mtime_ns = ? AND ino = ?",
+                (str(path), size, mtime_ns, ino),
+            ).fetchone()
+        return row[0] if row else None
+
+    def entry(self, path: os.PathLike | str) -> tuple[int, int, int, str] | None:
+        """Return the recorded ``(size, mtime_ns, ino, checksum)`` for ``path``, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, ino, checksum FROM files WHERE path = ?", (str(path),)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def update(self, path: os.PathLike | str, size: int, mtime_ns: int, checksum: str, ino: int = 0) -> None:
+        """Record (or replace) the entry for ``path``."""
+        with self._lock:
+            if not self._pending:
+                self._conn.execute("BEGIN")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, ino, checksum) VALUES (?, ?, ?, ?, ?)",
+                (str(path), size, mtime_ns, ino, checksum),
+            )
+            self._pending += 1
+            if self._pending >= _BATCH_SIZE:
+                self._conn.execute("COMMIT")
+                self._pending = 0
+
+    def close(self) -> None:
+        """Commit pending updates and close the database."""
+        with self._lock:
+            if self._pending:
+                self._conn.execute("COMMIT")
+                self._pending = 0
+            self._conn.close()
+
+    def __enter__(self) -> FileIndex:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
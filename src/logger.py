@@ -16,6 +16,7 @@ across modules. Hostname, PID, and effective user are included by default.
 Environment toggles:
     BACKUP_HANDLER_LOG_JSON=1    emit the main log file as JSON lines
     BACKUP_HANDLER_LOG_SYSLOG=1  also emit to the local syslog daemon
+    BACKUP_HANDLER_LOG_LEVEL     main log level name, e.g. DEBUG (default: INFO)
 """
 
 from __future__ import annotations
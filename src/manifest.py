@@ -10,17 +10,28 @@ a timestamped JSON manifest to each backup directory. Manifests enable:
 
 Manifest files are named ``backup_manifest_YYYYMMDD_HHMMSS.json`` and are
 excluded from encryption and deduplication to remain accessible without
-decryption keys.
+decryption keys. Each one has a ``backup_manifest_YYYYMMDD_HHMMSS.summary.json``
+sidecar holding only the scalar totals, so the status dashboard does not
+need to parse the per-file lists.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import shutil
+import tempfile
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# Sidecar suffix for the summary written next to each full manifest. Keeping
+# the ``backup_manifest_`` prefix and ``.json`` suffix means every module that
+# skips manifest files skips the sidecars too.
+SUMMARY_SUFFIX = ".summary.json"
+
 
 class BackupManifest:
     """
@@ -32,15 +43,36 @@ class BackupManifest:
         manifest.record_skip('/path/to/unchanged')
         manifest.record_failure('/path/to/bad', 'permission denied')
         manifest.save('/backups/daily')
+        manifest.close()
+
+    Per-file records are spooled as JSON lines to anonymous temporary files
+    rather than kept in memory, and ``save`` streams them into the manifest,
+    so memory stays flat however many files a backup touches.
+
+    Recording is thread-safe: parallel copies and concurrently running backup
+    modes share one manifest.
     """
 
+    _SECTIONS = ("copied", "skipped", "failed")
+
     def __init__(self, mode: str = "full") -> None:
         self._start_time = time.time()
         self._mode = mode
-        self._copied: list[dict[str, Any]] = []
-        self._skipped: list[dict[str, Any]] = []
-        self._failed: list[dict[str, Any]] = []
+        # Closed by close() (or on leaving a ``with`` block)
+        self._spools = {
+            name: tempfile.TemporaryFile("w+", encoding="utf-8")  # noqa: SIM115
+            for name in self._SECTIONS
+        }
+        self._counts = dict.fromkeys(self._SECTIONS, 0)
         self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def _record(self, section: str, entry: dict[str, Any], size_bytes: int = 0) -> None:
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._spools[section].write(line)
+            self._counts[section] += 1
+            self._total_bytes += size_bytes
 
     def record_copy(
         self,
@@ -52,16 +84,15 @@ class BackupManifest:
         entry: dict[str, Any] = {"path": str(file_path), "size": size_bytes}
         if checksum:
             entry["checksum"] = checksum
-        self._copied.append(entry)
-        self._total_bytes += size_bytes
+        self._record("copied", entry, size_bytes)
 
     def record_skip(self, file_path: Path | str) -> None:
         """Record a skipped (unchanged) file."""
-        self._skipped.append({"path": str(file_path)})
+        self._record("skipped", {"path": str(file_path)})
 
     def record_failure(self, file_path: Path | str, reason: str) -> None:
         """Record a failed file operation."""
-        self._failed.append({"path": str(file_path), "reason": reason})
+        self._record("failed", {"path": str(file_path), "reason": reason})
 
     def save(self, output_dir: Path | str) -> Path:
         """
@@ -76,40 +107,105 @@ class BackupManifest:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        duration = time.time() - self._start_time
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        manifest_path = output_dir / f"backup_manifest_{timestamp}.json"
 
-        manifest_data = {
-            "timestamp": timestamp,
-            "mode": self._mode,
-            "duration_seconds": round(duration, 2),
-            "files_copied": len(self._copied),
-            "files_skipped": len(self._skipped),
-            "files_failed": len(self._failed),
-            "total_bytes": self._total_bytes,
-            "copied": self._copied,
-            "skipped": self._skipped,
-            "failed": self._failed,
-        }
+        with self._lock:
+            summary_data = {"timestamp": timestamp, **self._summary_locked()}
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                f.write("{\n")
+                for key, value in summary_data.items():
+                    f.write(f"  {json.dumps(key)}: {json.dumps(value)},\n")
+                for index, section in enumerate(self._SECTIONS):
+                    f.write(f'  "{section}": [')
+                    spool = self._spools[section]
+                    spool.flush()
+                    spool.seek(0)
+                    separator = "\n    "
+                    for line in spool:
+                        f.write(separator)
+                        f.write(line.rstrip("\n"))
+                        separator = ",\n    "
+                    # Leave the spool positioned for further appends
+                    spool.seek(0, os.SEEK_END)
+                    f.write("\n  ]" if self._counts[section] else "]")
+                    f.write(",\n" if index < len(self._SECTIONS) - 1 else "\n")
+                f.write("}\n")
 
-        manifest_path = output_dir / f"backup_manifest_{timestamp}.json"
-        with open(manifest_path, "w") as f:
-            json.dump(manifest_data, f, indent=2)
+        # Written after the full manifest, so a summary never refers to a missing one
+        with open(output_dir / f"backup_manifest_{timestamp}{SUMMARY_SUFFIX}", "w") as f:
+            json.dump(summary_data, f, indent=2)
 
         return manifest_path
 
-    def summary(self) -> dict[str, Any]:
-        """Return a summary dict (without per-file details)."""
-        duration = time.time() - self._start_time
+    def _summary_locked(self) -> dict[str, Any]:
         return {
             "mode": self._mode,
-            "duration_seconds": round(duration, 2),
-            "files_copied": len(self._copied),
-            "files_skipped": len(self._skipped),
-            "files_failed": len(self._failed),
+            "duration_seconds": round(time.time() - self._start_time, 2),
+            "files_copied": self._counts["copied"],
+            "files_skipped": self._counts["skipped"],
+            "files_failed": self._counts["failed"],
             "total_bytes": self._total_bytes,
         }
 
+    def summary(self) -> dict[str, Any]:
+        """Return a summary dict (without per-file details)."""
+        with self._lock:
+            return self._summary_locked()
+
+    def close(self) -> None:
+        """Release the per-file spools. Call once the last ``save`` is done."""
+        with self._lock:
+            for spool in self._spools.values():
+                spool.close()
+
+    def __enter__(self) -> BackupManifest:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def replicate_manifest(manifest_path: Path | str, output_dir: Path | str) -> Path:
+    """
+    Place an already-saved manifest (and its summary sidecar) in another directory.
+
+    Hardlinks when the directories share a filesystem, so no JSON is
+    re-serialized or rewritten; copies otherwise.
+
+    Parameters:
+    - manifest_path (str or Path): Manifest written by ``BackupManifest.save``.
+    - output_dir (str or Path): Directory to place the manifest in.
+
+    Returns:
+    - Path: Path to the manifest in ``output_dir``.
+    """
+    manifest_path = Path(manifest_path)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    summary_path = manifest_path.with_name(manifest_path.stem + SUMMARY_SUFFIX)
+    for src in (manifest_path, summary_path):
+        dst = output_dir / src.name
+        try:
+            os.link(src, dst)
+        except OSError:
+            # Cross-device, unsupported, or already present: fall back to a copy
+            shutil.copyfile(src, dst)
+    return output_dir / manifest_path.name
+
+
+def is_manifest_name(name: str) -> bool:
+    """Return True if ``name`` is a full manifest file name (not a summary sidecar)."""
+    return (
+        name.startswith("backup_manifest_") and name.endswith(".json") and not name.endswith(SUMMARY_SUFFIX)
+    )
+
+
+def _manifest_files(directory: Path) -> list[Path]:
+    """Return the full manifest files in ``directory`` (summary sidecars excluded), oldest first."""
+    return sorted(f for f in directory.glob("backup_manifest_*.json") if is_manifest_name(f.name))
+
 
 def load_latest_manifest(directory: Path | str) -> dict[str, Any] | None:
     """
@@ -121,14 +217,51 @@ def load_latest_manifest(directory: Path | str) -> dict[str, Any] | None:
     Returns:
     - dict or None: Parsed manifest data, or None if no manifest found.
     """
-    directory = Path(directory)
-    manifests = sorted(directory.glob("backup_manifest_*.json"), reverse=True)
+    manifests = _manifest_files(Path(directory))
     if not manifests:
         return None
-    with open(manifests[0]) as f:
+    with open(manifests[-1]) as f:
         return json.load(f)
 
 
+def load_latest_manifest_summary(directory: Path | str) -> dict[str, Any] | None:
+    """
+    Load the scalar totals (timestamp, mode, counts, bytes) of the most recent manifest.
+
+    Reads the small summary sidecar when present and falls back to the full
+    manifest for backups written before sidecars existed.
+
+    Parameters:
+    - directory (str or Path): Directory to search for manifest files.
+
+    Returns:
+    - dict or None: Summary data, or None if no manifest found.
+    """
+    manifests = _manifest_files(Path(directory))
+    if not manifests:
+        return None
+    return load_manifest_summary(manifests[-1])
+
+
+def load_manifest_summary(manifest_path: Path | str) -> dict[str, Any]:
+    """
+    Load the scalar totals for a specific manifest file, preferring its summary sidecar.
+
+    Parameters:
+    - manifest_path (str or Path): Path to a full ``backup_manifest_*.json`` file.
+
+    Returns:
+    - dict: Summary data (the full manifest if no sidecar exists).
+    """
+    manifest_path = Path(manifest_path)
+    summary_path = manifest_path.with_name(manifest_path.stem + SUMMARY_SUFFIX)
+    try:
+        return json.loads(summary_path.read_bytes())
+    except (OSError, ValueError):
+        with open(manifest_path) as f:
+            return json.load(f)
+
+
 def load_manifests_up_to(directory: Path | str, timestamp: str) -> list[dict[str, Any]]:
     """
     Load all manifests up to (and including) the given timestamp, sorted chronologically.
@@ -142,7 +275,7 @@ def load_manifests_up_to(directory: Path | str, timestamp: str) -> list[dict[str
     """
     directory = Path(directory)
     manifests = []
-    for manifest_file in sorted(directory.glob("backup_manifest_*.json")):
+    for manifest_file in _manifest_files(directory):
         # Extract timestamp from filename
         name = manifest_file.stem  # backup_manifest_YYYYMMDD_HHMMSS
         parts = name.replace("backup_manifest_", "")
@@ -4,6 +4,7 @@ restore.py - Multi-Source Backup Restore Engine
 Restores backup data from multiple source types:
   - Local directories  (direct file copy with SHA-256 verification)
   - ZIP archives       (standard extraction)
+  - Tar archives       (``.tar.gz`` / ``.tgz``, and ``.tar.zst`` via the ``zstd`` tool)
   - SSH/SFTP remotes   (download via paramiko, then local restore)
   - S3 buckets         (download via boto3, then local restore)
 
@@ -16,6 +17,8 @@ import os
 import re
 import shutil
 import stat
+import subprocess
+import tarfile
 import tempfile
 import zipfile
 from pathlib import Path
@@ -24,6 +27,9 @@ from .encryption import decrypt_directory
 from .manifest import load_manifests_up_to
 from .utils import verify_backup
 
+# Archive suffixes written by ``compress_directory_tar``
+_TAR_SUFFIXES = (".tar.gz", ".tgz", ".tar.zst")
+
 # ─── Remote Path Detection & Parsing ────────────────────────────────────────
 
 
@@ -307,6 +313,10 @@ def restore_backup(
     if from_path.is_file() and from_path.suffix == ".zip":
         return _restore_from_zip(logger, from_path, to_path)
 
+    # Tar archive restore
+    if from_path.is_file() and from_path.name.endswith(_TAR_SUFFIXES):
+        return _restore_from_tar(logger, from_path, to_path)
+
     # Directory restore
     if from_path.is_dir():
         # Check if backup contains encrypted files
@@ -354,6 +364,8 @@ def _dry_run_restore(logger, from_dir, to_dir, timestamp):
         from_path = Path(from_dir)
         if from_path.is_file() and from_path.suffix == ".zip":
             print("  Type:        ZIP archive extraction")
+        elif from_path.is_file() and from_path.name.endswith(_TAR_SUFFIXES):
+            print("  Type:        Tar archive extraction")
         elif from_path.is_dir():
             files = [
                 f
@@ -418,7 +430,7 @@ def _restore_from_zip(logger, zip_path, to_dir):
     logger.info(f"Restoring from ZIP archive: {zip_path}")
     try:
         with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(to_dir)
+            zf.extractall(to_dir)  # noqa: S202 - zipfile drops absolute and ".." path components
         logger.info(f"Successfully restored {zip_path} to {to_dir}")
         return True
     except zipfile.BadZipFile:
@@ -429,6 +441,92 @@ def _restore_from_zip(logger, zip_path, to_dir):
         return False
 
 
+def _extract_tar(tf, to_dir):
+    """
+    Extract a tar archive, rejecting absolute paths, ``..``, links out of ``to_dir`` and special files.
+
+    Uses tarfile's ``data`` filter where available. Without it (Python builds
+    predating extraction filters) each member is checked by hand as it is
+    reached, so streamed archives work too, and the restore is refused on
+    the first unsafe member.
+    """
+    if hasattr(tarfile, "data_filter"):
+        tf.extractall(to_dir, filter="data")
+        return
+
+    root = os.path.realpath(to_dir)
+    for member in tf:
+        _check_tar_member(member, root)
+        tf.extract(member, to_dir, set_attrs=not member.isdir())
+
+
+def _check_tar_member(member, root):
+    """Raise ``tarfile.TarError`` if extracting ``member`` under ``root`` could escape it."""
+
+    def inside(path):
+        return os.path.commonpath([root, path]) == root
+
+    if not (member.isfile() or member.isdir() or member.issym() or member.islnk()):
+        raise tarfile.TarError(f"Refusing to extract special file {member.name!r}")
+    if os.path.isabs(member.name):
+        raise tarfile.TarError(f"Refusing to extract absolute path {member.name!r}")
+    # realpath follows symlinks extracted earlier, so paths through them are checked too
+    target = os.path.realpath(os.path.join(root, member.name))
+    if not inside(target):
+        raise tarfile.TarError(f"Refusing to extract {member.name!r} outside the restore directory")
+    if member.issym() or member.islnk():
+        # Symlink targets are relative to the link's directory, hardlink targets to the archive root
+        base = os.path.dirname(target) if member.issym() else root
+        link = os.path.realpath(os.path.join(base, member.linkname))
+        if os.path.isabs(member.linkname) or not inside(link):
+            raise tarfile.TarError(f"Refusing link {member.name!r} pointing outside the restore directory")
+
+
+def _restore_from_tar(logger, tar_path, to_dir):
+    """
+    Restore a backup from a tar archive by extracting all contents.
+
+    ``.tar.zst`` archives are decompressed by streaming through ``zstd -dc``;
+    gzip archives are read directly.
+
+    Parameters:
+        logger: Logger instance.
+        tar_path (Path): Path to the tar archive.
+        to_dir (Path): Destination directory for extraction.
+
+    Returns:
+        bool: True if extraction succeeded.
+    """
+    logger.info(f"Restoring from tar archive: {tar_path}")
+    try:
+        if tar_path.name.endswith(".tar.zst"):
+            zstd = shutil.which("zstd")
+            if zstd is None:
+                logger.error(f"The 'zstd' tool is required to restore {tar_path}")
+                return False
+            proc = subprocess.Popen([zstd, "-dcq", str(tar_path)], stdout=subprocess.PIPE)
+            try:
+                with tarfile.open(fileobj=proc.stdout, mode="r|") as tf:
+                    _extract_tar(tf, to_dir)
+            finally:
+                proc.stdout.close()
+                returncode = proc.wait()
+            if returncode:
+                logger.error(f"zstd exited with status {returncode} while reading {tar_path}")
+                return False
+        else:
+            with tarfile.open(tar_path, "r:*") as tf:
+                _extract_tar(tf, to_dir)
+        logger.info(f"Successfully restored {tar_path} to {to_dir}")
+        return True
+    except tarfile.TarError as e:
+        logger.error(f"Bad tar archive {tar_path}: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Failed to restore from tar archive: {e}")
+        return False
+
+
 def _restore_full_directory(logger, from_dir, to_dir):
     """
     Perform a full restore by copying all files from the backup to the destination.
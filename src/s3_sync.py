@@ -4,10 +4,12 @@ s3_sync.py - AWS S3 Cloud Backup Synchronization
 Uploads local backup files to an AWS S3 bucket with support for full,
 incremental, and differential modes. In incremental/differential mode,
 compares local modification times against S3 object timestamps to skip
-unchanged files. Displays a progress bar via ``tqdm`` during upload.
+unchanged files. Uploads share one ``s3transfer`` manager, so many files
+are in flight at once. Displays a progress bar via ``tqdm`` during upload.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from tqdm import tqdm
@@ -44,6 +46,9 @@ def sync_to_s3(
     - mode (str): Backup mode ('full', 'incremental', 'differential').
     - exclude_patterns (list of str, optional): Glob patterns to exclude.
     - manifest (BackupManifest, optional): Manifest to record operations.
+    - max_bandwidth (int, optional): Upload bandwidth cap in KB/s for the whole sync.
+    - multipart_threshold (int, optional): Multipart upload threshold in MB.
+    - max_concurrency (int, optional): Upload threads shared by all files in the sync.
 
     Returns:
     - bool: True if sync completed successfully.
@@ -71,7 +76,7 @@ def sync_to_s3(
     s3 = boto3.client("s3", **session_kwargs)
 
     # Configure transfer settings for bandwidth and multipart uploads
-    from boto3.s3.transfer import TransferConfig
+    from boto3.s3.transfer import TransferConfig, create_transfer_manager
 
     transfer_kwargs = {}
     if max_bandwidth:
@@ -80,7 +85,7 @@ def sync_to_s3(
         transfer_kwargs["multipart_threshold"] = multipart_threshold * 1024 * 1024  # MB -> bytes
     if max_concurrency:
         transfer_kwargs["max_concurrency"] = max_concurrency
-    transfer_config = TransferConfig(**transfer_kwargs) if transfer_kwargs else None
+    transfer_config = TransferConfig(**transfer_kwargs)
 
     # Collect files to upload
     files = [
@@ -95,37 +100,56 @@ def sync_to_s3(
     skipped = 0
     failed = 0
 
-    for local_file in tqdm(files, desc=f"Uploading to s3://{bucket}/{prefix}", unit="files"):
+    def _s3_key(local_file):
         relative = local_file.relative_to(source_path)
         s3_key = f"{prefix}/{relative}" if prefix else str(relative)
         # Normalize path separators for S3
-        s3_key = s3_key.replace(os.sep, "/")
+        return s3_key.replace(os.sep, "/")
+
+    def _needs_upload(local_file):
+        """Compare against the remote object; returns True/False, or the ClientError on failure."""
+        try:
+            response = s3.head_object(Bucket=bucket, Key=_s3_key(local_file))
+        except ClientError as e:
+            return True if e.response["Error"]["Code"] == "404" else e
+        return local_file.stat().st_mtime > response["LastModified"].timestamp()
+
+    # In incremental/differential mode, issue the HEAD requests concurrently;
+    # each is a full round trip and most files are usually unchanged
+    if mode in ("incremental", "differential"):
+        with ThreadPoolExecutor(max_workers=transfer_config.max_request_concurrency) as executor:
+            decisions = list(executor.map(_needs_upload, files))
+    else:
+        decisions = [True] * len(files)
+
+    to_upload = []
+    for local_file, decision in zip(files, decisions, strict=True):
+        if isinstance(decision, ClientError):
+            logger.error(f"Error checking S3 object {_s3_key(local_file)}: {decision}")
+            failed += 1
+            if manifest:
+                manifest.record_failure(str(local_file), str(decision))
+        elif decision:
+            to_upload.append(local_file)
+        else:
+            skipped += 1
+            if manifest:
+                manifest.record_skip(str(local_file))
 
-        should_upload = True
+    # One transfer manager for the whole run: many files (and the parts of large
+    # ones) upload concurrently on a shared pool bounded by max_concurrency, and
+    # max_bandwidth applies to the run as a whole rather than per file
+    manager = create_transfer_manager(s3, transfer_config)
+    try:
+        uploads = [
+            (local_file, manager.upload(str(local_file), bucket, _s3_key(local_file)))
+            for local_file in to_upload
+        ]
 
-        if mode in ("incremental", "differential"):
+        for local_file, future in tqdm(uploads, desc=f"Uploading to s3://{bucket}/{prefix}", unit="files"):
             try:
-                response = s3.head_object(Bucket=bucket, Key=s3_key)
-                remote_mtime = response["LastModified"].timestamp()
-                local_mtime = local_file.stat().st_mtime
-                should_upload = local_mtime > remote_mtime
-            except ClientError as e:
-                if e.response["Error"]["Code"] == "404":
-                    should_upload = True
-                else:
-                    logger.error(f"Error checking S3 object {s3_key}: {e}")
-                    failed += 1
-                    if manifest:
-                        manifest.record_failure(str(local_file), str(e))
-                    continue
-
-        if should_upload:
-            try:
-                upload_kwargs = {}
-                if transfer_config:
-                    upload_kwargs["Config"] = transfer_config
-                s3.upload_file(str(local_file), bucket, s3_key, **upload_kwargs)
-                logger.info(f"Uploaded {local_file} -> s3://{bucket}/{s3_key}")
+                future.result()
+                logger.info(f"Uploaded {local_file} -> s3://{bucket}/{_s3_key(local_file)}")
                 uploaded += 1
                 if manifest:
                     checksum = calculate_checksum(str(local_file))
@@ -135,10 +159,8 @@ def sync_to_s3(
                 failed += 1
                 if manifest:
                     manifest.record_failure(str(local_file), str(e))
-        else:
-            skipped += 1
-            if manifest:
-                manifest.record_skip(str(local_file))
+    finally:
+        manager.shutdown()
 
     logger.info(f"S3 sync complete: {uploaded} uploaded, {skipped} skipped, {failed} failed")
     return failed == 0
@@ -1,3 +1,7 @@
+import contextlib
+import errno
+import functools
+import hashlib
 import os
 import shutil
 import stat
@@ -12,8 +16,60 @@ from tqdm import tqdm
 
 from email_nots.email import send_email
 
-from .compression import compress_directory
-from .utils import calculate_checksum, generate_otp, handle_symlink, should_exclude, verify_backup
+from .compression import compress_directory, compress_directory_tar
+from .utils import (
+    calculate_checksum,
+    generate_otp,
+    handle_symlink,
+    human_size,
+    should_exclude,
+    walk_with_stat,
+)
+
+# Buffer size for the single-pass hashed copy
+_HASH_COPY_CHUNK = 1024 * 1024
+
+# Per-file copy messages are logged at DEBUG; at INFO, local copies log a running
+# total every _PROGRESS_EVERY_FILES files or _PROGRESS_EVERY_SECONDS, whichever comes first
+_PROGRESS_EVERY_FILES = 1000
+_PROGRESS_EVERY_SECONDS = 5.0
+
+# Bytes per copy_file_range() call; the kernel loops internally, this only bounds each syscall
+_COPY_CHUNK = 64 * 1024 * 1024
+
+
+class _CopyProgress:
+    """Thread-safe running total of files copied, logged periodically at INFO level."""
+
+    def __init__(self, logger, label):
+        self._logger = logger
+        self._label = label
+        self._lock = threading.Lock()
+        self._files = 0
+        self._bytes = 0
+        self._logged_files = 0
+        self._logged_at = time.monotonic()
+
+    def add(self, size):
+        """Count one copied file of ``size`` bytes, logging the total when an interval has passed."""
+        with self._lock:
+            self._files += 1
+            self._bytes += size
+            now = time.monotonic()
+            if (
+                self._files - self._logged_files < _PROGRESS_EVERY_FILES
+                and now - self._logged_at < _PROGRESS_EVERY_SECONDS
+            ):
+                return
+            self._logged_files, self._logged_at = self._files, now
+            files, total = self._files, self._bytes
+        if self._logger:
+            self._logger.info(f"{self._label}: copied {files} files ({human_size(total)}) so far")
+
+    def finish(self):
+        """Log the final total."""
+        if self._logger:
+            self._logger.info(f"{self._label}: copied {self._files} files ({human_size(self._bytes)})")
 
 
 def sync_directories_with_progress(
@@ -26,6 +82,7 @@ def sync_directories_with_progress(
     exclude_patterns=None,
     manifest=None,
     parallel_copies=1,
+    verify=True,
 ):
     """
     Sync files from source directories to backup directories with progress tracking.
@@ -35,11 +92,13 @@ def sync_directories_with_progress(
     - source_dirs (list of str): List of source directories.
     - backup_dirs (list of str): List of backup directories.
     - compress (str, optional): If 'zip', compress the final backup directory. If 'zip_pw', compress with a password.
+      'zstd' and 'pigz' write a tarball compressed on all cores instead.
     - bot (TelegramBot, optional): Telegram bot instance for sending notifications.
     - receiver_emails (list of str, optional): List of emails to notify after backup.
     - exclude_patterns (list of str, optional): Glob patterns to exclude.
     - manifest (BackupManifest, optional): Manifest to record file operations.
     - parallel_copies (int, optional): Number of parallel copy threads (default 1 = sequential).
+    - verify (bool, optional): Checksum each copy and record it in the manifest (default True).
     """
     for src_dir in source_dirs:
         # List all files in the current source directory
@@ -50,10 +109,14 @@ def sync_directories_with_progress(
         ]
 
         for backup_dir in backup_dirs:
+            progress = _CopyProgress(logger, f"{src_dir} -> {backup_dir}")
             if parallel_copies > 1:
-                _sync_parallel(logger, files, src_dir, backup_dir, manifest, parallel_copies)
+                _sync_parallel(
+                    logger, files, src_dir, backup_dir, manifest, parallel_copies, verify, progress
+                )
             else:
-                _sync_sequential(logger, files, src_dir, backup_dir, manifest)
+                _sync_sequential(logger, files, src_dir, backup_dir, manifest, verify, progress)
+            progress.finish()
 
     # Compress the backup directories if the compress flag is set
     if compress in ["zip", "zip_pw"]:
@@ -65,7 +128,10 @@ def sync_directories_with_progress(
             password=password,
             bot_handler=bot,
             receiver_emails=receiver_emails,
+            workers=parallel_copies,
         )
+    elif compress in ("zstd", "pigz"):
+        compress_directory_tar(logger, src_dirs=source_dirs, output_dirs=backup_dirs, codec=compress)
 
     # Send notification if bot is enabled
     if bot:
@@ -84,19 +150,19 @@ def sync_directories_with_progress(
             logger.error(f"Failed to send email notification: {e}")
 
 
-def _sync_sequential(logger, files, src_dir, backup_dir, manifest):
+def _sync_sequential(logger, files, src_dir, backup_dir, manifest, verify=True, progress=None):
     """Sync files sequentially with a progress bar."""
     for file in tqdm(files, desc=f"Syncing Files from {src_dir} to {backup_dir}", unit="files"):
-        _copy_single_file(logger, file, src_dir, backup_dir, manifest)
+        _copy_single_file(logger, file, src_dir, backup_dir, manifest, verify, progress)
 
 
-def _sync_parallel(logger, files, src_dir, backup_dir, manifest, parallel_copies):
+def _sync_parallel(logger, files, src_dir, backup_dir, manifest, parallel_copies, verify=True, progress=None):
     """Sync files in parallel using a thread pool with a thread-safe progress bar."""
     progress_lock = threading.Lock()
     pbar = tqdm(total=len(files), desc=f"Syncing Files from {src_dir} to {backup_dir}", unit="files")
 
     def copy_task(file):
-        _copy_single_file(logger, file, src_dir, backup_dir, manifest)
+        _copy_single_file(logger, file, src_dir, backup_dir, manifest, verify, progress)
         with progress_lock:
             pbar.update(1)
 
@@ -111,8 +177,95 @@ def _sync_parallel(logger, files, src_dir, backup_dir, manifest, parallel_copies
     pbar.close()
 
 
-def _copy_single_file(logger, file, src_dir, backup_dir, manifest):
-    """Copy a single file from source to backup, with optional manifest recording."""
+def _fadvise(fd, advice_name):
+    """Give the kernel a ``posix_fadvise`` hint for the whole file; a no-op where unsupported."""
+    advice = getattr(os, advice_name, None)
+    if advice is not None:
+        with contextlib.suppress(OSError):
+            os.posix_fadvise(fd, 0, 0, advice)
+
+
+def _copy_metadata(st, dst):
+    """
+    Apply the permission bits and timestamps from ``st`` to ``dst`` (a path or an open fd).
+
+    Two syscalls, against the stat/utime/chmod/listxattr/... round of
+    ``shutil.copystat``. Extended attributes and file flags are not copied.
+    """
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _fast_copy(src, dst):
+    """
+    Copy a file's contents, permissions and timestamps without hashing.
+
+    Used when copy verification is off. Tries ``os.copy_file_range`` first:
+    the kernel moves the data without a user-space buffer, and on btrfs/XFS
+    (or NFS 4.2) it can reflink or copy server-side. Falls back to
+    ``shutil.copyfile`` (``sendfile`` on Linux) where the call is
+    unsupported, e.g. on older kernels or some cross-device copies, and for
+    pseudo-files that report no data.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            st = os.fstat(fsrc.fileno())
+            _fadvise(fsrc.fileno(), "POSIX_FADV_SEQUENTIAL")
+            try:
+                sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_CHUNK)
+                while sent:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_CHUNK)
+                # Nothing copied at all may be a /proc-style file with st_size 0; use the generic path
+                copied = fdst.tell() > 0 or st.st_size == 0
+            except OSError as e:
+                if fdst.tell() or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+            # Backup data is read once; don't let it push the working set out of the page cache
+            _fadvise(fsrc.fileno(), "POSIX_FADV_DONTNEED")
+            if copied:
+                _copy_metadata(st, fdst.fileno())
+    if not copied:
+        shutil.copyfile(src, dst)
+        _copy_metadata(os.stat(src), dst)
+
+
+def _copy_hashed(src, dst):
+    """
+    Copy a file's contents, permissions and timestamps in a single pass, hashing as it goes.
+
+    Each chunk is read once into a reused buffer, fed to SHA-256 and written
+    to ``dst``, so the returned checksum describes exactly the bytes written
+    and neither file has to be read again to verify the copy or fill in the
+    manifest. Metadata is set on the open descriptors from one ``fstat``.
+
+    Returns:
+    - str: The SHA-256 checksum of the copied data.
+    """
+    digest = hashlib.sha256()
+    buf = bytearray(_HASH_COPY_CHUNK)
+    view = memoryview(buf)
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        _fadvise(fsrc.fileno(), "POSIX_FADV_SEQUENTIAL")
+        while n := fsrc.readinto(buf):
+            chunk = view[:n]
+            digest.update(chunk)
+            written = 0
+            while written < n:
+                written += fdst.write(chunk[written:])
+        _fadvise(fsrc.fileno(), "POSIX_FADV_DONTNEED")
+        # Last, so no write after it moves the mtime
+        _copy_metadata(os.fstat(fsrc.fileno()), fdst.fileno())
+    return digest.hexdigest()
+
+
+def _copy_single_file(logger, file, src_dir, backup_dir, manifest, verify=True, progress=None):
+    """
+    Copy a single file from source to backup, with optional manifest recording.
+
+    With ``verify`` the copy is hashed in the same pass and its checksum recorded;
+    without it the zero-copy ``_fast_copy`` is used and only the size is recorded.
+    """
     backup_file = Path(backup_dir) / file.relative_to(src_dir)
 
     try:
@@ -126,24 +279,18 @@ def _copy_single_file(logger, file, src_dir, backup_dir, manifest):
                 manifest.record_copy(str(file), file.stat().st_size if file.exists() else 0)
             return
 
-        shutil.copy2(file, backup_file)
-        if verify_backup(file, backup_file):
-            (
-                logger.info(f"Successfully backed up {file} to {backup_file}")
-                if logger
-                else print(f"Successfully backed up {file} to {backup_file}")
-            )
-            if manifest:
-                checksum = calculate_checksum(str(file))
-                manifest.record_copy(str(file), file.stat().st_size, checksum=checksum)
+        if verify:
+            checksum = _copy_hashed(file, backup_file)
         else:
-            (
-                logger.error(f"Checksum verification failed for {file}")
-                if logger
-                else print(f"Checksum verification failed for {file}")
-            )
-            if manifest:
-                manifest.record_failure(str(file), "Checksum verification failed")
+            _fast_copy(file, backup_file)
+            checksum = None
+        size = file.stat().st_size
+        if logger:
+            logger.debug(f"Successfully backed up {file} to {backup_file}")
+        if progress:
+            progress.add(size)
+        if manifest:
+            manifest.record_copy(str(file), size, checksum=checksum)
     except (OSError, shutil.Error) as e:
         logger.error(f"Failed to backup {file} to {backup_file}: {e}")
         if manifest:
@@ -182,6 +329,37 @@ def _sftp_put_throttled(sftp, local_path, remote_path, bandwidth_limit_kbps):
                 time.sleep(expected - elapsed)
 
 
+def _scan_upload_files(local_path, exclude_patterns=None, logger=None):
+    """
+    Walk ``local_path`` once for SFTP uploads.
+
+    The scan is shared by every server of a concurrent sync, so the tree is
+    walked and stat'ed once rather than once per server (plus once more for
+    the full-mode cleanup).
+
+    Parameters:
+    - local_path (str or Path): Local directory to upload.
+    - exclude_patterns (list of str, optional): Glob patterns to exclude from upload.
+    - logger (logging.Logger, optional): Logger for unreadable directories, which are skipped.
+
+    Returns:
+    - tuple: (list of (Path, relative POSIX path, os.stat_result) to upload,
+      set of relative paths of all regular files, including excluded ones).
+    """
+    local_path = Path(local_path)
+    files = []
+    all_names = set()
+    for path, st, _is_link in walk_with_stat(local_path, logger=logger):
+        if not stat.S_ISREG(st.st_mode):
+            continue
+        relative = path.relative_to(local_path)
+        all_names.add(str(relative))
+        if not should_exclude(relative, exclude_patterns):
+            files.append((path, relative.as_posix(), st))
+    files.sort(key=lambda item: item[1])
+    return files, all_names
+
+
 def _sftp_upload_directory(
     sftp,
     local_path,
@@ -191,10 +369,16 @@ def _sftp_upload_directory(
     exclude_patterns=None,
     manifest=None,
     bandwidth_limit=0,
+    scan=None,
+    checksum=calculate_checksum,
 ):
     """
     Upload a local directory to a remote server via SFTP.
 
+    Remote directories are created once per connection and, in incremental and
+    differential mode, each remote directory is listed once instead of issuing
+    one ``stat`` round trip per file.
+
     Parameters:
     - sftp: paramiko SFTP client.
     - local_path (str): Local directory path.
@@ -204,44 +388,41 @@ def _sftp_upload_directory(
     - exclude_patterns (list of str, optional): Glob patterns to exclude.
     - manifest (BackupManifest, optional): Manifest to record file operations.
     - bandwidth_limit (int): Bandwidth limit in KB/s (0 = unlimited).
+    - scan (tuple, optional): Result of ``_scan_upload_files``; scanned here if omitted.
+    - checksum (callable): Returns the SHA-256 of a local path for the manifest.
     """
     local_path = Path(local_path)
-    files = [
-        f
-        for f in local_path.rglob("*")
-        if f.is_file() and not should_exclude(f.relative_to(local_path), exclude_patterns)
-    ]
-
-    for local_file in tqdm(files, desc=f"Uploading to {remote_path}", unit="files"):
-        relative = local_file.relative_to(local_path)
+    files, all_names = scan if scan is not None else _scan_upload_files(local_path, exclude_patterns, logger)
+
+    known_dirs = set()
+    remote_listings = {}
+
+    for local_file, relative, st in tqdm(files, desc=f"Uploading to {remote_path}", unit="files"):
         remote_file = f"{remote_path}/{relative}"
-        remote_dir = f"{remote_path}/{relative.parent}"
+        remote_dir, _, name = remote_file.rpartition("/")
 
         # Ensure remote directory exists
-        _sftp_mkdirs(sftp, remote_dir, logger=logger)
+        _sftp_mkdirs(sftp, remote_dir, logger=logger, known_dirs=known_dirs)
 
         should_upload = True
         if mode in ("incremental", "differential"):
-            try:
-                remote_stat = sftp.stat(remote_file)
-                local_mtime = local_file.stat().st_mtime
-                remote_mtime = remote_stat.st_mtime
-                if (mode == "incremental" and remote_stat) or mode == "differential":
-                    # Only upload if local is newer
-                    should_upload = local_mtime > remote_mtime
+            listing = remote_listings.get(remote_dir)
+            if listing is None:
+                listing = remote_listings[remote_dir] = _sftp_listing(sftp, remote_dir)
+            remote_stat = listing.get(name)
+            # Only upload if missing remotely or local is newer
+            if remote_stat is not None:
+                should_upload = st.st_mtime > remote_stat.st_mtime
                 if not should_upload and manifest:
                     manifest.record_skip(str(local_file))
-            except FileNotFoundError:
-                should_upload = True  # File doesn't exist remotely
 
         if should_upload:
             try:
                 _sftp_put_throttled(sftp, str(local_file), remote_file, bandwidth_limit)
                 if logger:
-                    logger.info(f"Uploaded {local_file} -> {remote_file}")
+                    logger.debug(f"Uploaded {local_file} -> {remote_file}")
                 if manifest:
-                    checksum = calculate_checksum(str(local_file))
-                    manifest.record_copy(str(local_file), local_file.stat().st_size, checksum=checksum)
+                    manifest.record_copy(str(local_file), st.st_size, checksum=checksum(str(local_file)))
             except Exception as e:
                 if logger:
                     logger.error(f"Failed to upload {local_file}: {e}")
@@ -250,14 +431,31 @@ def _sftp_upload_directory(
 
     # In full mode, remove remote files not present locally
     if mode == "full":
-        _sftp_cleanup_extra_files(sftp, local_path, remote_path, logger)
+        _sftp_cleanup_extra_files(sftp, all_names, remote_path, logger)
+
 
+def _sftp_listing(sftp, remote_dir):
+    """Return ``{filename: SFTPAttributes}`` for ``remote_dir`` (empty if it does not exist)."""
+    try:
+        return {entry.filename: entry for entry in sftp.listdir_attr(remote_dir)}
+    except FileNotFoundError:
+        return {}
 
-def _sftp_mkdirs(sftp, remote_dir, logger=None):
-    """Recursively create remote directories."""
+
+def _sftp_mkdirs(sftp, remote_dir, logger=None, known_dirs=None):
+    """
+    Recursively create remote directories.
+
+    ``known_dirs`` (set, optional) caches directories already known to exist on
+    this connection, so repeated calls for the same directory cost no round trips.
+    """
+    if known_dirs is not None and remote_dir in known_dirs:
+        return
     dirs_to_create = []
     current = remote_dir
     while current and current != "/":
+        if known_dirs is not None and current in known_dirs:
+            break
         try:
             sftp.stat(current)
             break
@@ -275,14 +473,15 @@ def _sftp_mkdirs(sftp, remote_dir, logger=None):
                 if logger:
                     logger.error(f"Failed to create remote directory '{d}': {e}")
                 raise
+    if known_dirs is not None:
+        current = remote_dir
+        while current and current != "/" and current not in known_dirs:
+            known_dirs.add(current)
+            current = os.path.dirname(current)
 
 
-def _sftp_cleanup_extra_files(sftp, local_path, remote_path, logger=None):
-    """Remove remote files that don't exist in the local source (full sync)."""
-    local_files = set()
-    for f in local_path.rglob("*"):
-        if f.is_file():
-            local_files.add(str(f.relative_to(local_path)))
+def _sftp_cleanup_extra_files(sftp, local_files, remote_path, logger=None):
+    """Remove remote files whose relative path is not in ``local_files`` (full sync)."""
 
     def _walk_remote(path):
         try:
@@ -320,6 +519,8 @@ def sync_ssh_server(
     exclude_patterns=None,
     manifest=None,
     bandwidth_limit=0,
+    scan=None,
+    checksum=calculate_checksum,
 ):
     """
     Sync a local directory to a remote server via SSH using SFTP, with retry logic.
@@ -336,6 +537,8 @@ def sync_ssh_server(
     - exclude_patterns (list of str, optional): Glob patterns to exclude.
     - manifest (BackupManifest, optional): Manifest to record file operations.
     - bandwidth_limit (int): Bandwidth limit in KB/s (0 = unlimited).
+    - scan (tuple, optional): Shared ``_scan_upload_files`` result; scanned per call if omitted.
+    - checksum (callable): Returns the SHA-256 of a local path for the manifest.
     """
     if logger:
         logger.info(f"Syncing {source_dir} to SSH server: {server} in {mode} mode")
@@ -366,6 +569,8 @@ def sync_ssh_server(
                 exclude_patterns=exclude_patterns,
                 manifest=manifest,
                 bandwidth_limit=bandwidth_limit,
+                scan=scan,
+                checksum=checksum,
             )
         finally:
             sftp.close()
@@ -417,6 +622,10 @@ def sync_ssh_servers_concurrently(
     - manifest (BackupManifest, optional): Manifest to record file operations.
     - bandwidth_limit (int): Bandwidth limit in KB/s (0 = unlimited).
     """
+    # Walk the source once and hash each uploaded file at most once, however
+    # many servers it goes to
+    scan = _scan_upload_files(source_dir, exclude_patterns, logger)
+    checksum = functools.lru_cache(maxsize=None)(calculate_checksum)
 
     def sync_ssh_server_task(server):
         try:
@@ -432,6 +641,8 @@ def sync_ssh_servers_concurrently(
                 exclude_patterns=exclude_patterns,
                 manifest=manifest,
                 bandwidth_limit=bandwidth_limit,
+                scan=scan,
+                checksum=checksum,
             )
         except Exception as e:
             if logger:
@@ -459,6 +670,127 @@ def sync_ssh_servers_concurrently(
         send_email(receiver_emails, "Backup Completed", f"Backup completed for {source_dir}", logger=logger)
 
 
+def _index_hit(file_index, file, backup_file, st, is_link):
+    """
+    Return True if ``file_index`` records ``backup_file`` as a verified copy
+    of the current ``file`` (same size, mtime and inode), and the backup still
+    carries the source's size and mtime (``copy2`` preserves both), i.e.
+    nothing has overwritten it since. No file contents are read.
+
+    ``st`` and ``is_link`` describe ``file`` as returned by ``walk_with_stat``.
+    """
+    if file_index is None or is_link:
+        return False
+    try:
+        dst = backup_file.stat()
+    except OSError:
+        return False
+    if (dst.st_size, dst.st_mtime_ns) != (st.st_size, st.st_mtime_ns):
+        return False
+    return file_index.lookup(str(backup_file), st.st_size, st.st_mtime_ns, st.st_ino) is not None
+
+
+def _refresh_if_unchanged(file_index, file, backup_file, st):
+    """
+    Skip re-copying a file whose metadata changed but whose content did not (e.g. ``touch``).
+
+    Applies when ``file_index`` has an entry for ``backup_file`` that the backup
+    still matches (size and mtime untouched since it was copied) and whose size
+    equals the source's. The source is hashed once; if the checksum is unchanged
+    the backup's metadata and the index entry are refreshed instead of copying.
+
+    Returns:
+    - bool: True if the backup was refreshed in place and no copy is needed.
+    """
+    if file_index is None:
+        return False
+    recorded = file_index.entry(str(backup_file))
+    if recorded is None or recorded[0] != st.st_size:
+        return False
+    size, mtime_ns, _ino, checksum = recorded
+    try:
+        dst = backup_file.stat()
+    except OSError:
+        return False
+    if (dst.st_size, dst.st_mtime_ns) != (size, mtime_ns) or calculate_checksum(str(file)) != checksum:
+        return False
+    _copy_metadata(st, backup_file)
+    file_index.update(str(backup_file), st.st_size, st.st_mtime_ns, checksum, st.st_ino)
+    return True
+
+
+def _copy_and_index(file, backup_file, st, file_index=None, verify=True):
+    """
+    Copy ``file`` to ``backup_file`` with ``_copy_hashed`` and record it in ``file_index``.
+
+    The entry is keyed by the size, mtime and inode from ``st``, the source's stat result.
+    Without ``verify`` the file is copied with ``_fast_copy`` and, having no
+    checksum, is not indexed.
+
+    Returns:
+    - str or None: The SHA-256 checksum of the copied data, or None without ``verify``.
+    """
+    if not verify:
+        _fast_copy(file, backup_file)
+        return None
+    checksum = _copy_hashed(file, backup_file)
+    if file_index is not None:
+        file_index.update(str(backup_file), st.st_size, st.st_mtime_ns, checksum, st.st_ino)
+    return checksum
+
+
+def _backup_changed_file(
+    logger, file, st, is_link, backup_file, label, manifest, file_index, verify, progress
+):
+    """
+    Copy one changed file to one backup destination and record the outcome in ``manifest``.
+
+    Shared by incremental and differential backups; ``label`` names the mode in the log
+    and ``progress`` (_CopyProgress) counts the copy.
+
+    Returns:
+    - bool: True if the file was backed up, False if it failed.
+    """
+    try:
+        backup_file.parent.mkdir(parents=True, exist_ok=True)
+        if is_link:
+            handle_symlink(logger, str(file), str(backup_file))
+            if manifest:
+                manifest.record_copy(str(file), file.stat().st_size if file.exists() else 0)
+            return True
+        if verify and _refresh_if_unchanged(file_index, file, backup_file, st):
+            logger.debug(f"Content unchanged, refreshed metadata of {backup_file}")
+            if manifest:
+                manifest.record_skip(str(file))
+            return True
+        checksum = _copy_and_index(file, backup_file, st, file_index, verify)
+        logger.debug(f"{label} backup of {file} to {backup_file}")
+        progress.add(st.st_size)
+        if manifest:
+            manifest.record_copy(str(file), st.st_size, checksum=checksum)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to backup {file} to {backup_file}: {e}")
+        if manifest:
+            manifest.record_failure(str(file), str(e))
+        return False
+
+
+def _run_file_tasks(task, files, desc, parallel_copies):
+    """
+    Run ``task`` over ``files`` behind a progress bar and return the sum of its results.
+
+    With ``parallel_copies`` > 1 the tasks run on a thread pool; the copy loops
+    spend their time in I/O syscalls that release the GIL, so many files are in
+    flight at once, which is what small-file trees need.
+    """
+    if parallel_copies > 1:
+        with ThreadPoolExecutor(max_workers=parallel_copies) as executor:
+            results = executor.map(task, files)
+            return sum(tqdm(results, total=len(files), desc=desc, unit="files"))
+    return sum(task(entry) for entry in tqdm(files, desc=desc, unit="files"))
+
+
 def perform_full_backup(
     logger,
     source_dir,
@@ -469,6 +801,7 @@ def perform_full_backup(
     exclude_patterns=None,
     manifest=None,
     parallel_copies=1,
+    verify=True,
 ):
     """
     Perform a full backup of the source directory to the backup directories.
@@ -486,6 +819,7 @@ def perform_full_backup(
         exclude_patterns=exclude_patterns,
         manifest=manifest,
         parallel_copies=parallel_copies,
+        verify=verify,
     )
 
 
@@ -498,51 +832,53 @@ def perform_incremental_backup(
     receiver_emails=None,
     exclude_patterns=None,
     manifest=None,
+    file_index=None,
+    verify=True,
+    parallel_copies=1,
 ):
     """
     Perform an incremental backup of the source directory to the backup directories.
+
+    ``file_index`` (FileIndex, optional) lets files already copied by an
+    earlier run, whose timestamp was not advanced, be skipped. ``verify``
+    (bool) checksums each copy; see ``_copy_and_index``. ``parallel_copies``
+    (int) copies that many files at once (default 1 = sequential).
     """
     logger.info(f"Performing incremental backup from {source_dir} since last backup time: {last_backup_time}")
-    files = [
-        f
-        for f in Path(source_dir).rglob("*")
-        if not f.is_dir() and not should_exclude(f.relative_to(source_dir), exclude_patterns)
-    ]
-
-    failed_count = 0
-    for file in tqdm(files, desc="Syncing Incremental Files", unit="files"):
-        file_mtime = os.path.getmtime(file)
+    # One stat per file; its size and mtime are reused for the whole loop
+    files = list(walk_with_stat(source_dir, exclude_patterns, logger))
+
+    def backup_entry(entry):
+        file, st, is_link = entry
+        failures = 0
         for backup_dir in backup_dirs:
             backup_file = Path(backup_dir) / file.relative_to(source_dir)
-            if file_mtime > last_backup_time or not backup_file.exists():
-                try:
-                    logger.info(f"Backing up modified or new file: {file} (modified at {file_mtime})")
-                    backup_file.parent.mkdir(parents=True, exist_ok=True)
-                    if file.is_symlink():
-                        handle_symlink(logger, str(file), str(backup_file))
-                        if manifest:
-                            manifest.record_copy(str(file), file.stat().st_size if file.exists() else 0)
-                        continue
-                    shutil.copy2(file, backup_file)
-                    if verify_backup(file, backup_file):
-                        logger.info(f"Incremental backup of {file} to {backup_file}")
-                        if manifest:
-                            checksum = calculate_checksum(str(file))
-                            manifest.record_copy(str(file), file.stat().st_size, checksum=checksum)
-                    else:
-                        logger.error(f"Checksum verification failed for {file}")
-                        failed_count += 1
-                        if manifest:
-                            manifest.record_failure(str(file), "Checksum verification failed")
-                except Exception as e:
-                    logger.error(f"Failed to backup {file} to {backup_file}: {e}")
-                    failed_count += 1
-                    if manifest:
-                        manifest.record_failure(str(file), str(e))
+            if (st.st_mtime > last_backup_time or not backup_file.exists()) and not _index_hit(
+                file_index, file, backup_file, st, is_link
+            ):
+                logger.debug(f"Backing up modified or new file: {file} (modified at {st.st_mtime})")
+                if not _backup_changed_file(
+                    logger,
+                    file,
+                    st,
+                    is_link,
+                    backup_file,
+                    "Incremental",
+                    manifest,
+                    file_index,
+                    verify,
+                    progress,
+                ):
+                    failures += 1
             else:
-                logger.info(f"Skipping unmodified file: {file} (modified at {file_mtime})")
+                logger.debug(f"Skipping unmodified file: {file} (modified at {st.st_mtime})")
                 if manifest:
                     manifest.record_skip(str(file))
+        return failures
+
+    progress = _CopyProgress(logger, "Incremental backup")
+    failed_count = _run_file_tasks(backup_entry, files, "Syncing Incremental Files", parallel_copies)
+    progress.finish()
     if failed_count:
         logger.warning(f"Incremental backup completed with {failed_count} file error(s).")
 
@@ -563,47 +899,45 @@ def perform_differential_backup(
     receiver_emails=None,
     exclude_patterns=None,
     manifest=None,
+    file_index=None,
+    verify=True,
+    parallel_copies=1,
 ):
     """
     Perform a differential backup of the source directory to the backup directories.
+
+    ``file_index`` (FileIndex, optional) lets files already copied since the
+    last full backup, and unchanged since, be skipped. ``verify`` (bool)
+    checksums each copy; see ``_copy_and_index``. ``parallel_copies`` (int)
+    copies that many files at once (default 1 = sequential).
     """
     logger.info(f"Performing differential backup from {source_dir}")
-    files = [
-        f
-        for f in Path(source_dir).rglob("*")
-        if not f.is_dir() and not should_exclude(f.relative_to(source_dir), exclude_patterns)
-    ]
-    failed_count = 0
-    for file in tqdm(files, desc="Syncing Differential Files", unit="files"):
-        if os.path.getmtime(file) > last_full_backup_time:
-            for backup_dir in backup_dirs:
-                backup_file = Path(backup_dir) / file.relative_to(source_dir)
-                try:
-                    backup_file.parent.mkdir(parents=True, exist_ok=True)
-                    if file.is_symlink():
-                        handle_symlink(logger, str(file), str(backup_file))
-                        if manifest:
-                            manifest.record_copy(str(file), file.stat().st_size if file.exists() else 0)
-                        continue
-                    shutil.copy2(file, backup_file)
-                    if verify_backup(file, backup_file):
-                        logger.info(f"Differential backup of {file} to {backup_file}")
-                        if manifest:
-                            checksum = calculate_checksum(str(file))
-                            manifest.record_copy(str(file), file.stat().st_size, checksum=checksum)
-                    else:
-                        logger.error(f"Checksum verification failed for {file}")
-                        failed_count += 1
-                        if manifest:
-                            manifest.record_failure(str(file), "Checksum verification failed")
-                except Exception as e:
-                    logger.error(f"Failed to backup {file} to {backup_file}: {e}")
-                    failed_count += 1
-                    if manifest:
-                        manifest.record_failure(str(file), str(e))
-        else:
+    # One stat per file; its size and mtime are reused for the whole loop
+    files = list(walk_with_stat(source_dir, exclude_patterns, logger))
+
+    def backup_entry(entry):
+        file, st, is_link = entry
+        if st.st_mtime <= last_full_backup_time:
             if manifest:
                 manifest.record_skip(str(file))
+            return 0
+        failures = 0
+        for backup_dir in backup_dirs:
+            backup_file = Path(backup_dir) / file.relative_to(source_dir)
+            if _index_hit(file_index, file, backup_file, st, is_link):
+                logger.debug(f"Skipping already backed-up file: {file}")
+                if manifest:
+                    manifest.record_skip(str(file))
+                continue
+            if not _backup_changed_file(
+                logger, file, st, is_link, backup_file, "Differential", manifest, file_index, verify, progress
+            ):
+                failures += 1
+        return failures
+
+    progress = _CopyProgress(logger, "Differential backup")
+    failed_count = _run_file_tasks(backup_entry, files, "Syncing Differential Files", parallel_copies)
+    progress.finish()
     if failed_count:
         logger.warning(f"Differential backup completed with {failed_count} file error(s).")
 
@@ -7,24 +7,42 @@ and input validation.
 """
 
 import fnmatch
+import functools
 import hashlib
 import json
 import os
 import re
 import secrets
+import stat
 import string
 import subprocess
 import time
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-import keyring
-
 # Define file paths for storing timestamps of backups (absolute, relative to project root)
 _PROJECT_ROOT = Path(__file__).parent.parent
 TIMESTAMP_FILE = _PROJECT_ROOT / "BackupTimestamp" / "backup_timestamp.json"
 FULL_BACKUP_TIMESTAMP_FILE = _PROJECT_ROOT / "BackupTimestamp" / "full_backup_timestamp.json"
 
+# Read size for checksums. Large reads into one reused buffer keep the loop in
+# C; hashlib also releases the GIL on big updates, so threads hash in parallel.
+_CHECKSUM_CHUNK = 1024 * 1024
+
+_SIZE_UNITS = (("B", 1), ("KB", 1 << 10), ("MB", 1 << 20), ("GB", 1 << 30), ("TB", 1 << 40))
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
+@functools.lru_cache(maxsize=32)
+def _exclude_regex(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """
+    Compile glob patterns into one regex alternation, so a path is tested
+    against all of them in a single C-level match. Cached per pattern tuple.
+    """
+    parts = [fnmatch.translate(p.strip()) for p in patterns if p.strip()]
+    return re.compile("|".join(parts)) if parts else None
+
 
 def should_exclude(file_path: os.PathLike | str, patterns: Iterable[str] | None) -> bool:
     """
@@ -39,20 +57,12 @@ def should_exclude(file_path: os.PathLike | str, patterns: Iterable[str] | None)
     """
     if not patterns:
         return False
+    regex = _exclude_regex(tuple(patterns))
+    if regex is None:
+        return False
     file_path = Path(file_path)
-    filename = file_path.name
-    relative_str = str(file_path)
-    for pattern in patterns:
-        pattern = pattern.strip()
-        if not pattern:
-            continue
-        # Match against filename
-        if fnmatch.fnmatch(filename, pattern):
-            return True
-        # Match against relative path
-        if fnmatch.fnmatch(relative_str, pattern):
-            return True
-    return False
+    # Match against the filename, then the relative path
+    return regex.match(file_path.name) is not None or regex.match(str(file_path)) is not None
 
 
 def run_hook(logger, command: str | None, hook_name: str) -> bool:
@@ -187,10 +197,12 @@ def calculate_checksum(file_path: os.PathLike | str, logger=None) -> str | None:
     - str: The SHA-256 checksum of the file, or None if an error occurs.
     """
     hash_sha256 = hashlib.sha256()
+    buf = bytearray(_CHECKSUM_CHUNK)
+    view = memoryview(buf)
     try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
+        with open(file_path, "rb", buffering=0) as f:
+            while n := f.readinto(buf):
+                hash_sha256.update(view[:n])
     except OSError as e:
         if logger:
             logger.error(f"Failed to generate checksum for {file_path}: {e}")
@@ -282,6 +294,68 @@ def list_files_in_directory(directory: os.PathLike | str) -> list[Path]:
     return [f for f in Path(directory).rglob("*") if f.is_file()]
 
 
+def walk_with_stat(
+    directory: os.PathLike | str, exclude_patterns: Iterable[str] | None = None, logger=None
+) -> Iterator[tuple[Path, os.stat_result, bool]]:
+    """
+    Yield every non-directory entry under a directory together with its stat result.
+
+    Walks with ``os.scandir``, so file types come from the directory listing
+    and each entry costs a single ``stat`` whose size and mtime callers can
+    reuse instead of stat'ing the file again. Symlinked directories are
+    neither followed nor yielded; other symlinks are stat'ed through to
+    their target (or as the link itself when dangling). Directories that
+    cannot be read and entries that vanish mid-walk are skipped.
+
+    Parameters:
+    - directory (str or Path): Root directory to walk.
+    - exclude_patterns (list of str, optional): Glob patterns, matched against the
+      path relative to ``directory``, whose files are skipped.
+    - logger (logging.Logger, optional): Logger for unreadable directories.
+
+    Returns:
+    - Iterator of (Path, os.stat_result, bool): File path, its stat result, and
+      whether the entry is a symlink.
+    """
+    root = Path(directory)
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError as e:
+            if logger:
+                logger.warning(f"Skipping unreadable directory {current}: {e}")
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.S_ISDIR(st.st_mode):
+                    continue
+                path = Path(entry.path)
+                if exclude_patterns and should_exclude(path.relative_to(root), exclude_patterns):
+                    continue
+                yield path, st, entry.is_symlink()
+
+
+def human_size(num_bytes: int) -> str:
+    """Format a byte count as ``"123 B"`` or ``"1.23 MB"`` (binary multiples)."""
+    index = min(max(num_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    suffix, divisor = _SIZE_UNITS[index]
+    if index == 0:
+        return f"{num_bytes} B"
+    return f"{num_bytes / divisor:.2f} {suffix}"
+
+
 def is_valid_email(email: str) -> bool:
     """
     Check if the provided email address is valid.
@@ -292,8 +366,7 @@ def is_valid_email(email: str) -> bool:
     Returns:
     - bool: True if the email is valid, False otherwise.
     """
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return re.match(email_pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def get_password_by_timestamp(timestamp: str, logger) -> str | None:
@@ -307,6 +380,8 @@ def get_password_by_timestamp(timestamp: str, logger) -> str | None:
     Returns:
         str: The password if found, or None if not found.
     """
+    import keyring
+
     try:
         service_name = "compression_service"
         password = keyring.get_password(service_name, timestamp)
@@ -330,6 +405,8 @@ def clear_keyring(service_name: str = "compression_service", logger=None) -> Non
         service_name (str): The name of the service for which to clear stored credentials.
         logger (logging.Logger, optional): Logger instance to log messages.
     """
+    import keyring
+
     try:
         credentials = keyring.get_credential(service_name, None)
 
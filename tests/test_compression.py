@@ -0,0 +1,41 @@
+"""Tests for ZIP archive creation."""
+
+from __future__ import annotations
+
+import os
+import zipfile
+
+from src.compression import _write_zip
+
+
+def _make_tree(root):
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_text("alpha")
+    (root / "sub" / "a.txt").write_text("nested")
+    os.symlink("missing", root / "dangling")
+    os.symlink("sub", root / "dirlink")
+    os.mkfifo(root / "fifo")
+
+
+class TestWriteZip:
+    def test_skips_dangling_links_fifos_and_linked_dirs(self, tmp_dir):
+        src = tmp_dir / "src"
+        _make_tree(src)
+        archive = tmp_dir / "out.zip"
+
+        _write_zip(str(src), str(archive))
+
+        with zipfile.ZipFile(archive) as zf:
+            assert sorted(zf.namelist()) == ["a.txt", "sub/", "sub/a.txt"]
+            assert zf.read("sub/a.txt") == b"nested"
+
+    def test_password_archive_keeps_directories(self, tmp_dir):
+        src = tmp_dir / "src"
+        _make_tree(src)
+        archive = tmp_dir / "out.zip"
+
+        _write_zip(str(src), str(archive), password="secret")
+
+        with zipfile.ZipFile(archive) as zf:
+            assert sorted(zf.namelist()) == ["a.txt", "sub/a.txt"]
+            assert zf.read("sub/a.txt", pwd=b"secret") == b"nested"
@@ -6,7 +6,14 @@ import os
 
 import pytest
 
-from src.config import _resolve_all_env_vars, normalize_none, resolve_env_vars
+from src.config import (
+    _resolve_all_env_vars,
+    is_valid_time_format,
+    load_config,
+    normalize_none,
+    parse_time_of_day,
+    resolve_env_vars,
+)
 
 
 class TestEnvVarResolution:
@@ -55,6 +62,12 @@ password = ${TEST_BH_PASS}
         finally:
             del os.environ["TEST_BH_PASS"]
 
+    def test_escaped_percent_is_interpolated(self, logger, tmp_dir):
+        config_path = tmp_dir / "config.ini"
+        config_path.write_text("[SSH]\nusername = 100%%user\n")
+        config = load_config(logger, str(config_path))
+        assert config.get("SSH", "username") == "100%user"
+
 
 class TestNormalizeNone:
     def test_none_value(self):
@@ -71,3 +84,18 @@ class TestNormalizeNone:
     def test_valid_value(self):
         assert normalize_none("hello") == "hello"
         assert normalize_none("  hello  ") == "hello"
+
+
+class TestParseTimeOfDay:
+    def test_valid_times(self):
+        assert parse_time_of_day("00:00") == 0
+        assert parse_time_of_day("09:05") == 545
+        assert parse_time_of_day("9:5") == 545
+        assert parse_time_of_day("23:59") == 1439
+
+    @pytest.mark.parametrize(
+        "value", ["24:00", "12:60", "12", "12:", ":30", "1:2:3", "ab:cd", " 9:00", "+9:00", "123:00"]
+    )
+    def test_invalid_times(self, value):
+        assert parse_time_of_day(value) is None
+        assert is_valid_time_format(value) is False
@@ -0,0 +1,65 @@
+"""Tests for the persistent backup file index."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from src.fileindex import FileIndex
+
+
+class TestFileIndex:
+    def test_lookup_hit_and_invalidation(self, tmp_dir):
+        with FileIndex(tmp_dir / "index.db") as index:
+            index.update("/backup/a.txt", 10, 1_000, "abc")
+
+            assert index.lookup("/backup/a.txt", 10, 1_000) == "abc"
+            assert index.lookup("/backup/a.txt", 11, 1_000) is None
+            assert index.lookup("/backup/a.txt", 10, 2_000) is None
+            assert index.lookup("/backup/b.txt", 10, 1_000) is None
+
+    def test_entries_persist_across_reopen(self, tmp_dir):
+        db_path = tmp_dir / "cache" / "index.db"
+        with FileIndex(db_path) as index:
+            for i in range(1500):
+                index.update(f"/backup/{i}", i, i, f"sum{i}")
+
+        with FileIndex(db_path) as index:
+            assert index.lookup("/backup/0", 0, 0) == "sum0"
+            assert index.lookup("/backup/1499", 1499, 1499) == "sum1499"
+
+    def test_update_replaces_entry(self, tmp_dir):
+        with FileIndex(tmp_dir / "index.db") as index:
+            index.update("/backup/a.txt", 10, 1_000, "old")
+            index.update("/backup/a.txt", 12, 2_000, "new")
+
+            assert index.lookup("/backup/a.txt", 10, 1_000) is None
+            assert index.lookup("/backup/a.txt", 12, 2_000) == "new"
+
+    def test_inode_must_match(self, tmp_dir):
+        with FileIndex(tmp_dir / "index.db") as index:
+            index.update("/backup/a.txt", 10, 1_000, "abc", ino=42)
+
+            assert index.lookup("/backup/a.txt", 10, 1_000, 42) == "abc"
+            assert index.lookup("/backup/a.txt", 10, 1_000, 43) is None
+
+    def test_entry_returns_recorded_metadata(self, tmp_dir):
+        with FileIndex(tmp_dir / "index.db") as index:
+            index.update("/backup/a.txt", 10, 1_000, "abc", ino=42)
+
+            assert index.entry("/backup/a.txt") == (10, 1_000, 42, "abc")
+            assert index.entry("/backup/missing.txt") is None
+
+    def test_old_schema_is_rebuilt(self, tmp_dir):
+        db_path = tmp_dir / "index.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, checksum TEXT)"
+        )
+        conn.execute("INSERT INTO files VALUES ('/backup/a.txt', 10, 1000, 'abc')")
+        conn.commit()
+        conn.close()
+
+        with FileIndex(db_path) as index:
+            assert index.entry("/backup/a.txt") is None
+            index.update("/backup/a.txt", 10, 1_000, "abc")
+            assert index.lookup("/backup/a.txt", 10, 1_000) == "abc"
@@ -0,0 +1,90 @@
+"""Tests for backup manifest writing and loading."""
+
+from __future__ import annotations
+
+import json
+
+from src.manifest import (
+    SUMMARY_SUFFIX,
+    BackupManifest,
+    load_latest_manifest,
+    load_latest_manifest_summary,
+    load_manifests_up_to,
+    replicate_manifest,
+)
+
+
+class TestManifestSummary:
+    def _save(self, tmp_dir):
+        manifest = BackupManifest(mode="full")
+        manifest.record_copy("/src/a.txt", 10)
+        manifest.record_copy("/src/b.txt", 5)
+        manifest.record_skip("/src/c.txt")
+        manifest.record_failure("/src/d.txt", "permission denied")
+        return manifest.save(tmp_dir)
+
+    def test_save_writes_summary_sidecar(self, tmp_dir):
+        manifest_path = self._save(tmp_dir)
+        summary_path = manifest_path.with_name(manifest_path.stem + SUMMARY_SUFFIX)
+        summary = json.loads(summary_path.read_text())
+
+        assert summary["files_copied"] == 2
+        assert summary["files_skipped"] == 1
+        assert summary["files_failed"] == 1
+        assert summary["total_bytes"] == 15
+        assert "copied" not in summary
+
+    def test_loaders_ignore_summary_sidecar(self, tmp_dir):
+        self._save(tmp_dir)
+
+        manifest = load_latest_manifest(tmp_dir)
+        assert len(manifest["copied"]) == 2
+        assert len(load_manifests_up_to(tmp_dir, "99999999_999999")) == 1
+
+    def test_summary_falls_back_to_full_manifest(self, tmp_dir):
+        manifest_path = self._save(tmp_dir)
+        manifest_path.with_name(manifest_path.stem + SUMMARY_SUFFIX).unlink()
+
+        summary = load_latest_manifest_summary(tmp_dir)
+        assert summary["total_bytes"] == 15
+
+    def test_summary_none_without_manifests(self, tmp_dir):
+        assert load_latest_manifest_summary(tmp_dir) is None
+
+    def test_full_manifest_lists_every_record(self, tmp_dir):
+        manifest_path = self._save(tmp_dir)
+        data = json.loads(manifest_path.read_text())
+
+        assert data["copied"] == [{"path": "/src/a.txt", "size": 10}, {"path": "/src/b.txt", "size": 5}]
+        assert data["skipped"] == [{"path": "/src/c.txt"}]
+        assert data["failed"] == [{"path": "/src/d.txt", "reason": "permission denied"}]
+
+    def test_save_twice_includes_later_records(self, tmp_dir):
+        manifest = BackupManifest(mode="full")
+        manifest.record_copy("/src/a.txt", 10)
+        manifest.save(tmp_dir / "first")
+        manifest.record_copy("/src/b.txt", 5)
+        data = json.loads(manifest.save(tmp_dir / "second").read_text())
+
+        assert [entry["path"] for entry in data["copied"]] == ["/src/a.txt", "/src/b.txt"]
+        assert data["skipped"] == []
+
+    def test_close_releases_spools(self, tmp_dir):
+        with BackupManifest(mode="full") as manifest:
+            manifest.record_copy("/src/a.txt", 10)
+            manifest.save(tmp_dir)
+        assert all(spool.closed for spool in manifest._spools.values())
+
+
+class TestReplicateManifest:
+    def test_replica_matches_and_is_loadable(self, tmp_dir):
+        manifest = BackupManifest(mode="incremental")
+        manifest.record_copy("/src/a.txt", 7)
+        saved = manifest.save(tmp_dir / "first")
+
+        replica = replicate_manifest(saved, tmp_dir / "second")
+
+        assert replica.name == saved.name
+        assert replica.read_bytes() == saved.read_bytes()
+        assert load_latest_manifest(tmp_dir / "second")["files_copied"] == 1
+        assert load_latest_manifest_summary(tmp_dir / "second")["mode"] == "incremental"
@@ -1,8 +1,11 @@
-"""Tests for remote-path parsing used by the restore pipeline."""
+"""Tests for the restore pipeline: remote-path parsing and archive extraction."""
 
 from __future__ import annotations
 
-from src.restore import _is_s3_path, _is_ssh_path, _parse_s3_path, _parse_ssh_path
+import io
+import tarfile
+
+from src.restore import _is_s3_path, _is_ssh_path, _parse_s3_path, _parse_ssh_path, restore_backup
 
 
 class TestRemoteRestore:
@@ -50,3 +53,57 @@ class TestRemoteRestore:
         bucket, prefix = _parse_s3_path("s3://bucket/prefix")
         assert bucket == "bucket"
         assert prefix == "prefix"
+
+
+class TestTarRestore:
+    def test_restores_tar_gz(self, tmp_dir, logger):
+        src = tmp_dir / "src"
+        (src / "sub").mkdir(parents=True)
+        (src / "a.txt").write_text("alpha")
+        (src / "sub" / "b.txt").write_text("beta")
+        archive = tmp_dir / "backup_20260101_000000.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(src / "a.txt", arcname="a.txt")
+            tar.add(src / "sub", arcname="sub")
+
+        dest = tmp_dir / "restored"
+        assert restore_backup(logger, str(archive), str(dest)) is True
+        assert (dest / "a.txt").read_text() == "alpha"
+        assert (dest / "sub" / "b.txt").read_text() == "beta"
+
+    def test_restores_without_data_filter(self, tmp_dir, logger, monkeypatch):
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+        src = tmp_dir / "src"
+        (src / "sub").mkdir(parents=True)
+        (src / "sub" / "b.txt").write_text("beta")
+        (src / "link").symlink_to("sub/b.txt")
+        archive = tmp_dir / "backup_20260101_000000.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(src / "sub", arcname="sub")
+            tar.add(src / "link", arcname="link")
+
+        dest = tmp_dir / "restored"
+        assert restore_backup(logger, str(archive), str(dest)) is True
+        assert (dest / "link").read_text() == "beta"
+
+    def test_rejects_escaping_members_without_data_filter(self, tmp_dir, logger, monkeypatch):
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+        outside = tmp_dir / "evil.txt"
+        members = [
+            ("../evil.txt", tarfile.REGTYPE, ""),
+            (str(outside), tarfile.REGTYPE, ""),
+            ("out", tarfile.SYMTYPE, "../.."),
+            ("fifo", tarfile.FIFOTYPE, ""),
+        ]
+        for name, kind, linkname in members:
+            archive = tmp_dir / "backup_20260101_000000.tar.gz"
+            with tarfile.open(archive, "w:gz") as tar:
+                info = tarfile.TarInfo(name)
+                info.type = kind
+                info.linkname = linkname
+                tar.addfile(info, io.BytesIO(b"") if kind == tarfile.REGTYPE else None)
+
+            dest = tmp_dir / "restored"
+            assert restore_backup(logger, str(archive), str(dest)) is False
+            assert not outside.exists()
+            assert not (dest / "out").is_symlink()
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import string
+from unittest import mock
 
-from src.utils import generate_otp, is_valid_email, should_exclude
+from src.utils import generate_otp, human_size, is_valid_email, should_exclude, walk_with_stat
 
 
 class TestGenerateOTP:
@@ -51,3 +53,72 @@ class TestShouldExclude:
 
     def test_no_match(self):
         assert should_exclude("data.txt", ["*.log", "*.tmp"]) is False
+
+    def test_any_of_several_patterns(self):
+        patterns = [" *.log ", "", "cache/*", "build-?.tar"]
+        assert should_exclude("logs/app.log", patterns) is True
+        assert should_exclude("cache/blob.bin", patterns) is True
+        assert should_exclude("dist/build-1.tar", patterns) is True
+        assert should_exclude("dist/build-10.tar", patterns) is False
+
+    def test_blank_patterns_only(self):
+        assert should_exclude("app.log", ["", "  "]) is False
+
+
+class TestWalkWithStat:
+    def test_yields_files_with_stat(self, tmp_dir):
+        (tmp_dir / "sub").mkdir()
+        (tmp_dir / "a.txt").write_text("abc")
+        (tmp_dir / "sub" / "b.txt").write_text("hello")
+
+        found = {
+            p.relative_to(tmp_dir).as_posix(): (st.st_size, is_link)
+            for p, st, is_link in walk_with_stat(tmp_dir)
+        }
+        assert found == {"a.txt": (3, False), "sub/b.txt": (5, False)}
+
+    def test_excludes_patterns(self, tmp_dir):
+        (tmp_dir / "keep.txt").write_text("x")
+        (tmp_dir / "skip.log").write_text("x")
+
+        names = [p.name for p, _st, _link in walk_with_stat(tmp_dir, ["*.log"])]
+        assert names == ["keep.txt"]
+
+    def test_symlinks(self, tmp_dir):
+        (tmp_dir / "sub").mkdir()
+        (tmp_dir / "a.txt").write_text("abc")
+        os.symlink("a.txt", tmp_dir / "link")
+        os.symlink("missing", tmp_dir / "dangling")
+        os.symlink("sub", tmp_dir / "dirlink")
+
+        found = {p.name: (st.st_size, is_link) for p, st, is_link in walk_with_stat(tmp_dir)}
+        assert found["link"] == (3, True)
+        assert found["dangling"][1] is True
+        assert "dirlink" not in found
+
+    def test_skips_unreadable_directory(self, tmp_dir, monkeypatch):
+        (tmp_dir / "locked").mkdir()
+        (tmp_dir / "locked" / "secret.txt").write_text("x")
+        (tmp_dir / "a.txt").write_text("abc")
+        locked = str(tmp_dir / "locked")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if path == locked:
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        logger = mock.Mock()
+        names = [p.name for p, _st, _link in walk_with_stat(tmp_dir, logger=logger)]
+        assert names == ["a.txt"]
+        logger.warning.assert_called_once()
+
+
+class TestHumanSize:
+    def test_bytes(self):
+        assert human_size(512) == "512 B"
+
+    def test_scales_units(self):
+        assert human_size(1536) == "1.50 KB"
+        assert human_size(3 * 1024**3) == "3.00 GB"